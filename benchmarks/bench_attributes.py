@@ -0,0 +1,38 @@
+"""
+Attribute access in loops: module functions and methods of built-in types.
+
+Run from the repository root: python -m benchmarks.bench_attributes
+"""
+from .common import load_scope, run_code, report
+
+SETUP = '''
+(import math)
+(import functools)
+
+(def roots [n]
+    (functools::reduce
+        (lambda [acc i] (+ acc (math::sqrt i)))
+        (range n)
+        0))
+
+(def shout [words]
+    (functools::reduce
+        (lambda [acc word] (+ acc (len (word::upper))))
+        words
+        0))
+
+(let words (* ['spsp'] 5000))
+'''
+
+
+def main() -> None:
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    report('math::sqrt x 5000', '(roots 5000)', scope)
+    report('str::upper x 5000', '(shout words)', scope)
+    report('math::pi x 5000', '(for i (range 5000) math::pi)', scope)
+
+
+if __name__ == '__main__':
+    main()
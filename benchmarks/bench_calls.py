@@ -0,0 +1,46 @@
+"""
+Call-heavy programs: recursive calls with small fixed arities, closure creation and transducer pipelines.
+
+Run from the repository root: python -m benchmarks.bench_calls
+"""
+from .common import load_scope, run_code, report
+
+SETUP = '''
+(def fib [n]
+    (if (<= n 2)
+        1
+        (+ (fib (- n 1)) (fib (- n 2)))))
+
+(def ackermann [m n]
+    (if (= m 0)
+        (+ n 1)
+        (if (= n 0)
+            (ackermann (- m 1) 1)
+            (ackermann (- m 1) (ackermann m (- n 1))))))
+
+(let xf
+    (compose
+        (filter-transducer even?)
+        (map-transducer inc)
+        (map-transducer double)))
+
+(let +* (make-variadic + 0))
+
+(def make-adder [n]
+    (lambda [x] (+ x n)))
+'''
+
+
+def main() -> None:
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    report('fib 20', '(fib 20)', scope)
+    report('ackermann 2 3', '(ackermann 2 3)', scope)
+    report('closures created 10000', '(list (map make-adder (range 10000)))', scope)
+    report('transduce sum of 10000', '(transduce xf +* (range 10000))', scope)
+    report('transduce sequence of 2000', '(sequence xf (range 2000))', scope)
+
+
+if __name__ == '__main__':
+    main()
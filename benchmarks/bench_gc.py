@@ -0,0 +1,90 @@
+"""
+Cyclic garbage collection: collections run and objects the collector reclaims per million function calls.
+Scopes released by reference counting alone never reach the collector.
+
+Run from the repository root: python -m benchmarks.bench_gc
+"""
+import gc
+import io
+import sys
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.tokenizer import Tokenizer
+from .common import load_scope, run_code
+
+SETUP = '''
+(def fib [n]
+    (if (<= n 2)
+        1
+        (+ (fib (- n 1)) (fib (- n 2)))))
+
+(def identity [x] x)
+
+(def local-closure [n]
+    (do
+        (let square (lambda [x] (* x x)))
+        (square n)))
+
+(def local-recursion [n]
+    (do
+        (let step (lambda [i] (if (= i 0) 0 (+ 1 (step (- i 1))))))
+        (step n)))
+
+(def macro-in-body [n]
+    (do
+        (let square (lambda [x] (* x x)))
+        (when (> n 0) (square n))))
+'''
+
+N = 20000
+
+# Programs and the number of spsp function calls they make
+PROGRAMS = (
+    ('(fib 20)', 2 * 6765 - 1),
+    (f'(list (map identity (range {N})))', N),
+    (f'(list (map local-closure (range {N})))', 2 * N),
+    (f'(list (map (lambda [_] (local-recursion 10)) (range {N // 10})))', 13 * (N // 10)),
+    (f'(list (map macro-in-body (range {N})))', 2 * N - 1),
+)
+
+
+def collector_stats(code: str, scope) -> tuple[int, int]:
+    """
+    Number of collections run and objects collected while evaluating `code`.
+    """
+    with io.StringIO(code) as input_stream:
+        expression, = parse(Tokenizer(input_stream))
+
+    evaluate(expression, scope)
+
+    stats = []
+
+    def callback(phase: str, info: dict) -> None:
+        if phase == 'stop':
+            stats.append(info['collected'])
+
+    gc.collect()
+    gc.callbacks.append(callback)
+    try:
+        evaluate(expression, scope)
+    finally:
+        gc.callbacks.remove(callback)
+
+    return len(stats), sum(stats)
+
+
+def main() -> None:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    print(f'{"":<70} {"collections":>12} {"collected":>12}  per million calls')
+    for code, calls in PROGRAMS:
+        collections, collected = collector_stats(code, scope)
+        print(f'{code:<70} {collections * 1e6 / calls:12.0f} {collected * 1e6 / calls:12.0f}')
+
+
+if __name__ == '__main__':
+    main()
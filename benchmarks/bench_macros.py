@@ -0,0 +1,33 @@
+"""
+Hot functions using std-lib macros (when, and, or, try, lazy).
+
+Run from the repository root: python -m benchmarks.bench_macros
+"""
+from .common import load_scope, run_code, report
+
+SETUP = '''
+(def classify [x]
+    (when (and (> x 0) (< x 1000) True)
+        (or None (% x 7) x)))
+
+(def safe-div [a b]
+    (try
+        (/ a b)
+        (except _ 0)))
+
+(def deferred [x]
+    (lazy (+ x 1)))
+'''
+
+
+def main() -> None:
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    report('when/and/or x 3000', '(for i (range 3000) (classify i))', scope)
+    report('try x 3000', '(for i (range 3000) (safe-div i (% i 3)))', scope)
+    report('lazy x 3000', '(for i (range 3000) (+ 0 (deferred i)))', scope)
+
+
+if __name__ == '__main__':
+    main()
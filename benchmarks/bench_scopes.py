@@ -0,0 +1,120 @@
+"""
+Scope allocation: memory taken by scopes and bindings, memory held by the scopes of nested function calls
+and by closures, and the time of a call.
+
+Run from the repository root: python -m benchmarks.bench_scopes
+"""
+import io
+import sys
+import tracemalloc
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+from .common import load_scope, run_code, report
+
+SETUP = '''
+(def depth [n]
+    (if (= n 0)
+        0
+        (+ 1 (depth (- n 1)))))
+
+(def identity [x] x)
+
+(def make-adder [n]
+    (do
+        (let temporary (list (range 100)))
+        (lambda [x] (+ x n))))
+'''
+
+# Deep enough for free lists of dicts and lists to run out
+DEPTH = 500
+
+
+def bytes_per_call(code: str, calls: int, scope) -> float:
+    """
+    Peak memory allocated while evaluating `code`, which keeps `calls` calls active at once, per call.
+    """
+    with io.StringIO(code) as input_stream:
+        expression, = parse(Tokenizer(input_stream))
+
+    evaluate(expression, scope)
+
+    tracemalloc.start()
+    try:
+        evaluate(expression, scope)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak / calls
+
+
+def bytes_retained(code: str, count: int, scope) -> float:
+    """
+    Memory still allocated after evaluating `code`, which creates `count` objects, per object.
+    """
+    with io.StringIO(code) as input_stream:
+        expression, = parse(Tokenizer(input_stream))
+
+    evaluate(expression, scope)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        result = evaluate(expression, scope)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return (after - before) / count
+
+
+def bytes_per_scope(scope: Scope, count: int = 10000) -> float:
+    tracemalloc.start()
+    try:
+        scopes = [None] * count
+        before, _ = tracemalloc.get_traced_memory()
+        for i in range(count):
+            scopes[i] = scope.derive()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / count
+
+
+def bytes_per_binding(scope: Scope, count: int = 10000) -> float:
+    names = [f'name-{i}' for i in range(count)]
+    derived = scope.derive()
+    derived.let(names[0], 0)
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        for name in names[1:]:
+            derived.let(name, 0)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return (after - before) / (count - 1)
+
+
+def main() -> None:
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), DEPTH * 50))
+
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    print(f'{"bytes per scope":<40} {bytes_per_scope(scope):10.0f} B')
+    print(f'{"bytes per binding":<40} {bytes_per_binding(scope):10.0f} B')
+    print(f'{"bytes per active call":<40} {bytes_per_call(f"(depth {DEPTH})", DEPTH, scope):10.0f} B')
+    print(f'{"bytes retained per closure":<40} {bytes_retained("(list (map make-adder (range 1000)))", 1000, scope):10.0f} B')
+    report('1000 calls of (identity 1)', '(list (map identity (range 1000)))', scope)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Sequences: time and peak memory of producing and consuming large lazy sequences and vectors.
+
+Run from the repository root: python -m benchmarks.bench_sequences
+"""
+import io
+import time
+import tracemalloc
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.tokenizer import Tokenizer
+from .common import load_scope, run_code
+
+SETUP = '''
+(def inc [x] (+ x 1))
+(import-from functools [reduce])
+'''
+
+N = 1_000_000
+
+PROGRAMS = (
+    f'(sum (range {N}))',
+    f'(sum (list (range {N})))',
+    f'(sum (map inc (range {N})))',
+    f'(sum (take {N} (iterate inc 0)))',
+    f'(sum (iter (take {N} (iterate inc 0))))',
+    f'(realize (take 3 (drop {N} (iterate inc 0))))',
+    f'(len (realize (lazy-seq (range {N}))))',
+    f'(len (reduce append (range {N}) []))',
+    f'(len (reduce prepend (range {N}) []))',
+    f'(len (sequence (map-transducer inc) (range {N})))',
+    f'(len (reduce (lambda [acc _] (rest acc)) (range {N}) (vector (range {N}))))',
+)
+
+
+def measure(code: str, scope) -> tuple[float, int]:
+    """
+    Time in seconds and peak memory in bytes allocated while evaluating `code`.
+    """
+    with io.StringIO(code) as input_stream:
+        expression, = parse(Tokenizer(input_stream))
+
+    # Tracing allocations slows evaluation down, the time is measured separately
+    start = time.perf_counter()
+    evaluate(expression, scope)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        evaluate(expression, scope)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def main() -> None:
+    scope = load_scope()
+    run_code(SETUP, scope)
+
+    print(f'{"":<60} {"time, ms":>10} {"peak, MB":>10}')
+    for code in PROGRAMS:
+        elapsed, peak = measure(code, scope)
+        print(f'{code:<60} {elapsed * 1000:10.1f} {peak / 1e6:10.2f}')
+
+
+if __name__ == '__main__':
+    main()
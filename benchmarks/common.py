@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+import pathlib
+import timeit
+from typing import Any, Iterable
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+__all__ = [
+    'ROOT',
+    'load_scope',
+    'run_code',
+    'report'
+]
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+LIBRARIES = ('std-lib.spsp', 'numeric.spsp', 'transducers.spsp')
+
+
+def load_scope(libraries: Iterable[str] = LIBRARIES) -> Scope:
+    scope = Scope.empty()
+    for library in libraries:
+        with open(ROOT / library, mode='rt', encoding='utf-8') as file:
+            for expression in parse(Tokenizer(file)):
+                evaluate(expression, scope)
+    return scope
+
+
+def run_code(code: str, scope: Scope) -> Any:
+    result = None
+    with io.StringIO(code) as input_stream:
+        for expression in parse(Tokenizer(input_stream)):
+            result = evaluate(expression, scope)
+    return result
+
+
+def report(name: str, code: str, scope: Scope, number: int = 5, repeat: int = 3) -> float:
+    """
+    Print and return the best time in seconds of running `code` once.
+    """
+    with io.StringIO(code) as input_stream:
+        expressions = list(parse(Tokenizer(input_stream)))
+
+    def run() -> None:
+        for expression in expressions:
+            evaluate(expression, scope)
+
+    best = min(timeit.repeat(run, number=number, repeat=repeat)) / number
+    print(f'{name:<40} {best * 1000:10.3f} ms')
+    return best
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
 from builtins import *
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
 
 from .special_symbols import SpecialSymbols
 
+if TYPE_CHECKING:
+    from .scope import FrameLayout
+
 __all__ = [
     'AnyExpression',
     'List',
     'Symbolic',
     'Literal',
     'Identifier',
+    'LocalIdentifier',
+    'Folded',
     'AttributeAccess'
 ]
 
@@ -22,6 +27,10 @@ NOT_FOUND = object()
 class AnyExpression:
     position: int
 
+    # Per-node storage for data derived from the node once and reused on every evaluation.
+    # Nodes compare by value, so this cannot be a side table keyed by the node itself.
+    _cache: dict[str, Any] = field(default_factory=dict, init=False, compare=False, hash=False, repr=False)
+
     @property
     def code(self) -> str:
         raise NotImplementedError()
@@ -82,6 +91,20 @@ class Identifier(AnyExpression):
         return self.name
 
 
+@dataclass(frozen=True)
+class LocalIdentifier(Identifier):
+    """
+    Identifier resolved to a slot of an enclosing function frame.
+
+    `depth` is the number of scopes between the scope the identifier is evaluated in
+    and the frame with layout `frame`. Evaluation falls back to name lookup
+    whenever the address does not hold at runtime.
+    """
+    depth: int
+    slot: int
+    frame: FrameLayout
+
+
 @dataclass(frozen=True)
 class AttributeAccess(AnyExpression):
     name: str
@@ -90,3 +113,20 @@ class AttributeAccess(AnyExpression):
     @property
     def code(self) -> str:
         return SpecialSymbols.QualifierSeparator.join((self.name,) + self.attributes)
+
+
+@dataclass(frozen=True)
+class Folded(AnyExpression):
+    """
+    Value of `original` computed ahead of evaluation.
+
+    The value only holds while each name in `dependencies` refers to the same object as when
+    it was computed. Otherwise, `original` is evaluated.
+    """
+    value: Any
+    original: AnyExpression
+    dependencies: tuple[tuple[str, Any], ...]
+
+    @property
+    def code(self) -> str:
+        return str(self.value)
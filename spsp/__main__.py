@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import io
 import sys
+from enum import Enum, auto
 from typing import Collection, TextIO
 
+from . import Expression
+
 from .tokenizer import Tokenizer
+from .constant_folding import fold_constants
 from .errors import SpspEvaluationError, SpspSyntaxError
 from .evaluation import evaluate
-from .parser import parse
+from .expansion import expand
+from .keywords import Keyword
+from .parser import parse, unparse
 from .scope import Scope
 from .special_symbols import SpecialSymbols
 
@@ -95,11 +101,43 @@ def run_repl(scope: Scope) -> None:
                 print_error_message(input_stream, '<stdin>', e, stream=sys.stdout)
 
 
-def run_files(file_names: Collection[str], scope: Scope) -> bool:
+class RunMode(Enum):
+    Evaluate = auto()
+    ExpandAndEvaluate = auto()
+    ExpandOnly = auto()
+
+
+RUN_MODE_OPTIONS = {
+    '--expand': RunMode.ExpandAndEvaluate,
+    '--expand-only': RunMode.ExpandOnly
+}
+
+# In expand-only mode, only definitions are evaluated: later forms may use the macros and values they define
+DEFINITIONS = (Keyword.Let, Keyword.Const, Keyword.Rebind, Keyword.Del)
+
+
+def is_definition(expression: Expression.AnyExpression) -> bool:
+    return isinstance(expression, Expression.Symbolic) \
+        and isinstance(expression.operation, Expression.Identifier) \
+        and expression.operation.name in DEFINITIONS
+
+
+def run_files(file_names: Collection[str], scope: Scope, mode: RunMode = RunMode.Evaluate) -> bool:
     for file_name in file_names:
         with open(file_name, mode='rt', encoding='utf-8') as file:
             try:
                 for expression in parse(Tokenizer(file)):
+                    if mode is RunMode.Evaluate:
+                        evaluate(expression, scope)
+                        continue
+
+                    expression = fold_constants(expand(expression, scope), scope)
+
+                    if mode is RunMode.ExpandOnly:
+                        print(unparse(expression))
+                        if not is_definition(expression):
+                            continue
+
                     evaluate(expression, scope)
             except (SpspEvaluationError, SpspSyntaxError) as e:
                 print_error_message(file, file_name, e)
@@ -109,14 +147,20 @@ def run_files(file_names: Collection[str], scope: Scope) -> bool:
 
 def _main(args: list[str]) -> None:
     scope = Scope.empty()
-    if len(args) <= 1:
+    args = args[1:]
+
+    mode = RunMode.Evaluate
+    while args and args[0] in RUN_MODE_OPTIONS:
+        mode = RUN_MODE_OPTIONS[args.pop(0)]
+
+    if not args:
         return run_repl(scope)
 
     if args[-1] != '--repl':
-        run_files(args[1:], scope)
+        run_files(args, scope, mode)
         return
 
-    if not run_files(args[1:-1], scope):
+    if not run_files(args[:-1], scope, mode):
         return
     return run_repl(scope)
 
@@ -0,0 +1,191 @@
+from typing import Iterable
+
+from . import Expression
+from .errors import SpspValueError
+from .exception_handling import TryForm, parse_try_form
+from .keywords import Keyword, KEYWORDS
+from .macro import Macro
+
+__all__ = [
+    'local_bindings_free',
+    'bound_names',
+    'identifiers',
+    'try_form'
+]
+
+# Forms whose bodies are evaluated in a scope of their own
+_OWN_SCOPE_FORMS = frozenset((Keyword.Lambda, Keyword.Macro, Keyword.Do))
+
+# Forms that bind or unbind names in the scope they are evaluated in, or may evaluate arbitrary code there
+_BINDING_FORMS = frozenset((Keyword.Let, Keyword.Const, Keyword.Dynamic, Keyword.Del, Keyword.EvaluateExpression))
+
+_NAME_BINDING_FORMS = frozenset((Keyword.Let, Keyword.Const, Keyword.Dynamic, Keyword.Rebind, Keyword.Binding))
+
+_FUNCTION_FORMS = frozenset((Keyword.Lambda, Keyword.Macro))
+
+_INLINE_FORMS = frozenset((Keyword.Inline, Keyword.InlineLiteral))
+
+
+class _BindsNames(Exception):
+    pass
+
+
+def local_bindings_free(expressions: Iterable[Expression.AnyExpression]) -> frozenset[str] | None:
+    """
+    Check whether evaluating `expressions` in a scope can never bind names in that scope.
+
+    Returns `None` when it can. Otherwise, returns the names of the operations that are
+    called from the scope: any of them may turn out to be a macro expanding into a binding,
+    so the result only holds while none of these names refer to a `Macro`.
+    """
+    operations: set[str] = set()
+    rebound: set[str] = set()
+
+    try:
+        for expression in expressions:
+            _collect(expression, operations, rebound)
+    except _BindsNames:
+        return None
+
+    # Rebinding does not create bindings, but may turn a called name into a macro midway
+    if not operations.isdisjoint(rebound):
+        return None
+
+    return frozenset(operations)
+
+
+def _collect(expression: Expression.AnyExpression, operations: set[str], rebound: set[str]) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect(it, operations, rebound)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    operation = expression.operation
+
+    if isinstance(operation, Expression.Identifier):
+        name = operation.name
+
+        if name in _OWN_SCOPE_FORMS:
+            return
+
+        if name == Keyword.Try and (form := try_form(expression)) is not None:
+            # Blocks and handlers get scopes of their own, exception types are evaluated in place
+            for handler in form.handlers:
+                if handler.types is not None:
+                    _collect(handler.types, operations, rebound)
+            return
+
+        if name in _BINDING_FORMS:
+            if name == Keyword.EvaluateExpression \
+                    or not expression.arguments \
+                    or not isinstance(expression.arguments[0], Expression.AttributeAccess):
+                raise _BindsNames()
+
+        elif name == Keyword.Rebind:
+            target, *_ = expression.arguments or (None,)
+            rebound.update(it.name for it in identifiers(target))
+
+        elif name == Keyword.Binding and len(expression.arguments) == 3:
+            # Names are rebound while the body is evaluated, the body gets a scope of its own
+            target, values, _ = expression.arguments
+            rebound.update(it.name for it in identifiers(target))
+            _collect(values, operations, rebound)
+            return
+
+        elif name == Keyword.Expression:
+            for it in expression.arguments:
+                _collect_inlined(it, operations, rebound)
+            return
+
+        elif name not in KEYWORDS:
+            operations.add(name)
+
+    elif isinstance(operation, Expression.Literal):
+        if isinstance(operation.value, Macro):
+            raise _BindsNames()
+
+    else:
+        # The operation is only known after evaluation
+        raise _BindsNames()
+
+    for it in expression.arguments:
+        _collect(it, operations, rebound)
+
+
+def _collect_inlined(expression: Expression.AnyExpression, operations: set[str], rebound: set[str]) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect_inlined(it, operations, rebound)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    if isinstance(expression.operation, Expression.Identifier) and expression.operation.name in _INLINE_FORMS:
+        for it in expression.arguments:
+            _collect(it, operations, rebound)
+        return
+
+    _collect_inlined(expression.operation, operations, rebound)
+    for it in expression.arguments:
+        _collect_inlined(it, operations, rebound)
+
+
+def bound_names(expression: Expression.AnyExpression) -> set[str]:
+    """
+    Names bound anywhere within an expression, as function arguments or by binding forms.
+    """
+    if isinstance(expression, Expression.List):
+        return {name for it in expression.items for name in bound_names(it)}
+
+    if not isinstance(expression, Expression.Symbolic):
+        return set()
+
+    names = bound_names(expression.operation)
+    for it in expression.arguments:
+        names.update(bound_names(it))
+
+    operation = expression.operation
+    if not isinstance(operation, Expression.Identifier) or not expression.arguments:
+        return names
+
+    if operation.name in _NAME_BINDING_FORMS:
+        names.update(it.name for it in identifiers(expression.arguments[0]))
+
+    elif operation.name == Keyword.Try and (form := try_form(expression)) is not None:
+        names.update(handler.name.name for handler in form.handlers)
+
+    elif operation.name in _FUNCTION_FORMS:
+        for signature in expression.arguments:
+            if isinstance(signature, Expression.List):
+                names.update(it.name for it in identifiers(signature))
+            elif isinstance(signature, Expression.Symbolic) and isinstance(signature.operation, Expression.List):
+                names.update(it.name for it in identifiers(signature.operation))
+
+    return names
+
+
+def try_form(expression: Expression.Symbolic) -> TryForm | None:
+    """
+    Parts of a `try` form, or `None` when it is malformed: the error is reported by the special form itself.
+    """
+    try:
+        return parse_try_form(expression.arguments) if len(expression.arguments) >= 2 else None
+    except SpspValueError:
+        return None
+
+
+def identifiers(expression: Expression.AnyExpression | None) -> list[Expression.Identifier]:
+    """
+    Identifiers of a binding target, in order.
+    """
+    if isinstance(expression, Expression.Identifier):
+        return [expression]
+
+    if isinstance(expression, Expression.List):
+        return [identifier for it in expression.items for identifier in identifiers(it)]
+
+    return []
@@ -0,0 +1,378 @@
+from collections import Counter
+from dataclasses import dataclass, field
+
+from . import Expression
+from .binding_analysis import local_bindings_free, identifiers, try_form
+from .keywords import Keyword, KEYWORDS
+from .macro import Macro
+from .scope import FrameLayout
+
+__all__ = [
+    'CAPTURE',
+    'Capture',
+    'annotate_closures'
+]
+
+# Key of the capture in the cache of a lambda or macro form
+CAPTURE = 'capture'
+
+_FUNCTION_FORMS = frozenset((Keyword.Lambda, Keyword.Macro))
+
+_INLINE_FORMS = frozenset((Keyword.Inline, Keyword.InlineLiteral))
+
+_BINDING_FORMS = frozenset((Keyword.Let, Keyword.Const, Keyword.Dynamic))
+
+
+@dataclass(frozen=True)
+class Capture:
+    """
+    What a lambda or macro created in a function body reads from the scopes of that body.
+
+    `names` are bound in the function frame, `depth` scopes above the one the closure is created in,
+    or in the scopes between. Other free names of the closure are resolved above the frame.
+    Calls to any of `operations`, which are not bound in the body, or `local_operations`, which are bound
+    in the body exactly once, may turn out to be macro calls, which may bind or read anything.
+
+    `recursive` is the name the closure is bound to in the body when the closure only calls itself
+    by that name directly in its own body: the closure may refer to itself weakly, since it is alive
+    for as long as it is being called.
+    """
+    layout: FrameLayout
+    depth: int
+    names: tuple[str, ...]
+    operations: tuple[str, ...]
+    local_operations: tuple[str, ...]
+    recursive: str | None = None
+
+
+@dataclass
+class _BodyInfo:
+    # Names bound by let or const in the scopes of the body, not in nested functions
+    bound: Counter[str] = field(default_factory=Counter)
+    # Names rebound anywhere in the body, nested functions included
+    rebound: set[str] = field(default_factory=set)
+    # Names unbound in the scopes of the body
+    deleted: set[str] = field(default_factory=set)
+    # Names of operations called anywhere in the body
+    operations: set[str] = field(default_factory=set)
+    # Whether the body may evaluate code that is only known at runtime
+    opaque: bool = False
+
+
+def annotate_closures(body: Expression.AnyExpression, layout: FrameLayout) -> None:
+    """
+    Record a `Capture` in the cache of each lambda and macro form created directly in a function body,
+    or `None` when the closure has to keep the whole scope chain.
+
+    A closure keeps the whole chain when the body evaluates arbitrary code with `eval!` or computed operations,
+    or when any of its free names is bound in the body more than once, rebound or deleted,
+    which makes the time the value is read from matter.
+    """
+    info = _BodyInfo()
+    _collect_body(body, info, nested=False)
+
+    _annotate(body, layout, info, depth=0)
+
+
+def _annotate(expression: Expression.AnyExpression, layout: FrameLayout, info: _BodyInfo, depth: int) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _annotate(it, layout, info, depth)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    operation = expression.operation
+    name = operation.name if type(operation) is Expression.Identifier else None
+
+    if name in _FUNCTION_FORMS:
+        expression._cache[CAPTURE] = _capture(expression, layout, info, depth)
+        return
+
+    if name == Keyword.Expression:
+        return
+
+    if name in _BINDING_FORMS and len(expression.arguments) == 2:
+        target, value = expression.arguments
+        if type(target) is Expression.Identifier and _is_function_form(value):
+            value._cache[CAPTURE] = _capture(value, layout, info, depth, recursive=target.name)
+            return
+
+    if name == Keyword.Try and (form := try_form(expression)) is not None:
+        _annotate_block(form.body, layout, info, depth)
+        for handler in form.handlers:
+            if handler.types is not None:
+                _annotate(handler.types, layout, info, depth)
+            _annotate(handler.body, layout, info, depth + 1)
+        if form.final is not None:
+            _annotate_block(form.final, layout, info, depth)
+        return
+
+    if name == Keyword.Binding and len(expression.arguments) == 3:
+        _, values, body = expression.arguments
+        _annotate(values, layout, info, depth)
+        _annotate_block(body, layout, info, depth)
+        return
+
+    if name == Keyword.Do and local_bindings_free(expression.arguments) is None:
+        depth += 1
+
+    _annotate(operation, layout, info, depth)
+    for it in expression.arguments:
+        _annotate(it, layout, info, depth)
+
+
+def _annotate_block(expression: Expression.AnyExpression, layout: FrameLayout, info: _BodyInfo, depth: int) -> None:
+    _annotate(expression, layout, info, depth if local_bindings_free((expression,)) is not None else depth + 1)
+
+
+def _capture(
+        function: Expression.Symbolic,
+        layout: FrameLayout,
+        info: _BodyInfo,
+        depth: int,
+        recursive: str | None = None
+) -> Capture | None:
+    if info.opaque:
+        return None
+
+    free: set[str] = set()
+    _collect_references(function, free)
+
+    if recursive not in free or info.bound[recursive] != 1 or not all(
+            _only_called(body, recursive) for _, body in _signatures(function.arguments)
+    ):
+        recursive = None
+
+    names = []
+    for name in sorted(free):
+        if name in info.rebound or name in info.deleted or info.bound[name] > 1:
+            return None
+
+        if name != recursive and (info.bound[name] == 1 or name in layout.index):
+            names.append(name)
+
+    operations = []
+    local_operations = []
+    for name in sorted(info.operations):
+        if name in info.rebound or name in info.deleted:
+            return None
+
+        bound = info.bound[name] + (name in layout.index)
+        if bound > 1:
+            return None
+
+        if bound == 0:
+            operations.append(name)
+        elif name != recursive or function.operation.name != Keyword.Lambda:
+            # A recursive lambda only calls itself, which is not a macro
+            local_operations.append(name)
+
+    return Capture(layout, depth, tuple(names), tuple(operations), tuple(local_operations), recursive)
+
+
+def _is_function_form(expression: Expression.AnyExpression) -> bool:
+    return isinstance(expression, Expression.Symbolic) \
+        and type(expression.operation) is Expression.Identifier \
+        and expression.operation.name in _FUNCTION_FORMS
+
+
+def _only_called(expression: Expression.AnyExpression, name: str) -> bool:
+    """
+    Whether `name` is only read by calls evaluated directly in `expression`, not in closures or expressions
+    evaluated later.
+    """
+    if isinstance(expression, (Expression.Identifier, Expression.AttributeAccess)):
+        return expression.name != name
+
+    if isinstance(expression, Expression.List):
+        return all(_only_called(it, name) for it in expression.items)
+
+    if isinstance(expression, Expression.Folded):
+        return all(it != name for it, _ in expression.dependencies) and _only_called(expression.original, name)
+
+    if not isinstance(expression, Expression.Symbolic):
+        return True
+
+    operation = expression.operation
+    operation_name = operation.name if isinstance(operation, Expression.Identifier) else None
+
+    if operation_name in _FUNCTION_FORMS or operation_name == Keyword.Expression:
+        names: set[str] = set()
+        _collect_references(expression, names)
+        return name not in names
+
+    return (operation_name == name or _only_called(operation, name)) \
+        and all(_only_called(it, name) for it in expression.arguments)
+
+
+def _signatures(
+        arguments: tuple[Expression.AnyExpression, ...]
+) -> list[tuple[Expression.AnyExpression, Expression.AnyExpression]]:
+    if len(arguments) == 2 and isinstance(arguments[0], Expression.List):
+        return [(arguments[0], arguments[1])]
+
+    return [
+        (signature.operation, signature.arguments[0])
+        for signature in arguments
+        if isinstance(signature, Expression.Symbolic)
+        and isinstance(signature.operation, Expression.List)
+        and len(signature.arguments) == 1
+    ]
+
+
+def _collect_body(expression: Expression.AnyExpression, info: _BodyInfo, nested: bool) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect_body(it, info, nested)
+        return
+
+    if isinstance(expression, Expression.Folded):
+        _collect_body(expression.original, info, nested)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    operation = expression.operation
+
+    if type(operation) is Expression.Identifier or type(operation) is Expression.LocalIdentifier:
+        name = operation.name
+
+        if name == Keyword.EvaluateExpression:
+            info.opaque = True
+
+        elif name in _FUNCTION_FORMS:
+            for _, body in _signatures(expression.arguments):
+                _collect_body(body, info, nested=True)
+            return
+
+        elif name == Keyword.Expression:
+            for it in expression.arguments:
+                _collect_inlined(it, info, nested)
+            return
+
+        elif name in _BINDING_FORMS and expression.arguments and not nested:
+            info.bound.update(it.name for it in identifiers(expression.arguments[0]))
+
+        elif name in (Keyword.Rebind, Keyword.Binding) and expression.arguments:
+            info.rebound.update(it.name for it in identifiers(expression.arguments[0]))
+
+        elif name == Keyword.Del and expression.arguments and not nested:
+            info.deleted.update(it.name for it in identifiers(expression.arguments[0]))
+
+        elif name == Keyword.Try and not nested and (form := try_form(expression)) is not None:
+            info.bound.update(handler.name.name for handler in form.handlers)
+
+        elif name not in KEYWORDS:
+            info.operations.add(name)
+
+    elif isinstance(operation, Expression.Literal):
+        if isinstance(operation.value, Macro):
+            info.opaque = True
+
+    elif not isinstance(operation, Expression.AttributeAccess):
+        # The operation is only known after evaluation and may be a macro
+        info.opaque = True
+
+    for it in expression.arguments:
+        _collect_body(it, info, nested)
+
+
+def _collect_inlined(expression: Expression.AnyExpression, info: _BodyInfo, nested: bool) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect_inlined(it, info, nested)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    if isinstance(expression.operation, Expression.Identifier) and expression.operation.name in _INLINE_FORMS:
+        for it in expression.arguments:
+            _collect_body(it, info, nested)
+        return
+
+    _collect_inlined(expression.operation, info, nested)
+    for it in expression.arguments:
+        _collect_inlined(it, info, nested)
+
+
+def _collect_references(expression: Expression.AnyExpression, names: set[str]) -> None:
+    """
+    Names an expression may read or rebind in the scope it is evaluated in.
+    """
+    if isinstance(expression, (Expression.Identifier, Expression.AttributeAccess)):
+        names.add(expression.name)
+        return
+
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect_references(it, names)
+        return
+
+    if isinstance(expression, Expression.Folded):
+        names.update(name for name, _ in expression.dependencies)
+        _collect_references(expression.original, names)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    operation = expression.operation
+    name = operation.name if isinstance(operation, Expression.Identifier) else None
+
+    if name in _FUNCTION_FORMS:
+        for arguments, body in _signatures(expression.arguments):
+            inner: set[str] = set()
+            _collect_references(body, inner)
+            names.update(inner.difference(it.name for it in identifiers(arguments)))
+        return
+
+    if name == Keyword.Expression:
+        for it in expression.arguments:
+            _collect_inlined_references(it, names)
+        return
+
+    if name in _BINDING_FORMS and expression.arguments:
+        # Names bound here are not read, attributes set here are
+        target, *values = expression.arguments
+        if isinstance(target, Expression.List):
+            _collect_references(Expression.List(target.position, tuple(
+                it for it in target.items if not isinstance(it, Expression.Identifier)
+            )), names)
+        elif not isinstance(target, Expression.Identifier):
+            _collect_references(target, names)
+
+        for it in values:
+            _collect_references(it, names)
+        return
+
+    if name is not None and name in KEYWORDS:
+        for it in expression.arguments:
+            _collect_references(it, names)
+        return
+
+    _collect_references(operation, names)
+    for it in expression.arguments:
+        _collect_references(it, names)
+
+
+def _collect_inlined_references(expression: Expression.AnyExpression, names: set[str]) -> None:
+    if isinstance(expression, Expression.List):
+        for it in expression.items:
+            _collect_inlined_references(it, names)
+        return
+
+    if not isinstance(expression, Expression.Symbolic):
+        return
+
+    if isinstance(expression.operation, Expression.Identifier) and expression.operation.name in _INLINE_FORMS:
+        for it in expression.arguments:
+            _collect_references(it, names)
+        return
+
+    _collect_inlined_references(expression.operation, names)
+    for it in expression.arguments:
+        _collect_inlined_references(it, names)
@@ -0,0 +1,310 @@
+import builtins
+import math
+import operator
+from types import ModuleType
+from typing import Any
+
+from . import Expression
+from .attribute_utility import get_attribute_value
+from .binding_analysis import bound_names
+from .dynamic import DynamicVariable
+from .keywords import Keyword, KEYWORDS
+from .macro import Macro
+from .scope import Scope
+from .special_form import special_forms
+
+__all__ = [
+    'fold_constants'
+]
+
+NOT_FOUND = object()
+
+# Operations without side effects, giving the same result for the same immutable arguments
+PURE_OPERATIONS = frozenset((
+    operator.add, operator.sub, operator.mul, operator.truediv, operator.floordiv, operator.mod, operator.pow,
+    operator.neg, operator.pos, operator.not_, operator.abs,
+    operator.lt, operator.le, operator.gt, operator.ge, operator.eq, operator.ne,
+    operator.and_, operator.or_, operator.xor, operator.invert, operator.lshift, operator.rshift,
+    builtins.abs, builtins.len, builtins.min, builtins.max, builtins.round,
+    builtins.str, builtins.int, builtins.float, builtins.bool,
+    math.sqrt, math.floor, math.ceil, math.trunc, math.fabs, math.exp, math.log, math.log2, math.log10,
+    math.sin, math.cos, math.tan, math.gcd, math.isqrt,
+))
+
+IMMUTABLE_TYPES = (int, float, complex, str, bytes, bool, type(None))
+
+# Largest length of a string or bytes, or bit length of an integer, folded into a literal
+MAX_FOLDED_SIZE = 4096
+
+# Forms evaluating all of their arguments in place
+_EVALUATING_FORMS = frozenset((Keyword.If, Keyword.And, Keyword.Or, Keyword.Cond, Keyword.Do,
+                               Keyword.EvaluateExpression, Keyword.Symbolic, Keyword.UncachedMacro))
+
+# Forms binding their first argument and evaluating the second one
+_BINDING_FORMS = frozenset((Keyword.Let, Keyword.Const, Keyword.Dynamic, Keyword.Rebind))
+
+_FUNCTION_FORMS = frozenset((Keyword.Lambda, Keyword.Macro))
+
+_INLINE_FORMS = frozenset((Keyword.Inline, Keyword.InlineLiteral))
+
+
+def fold_constants(expression: Expression.AnyExpression, scope: Scope) -> Expression.AnyExpression:
+    """
+    Precompute parts of a top level expression that do not depend on runtime state.
+
+    - Names bound as constants in `scope` are replaced with their values, along with attributes
+      of constant modules
+    - Calls to pure operations with immutable literal arguments are replaced with their results,
+      unless the arguments or the result are larger than `MAX_FOLDED_SIZE`.
+      Names of the operations usually are variables (the std-lib binds `+` with `let`),
+      so the result is guarded by the identity of the operation at evaluation time
+    - `if` with an immutable literal condition is replaced with the branch taken
+
+    Names bound anywhere within the expression are left alone. Arguments of calls that may be
+    macro calls are left alone too: macros receive code, not values.
+    """
+    return _Folder(scope, bound_names(expression)).fold(expression)
+
+
+class _Folder:
+    def __init__(self, scope: Scope, shadowed: set[str]) -> None:
+        self._scope = scope
+        self._shadowed = shadowed
+
+    def fold(self, expression: Expression.AnyExpression) -> Expression.AnyExpression:
+        if type(expression) is Expression.Identifier:
+            return self._fold_constant(expression)
+
+        if isinstance(expression, Expression.AttributeAccess):
+            return self._fold_attribute(expression)
+
+        if isinstance(expression, Expression.List):
+            return Expression.List(expression.position, tuple(map(self.fold, expression.items)))
+
+        if not isinstance(expression, Expression.Symbolic):
+            return expression
+
+        operation = expression.operation
+        name = operation.name if type(operation) is Expression.Identifier else None
+
+        if name == Keyword.If and len(expression.arguments) == 3:
+            return self._fold_if(expression)
+
+        if name in _EVALUATING_FORMS:
+            return Expression.Symbolic(expression.position, operation, tuple(map(self.fold, expression.arguments)))
+
+        if name in _BINDING_FORMS and len(expression.arguments) == 2:
+            target, value = expression.arguments
+            return Expression.Symbolic(expression.position, operation, (target, self.fold(value)))
+
+        if name in _FUNCTION_FORMS:
+            return Expression.Symbolic(
+                expression.position,
+                operation,
+                tuple(map(self._fold_signature, expression.arguments))
+            )
+
+        if name == Keyword.Expression:
+            return Expression.Symbolic(
+                expression.position,
+                operation,
+                tuple(map(self._fold_inlined, expression.arguments))
+            )
+
+        if name in special_forms:
+            # Other special forms may not evaluate their arguments
+            return expression
+
+        return self._fold_call(expression)
+
+    def _fold_call(self, expression: Expression.Symbolic) -> Expression.AnyExpression:
+        operation, dependencies = self._resolve_operation(expression.operation)
+        if operation is NOT_FOUND or isinstance(operation, Macro):
+            return expression
+
+        arguments = tuple(map(self.fold, expression.arguments))
+        folded = Expression.Symbolic(expression.position, self.fold(expression.operation), arguments)
+
+        if not _is_pure(operation):
+            return folded
+
+        values = []
+        for argument in arguments:
+            if isinstance(argument, Expression.Literal):
+                values.append(argument.value)
+            elif isinstance(argument, Expression.Folded):
+                values.append(argument.value)
+                dependencies += argument.dependencies
+            else:
+                return folded
+
+        if not all(isinstance(it, IMMUTABLE_TYPES) for it in values):
+            return folded
+
+        # Large values would take time and memory to compute, and to keep in the code, even if never used
+        if any(_size(it) > MAX_FOLDED_SIZE for it in values) or _result_size(operation, values) > MAX_FOLDED_SIZE:
+            return folded
+
+        try:
+            value = operation(*values)
+        except Exception:
+            # Errors are raised when (and if) the expression is evaluated
+            return folded
+
+        if _size(value) > MAX_FOLDED_SIZE:
+            return folded
+
+        if not dependencies:
+            return Expression.Literal(expression.position, value)
+
+        return Expression.Folded(expression.position, value, folded, dependencies)
+
+    def _fold_if(self, expression: Expression.Symbolic) -> Expression.AnyExpression:
+        condition, when_true, when_false = expression.arguments
+        condition = self.fold(condition)
+
+        # The truth of a mutable value may change by the time the condition is evaluated.
+        # The branch not taken is never evaluated, so it is not folded either
+        if isinstance(condition, Expression.Literal) and isinstance(condition.value, IMMUTABLE_TYPES):
+            return self.fold(when_true if condition.value else when_false)
+
+        return Expression.Symbolic(
+            expression.position,
+            expression.operation,
+            (condition, self.fold(when_true), self.fold(when_false))
+        )
+
+    def _resolve_operation(self, operation: Expression.AnyExpression) -> (Any, tuple[tuple[str, Any], ...]):
+        """
+        The value an operation refers to at this point, and the names it depends on.
+        """
+        if isinstance(operation, Expression.Literal):
+            return operation.value, ()
+
+        if type(operation) is Expression.Identifier and operation.name not in self._shadowed:
+            value = self._scope.value_or(operation.name, NOT_FOUND)
+            if type(value) is DynamicVariable:
+                return NOT_FOUND, ()
+            if value is NOT_FOUND or self._scope.is_constant(operation.name):
+                return value, ()
+            return value, ((operation.name, value),)
+
+        if isinstance(operation, Expression.AttributeAccess) and operation.name not in self._shadowed:
+            head = self._scope.value_or(operation.name, NOT_FOUND)
+            if not isinstance(head, ModuleType):
+                return NOT_FOUND, ()
+
+            try:
+                value = get_attribute_value(head, operation.attributes)
+            except AttributeError:
+                return NOT_FOUND, ()
+
+            if self._scope.is_constant(operation.name):
+                return value, ()
+            return value, ((operation.name, head),)
+
+        return NOT_FOUND, ()
+
+    def _fold_constant(self, expression: Expression.Identifier) -> Expression.AnyExpression:
+        if expression.name in self._shadowed \
+                or expression.name in KEYWORDS \
+                or not self._scope.is_constant(expression.name):
+            return expression
+
+        if type(value := self._scope.value(expression.name)) is DynamicVariable:
+            # The value of a dynamic variable depends on the context it is evaluated in
+            return expression
+
+        return Expression.Literal(expression.position, value)
+
+    def _fold_attribute(self, expression: Expression.AttributeAccess) -> Expression.AnyExpression:
+        if expression.name in self._shadowed or not self._scope.is_constant(expression.name):
+            return expression
+
+        if not isinstance(head := self._scope.value(expression.name), ModuleType):
+            return expression
+
+        try:
+            return Expression.Literal(expression.position, get_attribute_value(head, expression.attributes))
+        except AttributeError:
+            return expression
+
+    def _fold_signature(self, signature: Expression.AnyExpression) -> Expression.AnyExpression:
+        # Argument lists are kept as is, bodies are folded
+        if isinstance(signature, Expression.List):
+            return signature
+
+        if isinstance(signature, Expression.Symbolic) and isinstance(signature.operation, Expression.List):
+            return Expression.Symbolic(
+                signature.position,
+                signature.operation,
+                tuple(map(self.fold, signature.arguments))
+            )
+
+        return self.fold(signature)
+
+    def _fold_inlined(self, expression: Expression.AnyExpression) -> Expression.AnyExpression:
+        # Code templates are data: only the expressions inlined into them get evaluated
+        if isinstance(expression, Expression.List):
+            return Expression.List(expression.position, tuple(map(self._fold_inlined, expression.items)))
+
+        if not isinstance(expression, Expression.Symbolic):
+            return expression
+
+        if isinstance(expression.operation, Expression.Identifier) and expression.operation.name in _INLINE_FORMS:
+            return Expression.Symbolic(
+                expression.position,
+                expression.operation,
+                tuple(map(self.fold, expression.arguments))
+            )
+
+        return Expression.Symbolic(
+            expression.position,
+            self._fold_inlined(expression.operation),
+            tuple(map(self._fold_inlined, expression.arguments))
+        )
+
+
+def _is_pure(operation: Any) -> bool:
+    try:
+        return operation in PURE_OPERATIONS
+    except TypeError:
+        # Like functions with literals of mutable values in their body
+        return False
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+
+    if isinstance(value, int):
+        return value.bit_length()
+
+    return 0
+
+
+def _result_size(operation: Any, values: list[Any]) -> int:
+    """
+    An estimate of the size of the result of operations that can make values much larger than their operands.
+    """
+    if len(values) != 2:
+        return 0
+
+    left, right = values
+
+    if operation is operator.mul:
+        if isinstance(right, (str, bytes)):
+            left, right = right, left
+
+        if isinstance(left, (str, bytes)) and isinstance(right, int):
+            return len(left) * right
+
+        return _size(left) + _size(right)
+
+    if operation is operator.pow and isinstance(left, int) and isinstance(right, int):
+        return left.bit_length() * right
+
+    if operation is operator.lshift and isinstance(left, int) and isinstance(right, int):
+        return left.bit_length() + right
+
+    return 0
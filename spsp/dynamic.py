@@ -0,0 +1,42 @@
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+__all__ = [
+    'DynamicVariable',
+    'current_value'
+]
+
+
+@dataclass(frozen=True, eq=False)
+class DynamicVariable:
+    """
+    A variable whose value can be overridden for the extent of a `binding` form.
+
+    The name a dynamic variable is bound to evaluates to its current value. Overrides are kept
+    in a `ContextVar`, so they are only seen by the thread or asyncio task that made them.
+    """
+    name: str
+    _var: ContextVar = field(repr=False)
+
+    @staticmethod
+    def declare(name: str, value: Any) -> 'DynamicVariable':
+        return DynamicVariable(name, ContextVar(name, default=value))
+
+    @property
+    def value(self) -> Any:
+        return self._var.get()
+
+    def override(self, value: Any) -> Token:
+        return self._var.set(value)
+
+    def restore(self, token: Token) -> None:
+        self._var.reset(token)
+
+
+def current_value(value: Any) -> Any:
+    """
+    What a name bound to `value` evaluates to: the value in the current context of a dynamic variable,
+    `value` itself otherwise.
+    """
+    return value if type(value) is not DynamicVariable else value.value
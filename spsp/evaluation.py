@@ -1,4 +1,5 @@
-from typing import Any
+from types import CodeType, TracebackType
+from typing import Any, Callable, TypeVar
 
 from . import Expression
 from .errors import (
@@ -9,26 +10,75 @@ from .lazy import Lazy
 from .scope import Scope
 
 __all__ = [
-    'evaluate'
+    'evaluate',
+    'evaluate_expression',
+    'error_position_boundary'
 ]
 
 NOT_FOUND = object()
 
+_Callable = TypeVar('_Callable', bound=Callable[..., Any])
+
+_boundaries: set[CodeType] = set()
+
+
+def error_position_boundary(function: _Callable) -> _Callable:
+    """
+    Errors raised below a call to `function` are reported at the position of the expression that called it.
+
+    Used for function and macro calls: expressions inside a function body may come from another file.
+    """
+    _boundaries.add(function.__code__)
+    return function
+
 
 def evaluate(
         expression: Expression.AnyExpression,
         scope: Scope,
         force_eval_lazy: bool = False
 ) -> Any:
-    if (_evaluate := evaluation_rules.get(type(expression), NOT_FOUND)) is NOT_FOUND:
-        raise NotImplementedError(type(expression))
-
+    """
+    Evaluate a top level expression, reporting errors as `SpspEvaluationError`.
+    """
     try:
-        result = _evaluate(expression, scope)
-        if isinstance(result, Lazy) and force_eval_lazy:
-            return result.value
-        return result
+        return evaluate_expression(expression, scope, force_eval_lazy)
     except SpspEvaluationError:
         raise
     except Exception as e:
-        raise SpspEvaluationError(e, expression.position)
+        raise SpspEvaluationError(e, _error_position(e.__traceback__, expression))
+
+
+def evaluate_expression(
+        expression: Expression.AnyExpression,
+        scope: Scope,
+        force_eval_lazy: bool = False
+) -> Any:
+    """
+    Evaluate an expression, letting errors propagate as is.
+
+    No exception handling is set up here: the position of a failed expression
+    is recovered from the traceback by `evaluate`.
+    """
+    if (_evaluate := evaluation_rules.get(type(expression), NOT_FOUND)) is NOT_FOUND:
+        raise NotImplementedError(type(expression))
+
+    result = _evaluate(expression, scope)
+    if force_eval_lazy and isinstance(result, Lazy):
+        return result.value
+    return result
+
+
+def _error_position(traceback: TracebackType | None, expression: Expression.AnyExpression) -> int:
+    failed = expression
+
+    while traceback is not None:
+        code = traceback.tb_frame.f_code
+
+        if code is evaluate_expression.__code__:
+            failed = traceback.tb_frame.f_locals['expression']
+        elif code in _boundaries:
+            break
+
+        traceback = traceback.tb_next
+
+    return failed.position
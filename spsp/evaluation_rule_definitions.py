@@ -1,11 +1,13 @@
-from typing import Any
+from types import ModuleType, MethodDescriptorType, WrapperDescriptorType
+from typing import Any, Callable, TypeAlias
 
 from . import Expression
 from .attribute_utility import get_attribute_value
-from .errors import SpspEvaluationError
-from .evaluation import evaluate
+from .dynamic import DynamicVariable, current_value
+from .evaluation import evaluate_expression, error_position_boundary
 from .evaluation_rule import evaluation_rule
 from .function import Function
+from .lazy import Lazy
 from .macro import Macro
 from .scope import Scope
 from .special_form import special_forms
@@ -14,6 +16,9 @@ __all__ = []
 
 NOT_FOUND = object()
 
+# Py_TPFLAGS_IMMUTABLETYPE: attributes of such types cannot be set or deleted
+IMMUTABLE_TYPE_FLAG = 1 << 8
+
 
 @evaluation_rule(Expression.Literal)
 def _literal(expression: Expression.Literal, _: Scope) -> Any:
@@ -22,39 +27,272 @@ def _literal(expression: Expression.Literal, _: Scope) -> Any:
 
 @evaluation_rule(Expression.Identifier)
 def _identifier(expression: Expression.Identifier, scope: Scope) -> Any:
-    return scope.value(expression.name)
+    return _name_value(expression, scope)
+
+
+def _name_value(expression: Expression.Identifier | Expression.AttributeAccess, scope: Scope) -> Any:
+    # Names bound only in the root scope, or not bound at all (Python builtins), resolve to the same value
+    # from every scope until the global namespace changes, so the value is cached per expression.
+    # Versions are unique across root scopes, so the cache does not need to refer to the root.
+    # Builtins can be changed from Python, so values read from them are checked against their namespace.
+    # Dynamic variables are cached as such and evaluate to their value in the current context
+    if (cached := expression._cache.get('global')) is not None and cached[0] == scope.globals_version():
+        _, value, builtins = cached
+        if builtins is None or builtins.get(expression.name, NOT_FOUND) is value:
+            return value if type(value) is not DynamicVariable else value.value
+
+    value = scope.value(expression.name)
+
+    if scope.is_global(expression.name):
+        expression._cache['global'] = scope.globals_version(), value, scope.builtins_namespace(expression.name)
+
+    return current_value(value)
+
+
+@evaluation_rule(Expression.LocalIdentifier)
+def _local_identifier(expression: Expression.LocalIdentifier, scope: Scope) -> Any:
+    return scope.slot_value(expression.name, expression.depth, expression.slot, expression.frame)
 
 
 @evaluation_rule(Expression.AttributeAccess)
 def _attribute_access(expression: Expression.AttributeAccess, scope: Scope) -> Any:
-    return get_attribute_value(scope.value(expression.name), expression.attributes)
+    return _attribute_value(expression, _name_value(expression, scope))
+
+
+def _attribute_value(expression: Expression.AttributeAccess, head: Any) -> Any:
+    # Chains of module attributes, like functools::reduce or os::path::join, are cached per expression
+    # for as long as the head refers to the same module and each module in the chain still holds
+    # the same value in its namespace, however the attribute was set
+    if (cached := expression._cache.get('attribute')) is not None and cached[0] is head:
+        _, namespace, attribute, value, outer = cached
+        if namespace.get(attribute, NOT_FOUND) is value and (not outer or _chain_holds(outer)):
+            return value
+
+    value = get_attribute_value(head, expression.attributes)
+
+    if (chain := _module_chain(head, expression.attributes)) is not None and chain[-1][2] is value:
+        expression._cache['attribute'] = (head,) + chain[-1] + (chain[:-1],)
+
+    return value
+
+
+def _module_chain(head: Any, attributes: tuple[str, ...]) -> tuple[tuple[dict[str, Any], str, Any], ...] | None:
+    """
+    The namespace each attribute in a chain is read from and the value read, provided each attribute
+    is stored in the namespace of a module.
+    """
+    chain = []
+    for attribute in attributes:
+        if not isinstance(head, ModuleType) \
+                or (value := head.__dict__.get(attribute, NOT_FOUND)) is NOT_FOUND:
+            return None
+
+        chain.append((head.__dict__, attribute, value))
+        head = value
+
+    return tuple(chain)
+
+
+def _chain_holds(chain: tuple[tuple[dict[str, Any], str, Any], ...]) -> bool:
+    for namespace, attribute, value in chain:
+        if namespace.get(attribute, NOT_FOUND) is not value:
+            return False
+
+    return True
+
+
+def _immutable_type_method(cls: type, name: str) -> Callable[..., Any] | None:
+    """
+    The method `name` of instances of `cls`, provided it can never change for them.
+    """
+    if not cls.__flags__ & IMMUTABLE_TYPE_FLAG or cls.__dictoffset__:
+        return None
+
+    for klass in cls.__mro__:
+        if (descriptor := klass.__dict__.get(name, NOT_FOUND)) is not NOT_FOUND:
+            if isinstance(descriptor, (MethodDescriptorType, WrapperDescriptorType)):
+                return descriptor
+            return None
+
+    return None
+
+
+@evaluation_rule(Expression.Folded)
+def _folded(expression: Expression.Folded, scope: Scope) -> Any:
+    for name, value in expression.dependencies:
+        if scope.value_or(name, NOT_FOUND) is not value:
+            return evaluate_expression(expression.original, scope)
+
+    return expression.value
 
 
 @evaluation_rule(Expression.List)
 def _list(expression: Expression.List, scope: Scope) -> Any:
-    return [evaluate(it, scope) for it in expression.items]
+    return [evaluate_expression(it, scope) for it in expression.items]
 
 
 @evaluation_rule(Expression.Symbolic)
 def _symbolic_expression(expression: Expression.Symbolic, scope: Scope) -> Any:
+    if (call := expression._cache.get('call')) is None:
+        call = expression._cache['call'] = _call_site(expression)
+
+    return call(expression, scope)
+
+
+CallSite: TypeAlias = Callable[[Expression.Symbolic, Scope], Any]
+
+
+def _call_site(expression: Expression.Symbolic) -> CallSite:
+    """
+    Choose how a symbolic expression is evaluated. Done once per expression.
+    """
     if isinstance(expression.operation, Expression.Identifier) \
             and (evaluate_special := special_forms.get(expression.operation.name, NOT_FOUND)) is not NOT_FOUND:
-        return evaluate_special(expression.arguments, scope)
+        return lambda _expression, scope: evaluate_special(_expression.arguments, scope, _expression._cache)
+
+    if isinstance(expression.operation, Expression.AttributeAccess):
+        return _attribute_call
+
+    return _calls_by_arity.get(len(expression.arguments), _call_n)
+
+
+def _call_0(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+
+    if isinstance(operation, Macro):
+        return _expand_and_evaluate(operation, expression, scope)
 
-    operation = evaluate(expression.operation, scope, force_eval_lazy=True)
+    return operation()
 
-    try:
+
+def _call_1(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+    a, = expression.arguments
+
+    if isinstance(operation, Function):
+        if isinstance(operation, Macro):
+            return _expand_and_evaluate(operation, expression, scope)
+
+        return operation(evaluate_expression(a, scope))
+
+    return operation(evaluate_expression(a, scope, force_eval_lazy=True))
+
+
+def _call_2(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+    a, b = expression.arguments
+
+    if isinstance(operation, Function):
         if isinstance(operation, Macro):
-            generated = operation(*expression.arguments)
-            return evaluate(generated, scope)
+            return _expand_and_evaluate(operation, expression, scope)
+
+        return operation(evaluate_expression(a, scope), evaluate_expression(b, scope))
+
+    return operation(
+        evaluate_expression(a, scope, force_eval_lazy=True),
+        evaluate_expression(b, scope, force_eval_lazy=True)
+    )
+
+
+def _call_3(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+    a, b, c = expression.arguments
+
+    if isinstance(operation, Function):
+        if isinstance(operation, Macro):
+            return _expand_and_evaluate(operation, expression, scope)
+
+        return operation(evaluate_expression(a, scope), evaluate_expression(b, scope), evaluate_expression(c, scope))
+
+    return operation(
+        evaluate_expression(a, scope, force_eval_lazy=True),
+        evaluate_expression(b, scope, force_eval_lazy=True),
+        evaluate_expression(c, scope, force_eval_lazy=True)
+    )
+
+
+def _call_4(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+    a, b, c, d = expression.arguments
+
+    if isinstance(operation, Function):
+        if isinstance(operation, Macro):
+            return _expand_and_evaluate(operation, expression, scope)
+
+        return operation(
+            evaluate_expression(a, scope),
+            evaluate_expression(b, scope),
+            evaluate_expression(c, scope),
+            evaluate_expression(d, scope)
+        )
+
+    return operation(
+        evaluate_expression(a, scope, force_eval_lazy=True),
+        evaluate_expression(b, scope, force_eval_lazy=True),
+        evaluate_expression(c, scope, force_eval_lazy=True),
+        evaluate_expression(d, scope, force_eval_lazy=True)
+    )
+
+
+def _call_n(expression: Expression.Symbolic, scope: Scope) -> Any:
+    operation = evaluate_expression(expression.operation, scope, force_eval_lazy=True)
+    return _call(operation, expression, scope)
+
+
+def _attribute_call(expression: Expression.Symbolic, scope: Scope) -> Any:
+    access: Expression.AttributeAccess = expression.operation
+    head = _name_value(access, scope)
+
+    if isinstance(head, ModuleType):
+        return _call(_attribute_value(access, head), expression, scope)
+
+    target = head if len(access.attributes) == 1 else get_attribute_value(head, access.attributes[:-1])
+
+    # Methods of built-in types are called through their descriptors, without creating bound methods
+    if (cached := expression._cache.get('method')) is not None and cached[0] is type(target):
+        method = cached[1]
+    elif (method := _immutable_type_method(type(target), access.attributes[-1])) is not None:
+        expression._cache['method'] = type(target), method
+    else:
+        return _call(getattr(target, access.attributes[-1]), expression, scope)
+
+    match expression.arguments:
+        case ():
+            return method(target)
+        case (a,):
+            return method(target, evaluate_expression(a, scope, force_eval_lazy=True))
+        case (a, b):
+            return method(
+                target,
+                evaluate_expression(a, scope, force_eval_lazy=True),
+                evaluate_expression(b, scope, force_eval_lazy=True)
+            )
+
+    return method(target, *[evaluate_expression(it, scope, force_eval_lazy=True) for it in expression.arguments])
+
+
+def _call(operation: Any, expression: Expression.Symbolic, scope: Scope) -> Any:
+    if isinstance(operation, Lazy):
+        operation = operation.value
+
+    if isinstance(operation, Function):
+        if isinstance(operation, Macro):
+            return _expand_and_evaluate(operation, expression, scope)
+
+        return operation(*[evaluate_expression(it, scope) for it in expression.arguments])
+
+    return operation(*[evaluate_expression(it, scope, force_eval_lazy=True) for it in expression.arguments])
 
-        if isinstance(operation, Function):
-            arguments = (evaluate(it, scope) for it in expression.arguments)
-            return operation(*arguments)
 
-    except SpspEvaluationError as e:
-        raise SpspEvaluationError(e.cause, expression.position)
+_calls_by_arity: dict[int, CallSite] = {
+    0: _call_0,
+    1: _call_1,
+    2: _call_2,
+    3: _call_3,
+    4: _call_4
+}
 
-    arguments = (evaluate(it, scope, force_eval_lazy=True) for it in expression.arguments)
 
-    return operation(*arguments)
+@error_position_boundary
+def _expand_and_evaluate(macro: Macro, expression: Expression.Symbolic, scope: Scope) -> Any:
+    return evaluate_expression(macro.expand(expression), scope)
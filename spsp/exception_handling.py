@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+
+from . import Expression
+from .errors import SpspValueError
+from .keywords import Keyword
+
+__all__ = [
+    'ExceptClause',
+    'TryForm',
+    'parse_try_form'
+]
+
+
+@dataclass(frozen=True)
+class ExceptClause:
+    """
+    `(except [types] name body)`: `body` is evaluated in a scope of its own with the exception bound to `name`.
+    Without `types`, any exception is handled.
+    """
+    clause: Expression.Symbolic
+    types: Expression.AnyExpression | None
+    name: Expression.Identifier
+    body: Expression.AnyExpression
+
+
+@dataclass(frozen=True)
+class TryForm:
+    """
+    `(try body (except ...) ... [(finally final)])`
+    """
+    body: Expression.AnyExpression
+    handlers: tuple[ExceptClause, ...]
+    final_clause: Expression.Symbolic | None
+
+    @property
+    def final(self) -> Expression.AnyExpression | None:
+        return None if self.final_clause is None else self.final_clause.arguments[0]
+
+
+def _is_clause(expression: Expression.AnyExpression, keyword: Keyword) -> bool:
+    return isinstance(expression, Expression.Symbolic) \
+        and isinstance(expression.operation, Expression.Identifier) \
+        and expression.operation.name == keyword
+
+
+def parse_try_form(arguments: tuple[Expression.AnyExpression, ...]) -> TryForm:
+    body, *clauses = arguments
+
+    final_clause = None
+    if clauses and _is_clause(clauses[-1], Keyword.Finally):
+        final_clause = clauses.pop()
+        if len(final_clause.arguments) != 1:
+            raise SpspValueError('Finally statement should contain exactly one expression')
+
+    handlers = []
+    for clause in clauses:
+        if not _is_clause(clause, Keyword.Except):
+            raise SpspValueError(f'Exception handler should start with "{Keyword.Except}"')
+
+        match clause.arguments:
+            case (Expression.Identifier() as name, handler_body):
+                handlers.append(ExceptClause(clause, None, name, handler_body))
+            case (types, Expression.Identifier() as name, handler_body):
+                handlers.append(ExceptClause(clause, types, name, handler_body))
+            case _:
+                raise SpspValueError(f'Exception handler should be ({Keyword.Except} [types] name body)')
+
+    if not handlers and final_clause is None:
+        raise SpspValueError(f'"{Keyword.Try}" expected at least one exception handler or finally statement')
+
+    return TryForm(body, tuple(handlers), final_clause)
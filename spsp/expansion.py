@@ -0,0 +1,159 @@
+from . import Expression
+from .binding_analysis import bound_names
+from .errors import SpspEvaluationError
+from .keywords import Keyword
+from .macro import Macro
+from .scope import Scope
+
+__all__ = [
+    'expand'
+]
+
+_FUNCTION_FORMS = frozenset((Keyword.Lambda, Keyword.Macro))
+
+_INLINE_FORMS = frozenset((Keyword.Inline, Keyword.InlineLiteral))
+
+
+def expand(expression: Expression.AnyExpression, scope: Scope) -> Expression.AnyExpression:
+    """
+    Expand every macro call in a top level expression.
+
+    A call is expanded when its operation is an identifier referring to a `Macro` in `scope`
+    at the time of expansion. Names bound anywhere within the expression, by `let`, `const`, `rebind`,
+    or as function arguments, may refer to something else at runtime and are left alone,
+    as are macros marked with `uncached!`. Those calls are expanded during evaluation as usual.
+
+    Errors raised by macros are reported as `SpspEvaluationError` at the position of the call.
+    """
+    return _Expander(scope, bound_names(expression)).expand(expression)
+
+
+class _Expander:
+    def __init__(self, scope: Scope, shadowed: set[str]) -> None:
+        self._scope = scope
+        self._shadowed = shadowed
+
+    def expand(self, expression: Expression.AnyExpression) -> Expression.AnyExpression:
+        if isinstance(expression, Expression.List):
+            return Expression.List(expression.position, tuple(map(self.expand, expression.items)))
+
+        if not isinstance(expression, Expression.Symbolic):
+            return expression
+
+        operation = expression.operation
+        name = operation.name if isinstance(operation, Expression.Identifier) else None
+
+        if name == Keyword.Expression:
+            return Expression.Symbolic(
+                expression.position,
+                operation,
+                tuple(map(self._expand_inlined, expression.arguments))
+            )
+
+        if name in _FUNCTION_FORMS:
+            return Expression.Symbolic(
+                expression.position,
+                operation,
+                tuple(map(self._expand_signature, expression.arguments))
+            )
+
+        if (macro := self._macro(name)) is not None:
+            try:
+                generated = _reposition(macro.expand(expression), expression)
+            except SpspEvaluationError:
+                raise
+            except Exception as e:
+                raise SpspEvaluationError(e, expression.position)
+
+            self._shadowed.update(bound_names(generated))
+            return self.expand(generated)
+
+        return Expression.Symbolic(
+            expression.position,
+            self.expand(operation),
+            tuple(map(self.expand, expression.arguments))
+        )
+
+    def _macro(self, name: str | None) -> Macro | None:
+        if name is None or name in self._shadowed:
+            return None
+
+        value = self._scope.value_or(name, None)
+        if not isinstance(value, Macro) or not value.cache_expansion:
+            return None
+
+        return value
+
+    def _expand_signature(self, signature: Expression.AnyExpression) -> Expression.AnyExpression:
+        # Argument lists are kept as is, bodies are expanded
+        if isinstance(signature, Expression.List):
+            return signature
+
+        if isinstance(signature, Expression.Symbolic) and isinstance(signature.operation, Expression.List):
+            return Expression.Symbolic(
+                signature.position,
+                signature.operation,
+                tuple(map(self.expand, signature.arguments))
+            )
+
+        return self.expand(signature)
+
+    def _expand_inlined(self, expression: Expression.AnyExpression) -> Expression.AnyExpression:
+        # Code templates are data: only the expressions inlined into them get evaluated
+        if isinstance(expression, Expression.List):
+            return Expression.List(expression.position, tuple(map(self._expand_inlined, expression.items)))
+
+        if not isinstance(expression, Expression.Symbolic):
+            return expression
+
+        if isinstance(expression.operation, Expression.Identifier) and expression.operation.name in _INLINE_FORMS:
+            return Expression.Symbolic(
+                expression.position,
+                expression.operation,
+                tuple(map(self.expand, expression.arguments))
+            )
+
+        return Expression.Symbolic(
+            expression.position,
+            self._expand_inlined(expression.operation),
+            tuple(map(self._expand_inlined, expression.arguments))
+        )
+
+
+def _reposition(
+        generated: Expression.AnyExpression,
+        call: Expression.Symbolic
+) -> Expression.AnyExpression:
+    """
+    Move the expressions a macro generated from its own code to the position of the macro call.
+
+    Expressions passed to the macro as arguments keep their positions.
+    """
+    arguments = {id(it) for it in call.arguments}
+
+    def reposition(expression: Expression.AnyExpression) -> Expression.AnyExpression:
+        if id(expression) in arguments:
+            return expression
+
+        if isinstance(expression, Expression.Symbolic):
+            return Expression.Symbolic(
+                call.position,
+                reposition(expression.operation),
+                tuple(map(reposition, expression.arguments))
+            )
+
+        if isinstance(expression, Expression.List):
+            return Expression.List(call.position, tuple(map(reposition, expression.items)))
+
+        if isinstance(expression, Expression.Literal):
+            return Expression.Literal(call.position, expression.value)
+
+        if isinstance(expression, Expression.Identifier):
+            return Expression.Identifier(call.position, expression.name)
+
+        if isinstance(expression, Expression.AttributeAccess):
+            return Expression.AttributeAccess(call.position, expression.name, expression.attributes)
+
+        return expression
+
+    return reposition(generated)
@@ -1,20 +1,16 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 from . import Expression
 from .errors import SpspInvalidBindingError
-from .evaluation import evaluate
-from .scope import Scope
-from .structural_binding import (
-    StructuralBindingTarget,
-    bind_structural,
-    is_variadic,
-    split_variadic_binding_target
-)
+from .evaluation import evaluate_expression, error_position_boundary
+from .scope import Scope, FrameLayout
+from .structural_binding import StructuralBindingTarget, BindingPlan, binding_plan
 
 __all__ = [
     'Function',
-    'Overload'
+    'Overload',
+    'Overloads'
 ]
 
 
@@ -22,31 +18,80 @@ __all__ = [
 class Overload:
     arguments: StructuralBindingTarget
     body: Expression.AnyExpression
+    layout: FrameLayout
+
+    plan: BindingPlan = field(init=False, compare=False)
+    variadic: bool = field(init=False)
+    # Number of arguments bound by position: the exact number of arguments accepted, unless variadic
+    arity: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        plan = binding_plan(self.arguments, self.layout)
+
+        object.__setattr__(self, 'plan', plan)
+        object.__setattr__(self, 'variadic', plan.variadic)
+        object.__setattr__(self, 'arity', plan.arity)
 
     def accepts(self, n_args: int) -> bool:
-        variadic = is_variadic(self.arguments)
+        return self.arity <= n_args if self.variadic else self.arity == n_args
+
+
+@dataclass(frozen=True, repr=False)
+class Overloads:
+    """
+    Overloads of a function, in order of declaration.
+
+    A call is dispatched to the first overload accepting the given number of arguments.
+    Overloads with a fixed number of arguments are looked up by it, variadic ones are
+    only checked for the numbers no fixed overload is chosen for.
+    """
+    overloads: tuple[Overload, ...]
 
-        if not variadic:
-            return len(self.arguments) == n_args
+    # Names bound in the frames of calls
+    names: frozenset[str] = field(init=False, compare=False)
 
-        arguments, _ = split_variadic_binding_target(self.arguments)
-        return len(arguments) <= n_args
+    _by_arity: dict[int, Overload] = field(init=False, compare=False)
+    _variadic: tuple[Overload, ...] = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        by_arity: dict[int, Overload] = {}
+        variadic: list[Overload] = []
+
+        for overload in self.overloads:
+            if overload.variadic:
+                # Variadic overloads are shadowed by earlier ones accepting fewer arguments
+                if all(overload.arity < it.arity for it in variadic):
+                    variadic.append(overload)
+            elif not any(it.accepts(overload.arity) for it in variadic):
+                by_arity.setdefault(overload.arity, overload)
+
+        object.__setattr__(self, 'names', frozenset(name for it in self.overloads for name in it.layout.names))
+        object.__setattr__(self, '_by_arity', by_arity)
+        object.__setattr__(self, '_variadic', tuple(variadic))
+
+    def select(self, n_args: int) -> Overload:
+        if (overload := self._by_arity.get(n_args)) is not None:
+            return overload
+
+        for overload in self._variadic:
+            if overload.arity <= n_args:
+                return overload
+
+        raise SpspInvalidBindingError(f'No suitable overload for {n_args} argument(s)')
 
 
 @dataclass(frozen=True, repr=False)
 class Function:
-    _overloads: tuple[Overload]
+    _overloads: Overloads
     _closure_scope: Scope
 
+    @error_position_boundary
     def __call__(self, *args: Any) -> Any:
-        overload = next((it for it in self._overloads if it.accepts(len(args))), None)
-
-        if overload is None:
-            raise SpspInvalidBindingError(f'No suitable overload for {len(args)} argument(s)')
+        overload = self._overloads.select(len(args))
 
-        local_scope = self._closure_scope.derive()
-        bind_structural(overload.arguments, args, mutable=False, scope=local_scope)
-        return evaluate(overload.body, local_scope)
+        local_scope = self._closure_scope.derive_frame(overload.layout)
+        overload.plan.bind(args, mutable=False, scope=local_scope)
+        return evaluate_expression(overload.body, local_scope)
 
     @property
     def __name__(self) -> str:
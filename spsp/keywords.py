@@ -1,7 +1,8 @@
 from enum import Enum
 
 __all__ = [
-    'Keyword'
+    'Keyword',
+    'KEYWORDS'
 ]
 
 
@@ -15,8 +16,17 @@ class Keyword(str, Enum):
     Let = 'let'
     Rebind = 'rebind'
 
+    Dynamic = 'dynamic'
+    Binding = 'binding'
+
     If = 'if'
 
+    And = 'and'
+    Or = 'or'
+
+    Cond = 'cond'
+    Case = 'case'
+
     ImportModule = 'import-module'
 
     Del = 'del'
@@ -24,6 +34,7 @@ class Keyword(str, Enum):
     Lambda = 'lambda'
 
     Macro = 'macro'
+    UncachedMacro = 'uncached!'
 
     Do = 'do'
 
@@ -42,4 +53,11 @@ class Keyword(str, Enum):
 
     RunCatching = 'run-catching'
 
+    Try = 'try'
+    Except = 'except'
+    Finally = 'finally'
+
     MakeLazy = 'make-lazy'
+
+
+KEYWORDS: frozenset[str] = frozenset(keyword.value for keyword in Keyword)
@@ -0,0 +1,127 @@
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable
+
+from .errors import SpspValueError
+from .lazy import Lazy
+
+__all__ = [
+    'LazySeq',
+    'CHUNK_SIZE',
+    'lazy_seq',
+    'take',
+    'drop',
+    'iterate',
+    'realize'
+]
+
+# Number of items computed at once
+CHUNK_SIZE = 32
+
+
+@dataclass(frozen=True, slots=True)
+class _Chunk:
+    items: tuple[Any, ...]
+    # Resolves to the next chunk, or None at the end of the sequence
+    rest: Lazy
+
+
+@dataclass(frozen=True, eq=False, repr=False, slots=True)
+class LazySeq:
+    """
+    An immutable, possibly unbounded sequence whose items are computed when they are first needed.
+
+    Items are computed `CHUNK_SIZE` at a time, each chunk exactly once, and are shared by every
+    iteration of the sequence and by the sequences dropping items from it. Iterating a sequence
+    only refers to the chunk being iterated: the items of a sequence nobody else refers to
+    are freed as they are consumed.
+    """
+    # Resolves to the first chunk, or None when the sequence is empty
+    _head: Lazy
+
+    def __iter__(self) -> Iterator[Any]:
+        return _items(self._head)
+
+
+def _items(head: Lazy) -> Iterator[Any]:
+    chunk = head.value
+    del head
+
+    while chunk is not None:
+        yield from chunk.items
+        chunk = chunk.rest.value
+
+
+def _chunks(iterator: Iterator[Any]) -> Lazy:
+    def next_chunk() -> _Chunk | None:
+        if not (items := tuple(islice(iterator, CHUNK_SIZE))):
+            return None
+
+        return _Chunk(items, _chunks(iterator))
+
+    return Lazy(next_chunk)
+
+
+def _head(items: Iterable[Any]) -> Lazy:
+    return items._head if isinstance(items, LazySeq) else _chunks(iter(items))
+
+
+def lazy_seq(source: Iterable[Any] | Callable[[], Iterable[Any]]) -> LazySeq:
+    """
+    The items of an iterable, or of the iterable returned by a function called when the first item is needed.
+    """
+    if isinstance(source, Iterable):
+        return source if isinstance(source, LazySeq) else LazySeq(_chunks(iter(source)))
+
+    return LazySeq(Lazy(lambda: _head(source())))
+
+
+def take(n: int, items: Iterable[Any]) -> LazySeq:
+    _check_count('take', n)
+    return LazySeq(_chunks(islice(items, n)))
+
+
+def drop(n: int, items: Iterable[Any]) -> LazySeq:
+    _check_count('drop', n)
+
+    if not isinstance(items, LazySeq):
+        return LazySeq(_chunks(islice(items, n, None)))
+
+    # The chunk to skip from and the number of items left to skip. Skipped chunks are not referred to,
+    # and the progress is kept if computing a chunk fails
+    state = [items._head, n]
+
+    def skip() -> _Chunk | None:
+        while (chunk := state[0].value) is not None and state[1] >= len(chunk.items):
+            state[0], state[1] = chunk.rest, state[1] - len(chunk.items)
+
+        if chunk is None or state[1] == 0:
+            return chunk
+
+        # The rest of a partially skipped chunk is shared with the sequence it comes from
+        return _Chunk(chunk.items[state[1]:], chunk.rest)
+
+    return LazySeq(Lazy(skip))
+
+
+def _check_count(name: str, n: int) -> None:
+    if not isinstance(n, int) or n < 0:
+        raise SpspValueError(f'"{name}" expected a non-negative number of items, got {n!r}')
+
+
+def iterate(f: Callable[[Any], Any], x: Any) -> LazySeq:
+    """
+    The unbounded sequence x, (f x), (f (f x)) ...
+    """
+    def items() -> Iterator[Any]:
+        value = x
+        while True:
+            yield value
+            value = f(value)
+
+    return LazySeq(_chunks(items()))
+
+
+def realize(items: Iterable[Any]) -> list[Any]:
+    return list(items)
@@ -0,0 +1,181 @@
+from dataclasses import replace
+
+from . import Expression
+from .binding_analysis import local_bindings_free, identifiers, try_form
+from .exception_handling import TryForm
+from .keywords import Keyword
+from .scope import FrameLayout
+from .structural_binding import StructuralBindingTarget
+
+__all__ = [
+    'frame_layout',
+    'resolve_locals'
+]
+
+# Scopes introduced between a function frame and the body of a nested lambda or macro:
+# the closure scope derived at creation time and the frame derived at call time
+NESTED_FUNCTION_DEPTH = 2
+
+
+def frame_layout(target: StructuralBindingTarget) -> FrameLayout:
+    names: list[str] = []
+
+    def collect(_target: StructuralBindingTarget) -> None:
+        for item in _target:
+            if isinstance(item, Expression.Identifier):
+                if item.name != Keyword.VariadicMarker:
+                    names.append(item.name)
+                continue
+
+            if isinstance(item, tuple):
+                collect(item)
+
+    collect(target)
+    return FrameLayout(tuple(names))
+
+
+def resolve_locals(body: Expression.AnyExpression, layout: FrameLayout) -> Expression.AnyExpression:
+    """
+    Replace identifiers referring to the arguments described by `layout` with `LocalIdentifier`s.
+
+    The depth of each reference counts the `do`, `try` and `binding` blocks that get a scope of their own,
+    exception handlers and nested lambdas/macros between the reference and the function frame.
+    The addresses are hints: macros, `eval!` and local bindings may change the shape
+    of the scope chain at runtime, in which case evaluation falls back to name lookup.
+    """
+    if not layout.names:
+        return body
+
+    return _resolve(body, layout, depth=0, shadowed=frozenset())
+
+
+def _resolve(
+        expression: Expression.AnyExpression,
+        layout: FrameLayout,
+        depth: int,
+        shadowed: frozenset[str]
+) -> Expression.AnyExpression:
+    if type(expression) is Expression.Identifier:
+        if (slot := layout.index.get(expression.name)) is None or expression.name in shadowed:
+            return expression
+
+        return Expression.LocalIdentifier(expression.position, expression.name, depth, slot, layout)
+
+    if isinstance(expression, Expression.List):
+        return Expression.List(
+            expression.position,
+            tuple(_resolve(it, layout, depth, shadowed) for it in expression.items)
+        )
+
+    if not isinstance(expression, Expression.Symbolic):
+        return expression
+
+    operation = expression.operation
+    name = operation.name if type(operation) is Expression.Identifier else None
+
+    if name == Keyword.Do:
+        # Blocks that introduce no bindings are evaluated in the enclosing scope
+        do_depth = depth if local_bindings_free(expression.arguments) is not None else depth + 1
+        return Expression.Symbolic(
+            expression.position,
+            operation,
+            tuple(_resolve(it, layout, do_depth, shadowed) for it in expression.arguments)
+        )
+
+    if name in (Keyword.Lambda, Keyword.Macro):
+        return Expression.Symbolic(
+            expression.position,
+            operation,
+            _resolve_signatures(expression.arguments, layout, depth + NESTED_FUNCTION_DEPTH, shadowed)
+        )
+
+    if name == Keyword.Try and (form := try_form(expression)) is not None:
+        return Expression.Symbolic(expression.position, operation, _resolve_try(form, layout, depth, shadowed))
+
+    if name == Keyword.Binding and len(expression.arguments) == 3:
+        # The names rebound are looked up by name, the body is a block
+        target, values, body = expression.arguments
+        return Expression.Symbolic(expression.position, operation, (
+            target,
+            _resolve(values, layout, depth, shadowed),
+            _resolve_block(body, layout, depth, shadowed)
+        ))
+
+    return Expression.Symbolic(
+        expression.position,
+        _resolve(operation, layout, depth, shadowed),
+        tuple(_resolve(it, layout, depth, shadowed) for it in expression.arguments)
+    )
+
+
+def _resolve_block(
+        expression: Expression.AnyExpression,
+        layout: FrameLayout,
+        depth: int,
+        shadowed: frozenset[str]
+) -> Expression.AnyExpression:
+    block_depth = depth if local_bindings_free((expression,)) is not None else depth + 1
+    return _resolve(expression, layout, block_depth, shadowed)
+
+
+def _resolve_try(
+        form: TryForm,
+        layout: FrameLayout,
+        depth: int,
+        shadowed: frozenset[str]
+) -> tuple[Expression.AnyExpression, ...]:
+    arguments = [_resolve_block(form.body, layout, depth, shadowed)]
+
+    for handler in form.handlers:
+        # Handlers are evaluated in a scope of their own, binding the exception
+        body = _resolve(handler.body, layout, depth + 1, shadowed | {handler.name.name})
+        if handler.types is None:
+            arguments.append(replace(handler.clause, arguments=(handler.name, body)))
+        else:
+            types = _resolve(handler.types, layout, depth, shadowed)
+            arguments.append(replace(handler.clause, arguments=(types, handler.name, body)))
+
+    if form.final_clause is not None:
+        final = _resolve_block(form.final, layout, depth, shadowed)
+        arguments.append(replace(form.final_clause, arguments=(final,)))
+
+    return tuple(arguments)
+
+
+def _resolve_signatures(
+        arguments: tuple[Expression.AnyExpression, ...],
+        layout: FrameLayout,
+        depth: int,
+        shadowed: frozenset[str]
+) -> tuple[Expression.AnyExpression, ...]:
+    def resolve_signature(
+            args_expression: Expression.AnyExpression,
+            body_expression: Expression.AnyExpression
+    ) -> Expression.AnyExpression:
+        # Arguments of the nested function shadow the outer ones
+        _shadowed = shadowed | {it.name for it in identifiers(args_expression)}
+
+        if _shadowed.issuperset(layout.names):
+            return body_expression
+
+        return _resolve(body_expression, layout, depth, _shadowed)
+
+    match arguments:
+        case (Expression.List() as args_expression, body_expression):
+            return args_expression, resolve_signature(args_expression, body_expression)
+
+    result = []
+    for signature in arguments:
+        match signature:
+            case Expression.Symbolic(operation=Expression.List() as args_expression, arguments=(body_expression,)):
+                result.append(Expression.Symbolic(
+                    signature.position,
+                    args_expression,
+                    (resolve_signature(args_expression, body_expression),)
+                ))
+            case _:
+                # Malformed signatures are reported by the special form itself
+                result.append(signature)
+
+    return tuple(result)
+
@@ -0,0 +1,82 @@
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+__all__ = [
+    'ListView'
+]
+
+
+class ListView(Sequence):
+    """
+    The items of a list from `start` on, without copying them.
+
+    Changes to the list show through the view. Like vectors, views compare equal to lists
+    with the same items and concatenate with lists using `+`.
+    """
+    __slots__ = ('_items', '_start')
+
+    _items: list[Any]
+    _start: int
+
+    def __new__(cls, items: 'list[Any] | ListView', start: int = 0) -> 'ListView':
+        if type(items) is ListView:
+            items, start = items._items, items._start + start
+        elif not isinstance(items, list):
+            raise TypeError(f'list view expected a list, got {type(items).__name__}')
+
+        if start < 0:
+            raise ValueError('list view start must not be negative')
+
+        view = object.__new__(cls)
+        view._items, view._start = items, start
+        return view
+
+    def rest(self) -> 'ListView':
+        """
+        The view without its first item, empty if there is none.
+        """
+        return ListView(self, 1)
+
+    def __len__(self) -> int:
+        return max(len(self._items) - self._start, 0)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and stop == len(self):
+                return ListView(self, start)
+
+            return [self._items[self._start + i] for i in range(start, stop, step)]
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('list index out of range')
+
+        return self._items[self._start + index]
+
+    def __iter__(self) -> Iterator[Any]:
+        return islice(self._items, self._start, None)
+
+    def __add__(self, other: Any) -> list[Any]:
+        if not isinstance(other, (ListView, list)):
+            return NotImplemented
+
+        return list(self) + list(other)
+
+    def __radd__(self, other: Any) -> list[Any]:
+        if not isinstance(other, list):
+            return NotImplemented
+
+        return other + list(self)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (ListView, list)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+
+from spsp import Expression
 from spsp.function import Function
 
 __all__ = [
@@ -5,5 +8,24 @@ __all__ = [
 ]
 
 
+@dataclass(frozen=True, repr=False)
 class Macro(Function):
-    pass
+    cache_expansion: bool = True
+
+    def expand(self, expression: Expression.Symbolic) -> Expression.AnyExpression:
+        """
+        Expand a call to this macro.
+
+        The expansion is generated once per call site and reused for as long as the call site
+        refers to this same macro. Macros whose expansion depends on state other than
+        their arguments opt out with `cache_expansion`.
+        """
+        if not self.cache_expansion:
+            return self(*expression.arguments)
+
+        if (cached := expression._cache.get('expansion')) is not None and cached[0] is self:
+            return cached[1]
+
+        generated = self(*expression.arguments)
+        expression._cache['expansion'] = self, generated
+        return generated
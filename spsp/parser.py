@@ -3,9 +3,12 @@ from typing import Iterable, Iterator, Type
 from . import Expression
 from . import Token
 from .errors import SpspSyntaxError
+from .special_symbols import SpecialSymbols
+from .tokenizer import string_literal
 
 __all__ = [
-    'parse'
+    'parse',
+    'unparse'
 ]
 
 
@@ -63,3 +66,24 @@ def _parse(
     if until is not None and not isinstance(token, until):
         assert token is not None
         raise SpspSyntaxError(token.position, f'Unexpected end of stream: expected {until.__name__} after {prev}')
+
+
+def unparse(expression: Expression.AnyExpression) -> str:
+    """
+    Code that parses back into `expression`.
+
+    Unlike `code`, which shows string literals as their plain value, string literals are quoted.
+    """
+    match expression:
+        case Expression.Literal(value=str() as value) | Expression.Folded(value=str() as value):
+            return string_literal(value)
+        case Expression.Symbolic(operation=operation, arguments=arguments):
+            return SpecialSymbols.LeftParenthesis \
+                + ' '.join(map(unparse, (operation,) + arguments)) \
+                + SpecialSymbols.RightParenthesis
+        case Expression.List(items=items):
+            return SpecialSymbols.LeftSquareBracket \
+                + ' '.join(map(unparse, items)) \
+                + SpecialSymbols.RightSquareBracket
+
+    return expression.code
@@ -0,0 +1,230 @@
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any
+
+__all__ = [
+    'PersistentVector'
+]
+
+BITS = 5
+# Number of children of a node of the trie, and of items of a leaf
+WIDTH = 1 << BITS
+MASK = WIDTH - 1
+
+
+class PersistentVector(Sequence):
+    """
+    An immutable sequence that makes new vectors with an item appended, an item prepended or the first item
+    removed while sharing the items of the original one.
+
+    Items are kept in a trie of tuples with up to 32 children per node, plus a tail of up to 32 last items
+    that are not in the trie yet: appending takes O(1) amortized time, indexed access O(log32 n).
+    Prepended items are kept in a front list, most recent last, and removing first items only
+    changes the number of items a vector sees.
+
+    The tail and the front are lists shared with the vectors made by appending and prepending to a vector:
+    a vector only sees the first items of such a list, the items after them belong to a vector
+    made from it. The list is copied when a vector that is not the last made from it adds an item.
+    """
+    __slots__ = ('_front', '_front_count', '_start', '_count', '_shift', '_root', '_tail')
+
+    # Prepended items, most recent last, and the number of them this vector sees
+    _front: list[Any]
+    _front_count: int
+    # Items of the trie and the tail before `_start` are not seen by this vector
+    _start: int
+    # Number of items in the trie and the tail
+    _count: int
+    # Level of the root of the trie: the index of the child of a node at level `l` holding the item `i`
+    # is `(i >> l) & MASK`, leaves are at level 0
+    _shift: int
+    _root: tuple
+    _tail: list[Any]
+
+    def __new__(cls, items: Iterable[Any] = ()) -> 'PersistentVector':
+        if type(items) is PersistentVector:
+            return items
+
+        iterator = iter(items)
+        root, shift, count = (), BITS, 0
+        tail = list(islice(iterator, WIDTH))
+
+        while len(tail) == WIDTH and (rest := list(islice(iterator, WIDTH))):
+            root, shift = _push_leaf(root, shift, count, tuple(tail))
+            count += WIDTH
+            tail = rest
+
+        return _vector([], 0, 0, count + len(tail), shift, root, tail)
+
+    def conj(self, item: Any) -> 'PersistentVector':
+        """
+        A vector with `item` appended. Unlike `list.append`, the vector itself does not change.
+        """
+        count, tail_offset = self._count, _tail_offset(self._count)
+
+        if count - tail_offset < WIDTH:
+            tail = _add(self._tail, count - tail_offset, item)
+            return _vector(self._front, self._front_count, self._start, count + 1, self._shift, self._root, tail)
+
+        root, shift = _push_leaf(self._root, self._shift, tail_offset, tuple(self._tail[:WIDTH]))
+        return _vector(self._front, self._front_count, self._start, count + 1, shift, root, [item])
+
+    def cons(self, item: Any) -> 'PersistentVector':
+        """
+        A vector with `item` prepended.
+        """
+        front = _add(self._front, self._front_count, item)
+        return _vector(front, self._front_count + 1, self._start, self._count, self._shift, self._root, self._tail)
+
+    def rest(self) -> 'PersistentVector':
+        """
+        The vector without its first item, empty if there is none.
+        """
+        return self._drop(1)
+
+    def __len__(self) -> int:
+        return self._front_count + self._count - self._start
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1 and stop == len(self):
+                return self._drop(start)
+
+            return PersistentVector(self[i] for i in range(start, stop, step))
+
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError('vector index out of range')
+
+        if index < self._front_count:
+            return self._front[self._front_count - 1 - index]
+
+        return self._item(index - self._front_count + self._start)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from reversed(self._front[:self._front_count])
+
+        tail_offset = _tail_offset(self._count)
+        for offset in range(self._start - (self._start & MASK), tail_offset, WIDTH):
+            leaf = self._leaf(offset)
+            yield from leaf if offset >= self._start else islice(leaf, self._start - offset, None)
+
+        yield from islice(self._tail, max(self._start - tail_offset, 0), self._count - tail_offset)
+
+    def __add__(self, other: Any) -> 'PersistentVector':
+        if not isinstance(other, (PersistentVector, list)):
+            return NotImplemented
+
+        result = self
+        for item in other:
+            result = result.conj(item)
+
+        return result
+
+    def __radd__(self, other: Any) -> 'PersistentVector':
+        if not isinstance(other, list):
+            return NotImplemented
+
+        result = self
+        for item in reversed(other):
+            result = result.cons(item)
+
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, (PersistentVector, list)):
+            return NotImplemented
+
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def _drop(self, n: int) -> 'PersistentVector':
+        n = min(n, len(self))
+        if n <= self._front_count:
+            return _vector(self._front, self._front_count - n, self._start, self._count, self._shift, self._root, self._tail)
+
+        start = self._start + n - self._front_count
+        return _vector(self._front, 0, start, self._count, self._shift, self._root, self._tail)
+
+    def _item(self, i: int) -> Any:
+        if i >= (tail_offset := _tail_offset(self._count)):
+            return self._tail[i - tail_offset]
+
+        return self._leaf(i)[i & MASK]
+
+    def _leaf(self, i: int) -> tuple:
+        node, level = self._root, self._shift
+        while level > 0:
+            node = node[(i >> level) & MASK]
+            level -= BITS
+
+        return node
+
+
+def _vector(
+        front: list[Any],
+        front_count: int,
+        start: int,
+        count: int,
+        shift: int,
+        root: tuple,
+        tail: list[Any]
+) -> PersistentVector:
+    vector = object.__new__(PersistentVector)
+    vector._front, vector._front_count, vector._start = front, front_count, start
+    vector._count, vector._shift, vector._root, vector._tail = count, shift, root, tail
+    return vector
+
+
+def _tail_offset(count: int) -> int:
+    """
+    Number of items in the trie of a vector of `count` items, the tail holds the others.
+    """
+    return 0 if count == 0 else ((count - 1) >> BITS) << BITS
+
+
+def _add(items: list[Any], count: int, item: Any) -> list[Any]:
+    """
+    A list starting with the first `count` items of `items`, followed by `item`.
+    """
+    if len(items) == count:
+        items.append(item)
+        # Another thread may have added an item to the same list meanwhile
+        if len(items) == count + 1:
+            return items
+
+    return items[:count] + [item]
+
+
+def _push_leaf(root: tuple, shift: int, offset: int, leaf: tuple) -> tuple[tuple, int]:
+    """
+    The root and the shift of a trie with `leaf` added as the items starting at `offset`.
+    """
+    if offset == 1 << (shift + BITS):
+        # The trie is full, it becomes the first child of a new root
+        return (root, _path(shift, leaf)), shift + BITS
+
+    return _insert(root, shift, offset, leaf), shift
+
+
+def _insert(node: tuple, level: int, offset: int, leaf: tuple) -> tuple:
+    if level == BITS:
+        return node + (leaf,)
+
+    index = (offset >> level) & MASK
+    if index < len(node):
+        return node[:index] + (_insert(node[index], level - BITS, offset, leaf),)
+
+    return node + (_path(level - BITS, leaf),)
+
+
+def _path(level: int, leaf: tuple) -> tuple:
+    """
+    A node at `level` whose only leaf is `leaf`.
+    """
+    return leaf if level == 0 else (_path(level - BITS, leaf),)
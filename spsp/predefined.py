@@ -7,6 +7,9 @@ from .errors import (
 )
 from .keywords import Keyword
 from .lazy import Lazy
+from .lazy_seq import lazy_seq, take, drop, iterate, realize
+from .list_view import ListView
+from .persistent_vector import PersistentVector
 
 __all__ = [
     'predefined'
@@ -72,6 +75,8 @@ def _run_catching(
         return body()
     except SpspEvaluationError as ex:
         return handler(ex.cause)
+    except Exception as ex:
+        return handler(ex)
     finally:
         _finally()
 
@@ -79,3 +84,13 @@ def _run_catching(
 @define(Keyword.MakeLazy)
 def _make_lazy(body: Callable[[], Any]) -> Any:
     return Lazy(body)
+
+
+define('lazy-seq', lazy_seq)
+define('take', take)
+define('drop', drop)
+define('iterate', iterate)
+define('realize', realize)
+
+define('vector', PersistentVector)
+define('list-view', ListView)
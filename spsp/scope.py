@@ -1,64 +1,149 @@
 from __future__ import annotations
 
 import importlib
+import itertools
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from functools import cache
 from types import ModuleType
 from typing import Any
 
+from .dynamic import DynamicVariable, current_value
 from .errors import (
     SpspNameError,
     SpspInvalidBindingTargetError
 )
-from .keywords import Keyword
+from .keywords import KEYWORDS
 from .predefined import predefined
 
 __all__ = [
-    'Scope'
+    'Scope',
+    'FrameLayout',
+    'UNBOUND'
 ]
 
 PYTHON_BUILTINS = 'builtins'
 
 NOT_FOUND = object()
 
+UNBOUND = object()
+
+# Versions are unique across root scopes: the same version means the same root, in the same state
+_versions = itertools.count()
+
+
+class _Globals:
+    """
+    State of a root scope shared with every scope derived from it.
+    """
+    __slots__ = ('module_cache', 'version', 'locally_bound')
+
+    def __init__(self) -> None:
+        self.module_cache: dict[str, ModuleType] = {PYTHON_BUILTINS: importlib.import_module(PYTHON_BUILTINS)}
+        # Changed whenever a name is bound or unbound in the root scope, or bound outside it for the first time
+        self.version: int = next(_versions)
+        # Names that were ever bound outside the root scope
+        self.locally_bound: set[str] = set()
+
+    def bump_version(self) -> None:
+        self.version = next(_versions)
+
+    def bound_locally(self, name: str) -> None:
+        if name not in self.locally_bound:
+            self.locally_bound.add(name)
+            self.bump_version()
+
 
 class BindingType(Enum):
     Constant = auto()
     Variable = auto()
 
 
-@dataclass(frozen=True)
-class Binding:
-    value: Any
-    type: BindingType
+@dataclass(frozen=True, eq=False)
+class FrameLayout:
+    """
+    Names of function arguments stored in fixed slots of a function call scope.
+
+    Layouts are compared by identity: each function overload owns exactly one.
+    """
+    names: tuple[str, ...]
+    index: dict[str, int] = field(init=False, repr=False)
+    # Names bound by storing values straight into their slots: binding any other name,
+    # like a keyword or a duplicate, goes through the checks of `Scope.bind`
+    direct: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, 'index', {name: slot for slot, name in enumerate(self.names)})
+        object.__setattr__(self, 'direct', frozenset(
+            name for name in self.names
+            if self.names.count(name) == 1
+            and name not in KEYWORDS
+            and name not in predefined()
+        ))
 
 
-@dataclass(frozen=True)
+@dataclass(eq=False, slots=True)
 class Scope:
-    _bindings: dict[str, Binding] = field(default_factory=lambda: {
-        name: Binding(value, BindingType.Constant)
-        for name, value in predefined().items()
-    }, hash=False)
-    _module_cache: dict[str, ModuleType] = field(default_factory=lambda: {
-        PYTHON_BUILTINS: importlib.import_module(PYTHON_BUILTINS)
-    }, hash=False)
+    # Names bound in this scope and their values; derived scopes allocate these on the first binding
+    _bindings: dict[str, Any] | None = field(default_factory=lambda: dict(predefined()))
+    # Names of the bindings above that cannot be rebound
+    _constants: set[str] | None = field(default_factory=lambda: set(predefined()))
+    _globals: _Globals = field(default_factory=_Globals)
 
     _outer: Scope | None = None
 
+    _layout: FrameLayout | None = None
+    _slots: list[Any] | None = None
+
+    def globals_version(self) -> int:
+        """
+        Version of the root scope's bindings, unique across root scopes.
+        """
+        return self._globals.version
+
+    def is_global(self, name: str) -> bool:
+        """
+        Whether `name` was never bound outside the root scope.
+
+        Such names refer to the same value in every scope derived from the root
+        for as long as `globals_version` stays the same.
+        """
+        return name not in self._globals.locally_bound
+
+    def bind_in_frames(self, names: frozenset[str]) -> None:
+        """
+        Note that `names` get bound in function frames derived from this scope.
+        """
+        if not names <= self._globals.locally_bound:
+            self._globals.locally_bound |= names
+            self._globals.bump_version()
+
+    def builtins_namespace(self, name: str) -> dict[str, Any] | None:
+        """
+        The namespace of Python builtins, provided `name` resolves to a builtin from this scope.
+        """
+        scope = self
+        while True:
+            if scope._bindings is not None and name in scope._bindings \
+                    or scope._layout is not None and name in scope._layout.index:
+                return None
+
+            if scope._outer is None:
+                break
+
+            scope = scope._outer
+
+        return namespace if name in (namespace := self._builtins.__dict__) else None
+
     @property
-    @cache
     def _builtins(self) -> ModuleType:
-        return self._module_cache[PYTHON_BUILTINS]
+        return self._globals.module_cache[PYTHON_BUILTINS]
 
     def import_module(self, module_name: str) -> ModuleType:
-        if (module := self._module_cache.get(module_name)) is not None:
-            return module
-
-        module = \
-            importlib.import_module(module_name) if self._outer is None else self._outer.import_module(module_name)
+        # The module cache is shared by all scopes derived from the same root
+        module_cache = self._globals.module_cache
+        if (module := module_cache.get(module_name)) is None:
+            module = module_cache[module_name] = importlib.import_module(module_name)
 
-        self._module_cache[module_name] = module
         return module
 
     @staticmethod
@@ -91,9 +176,137 @@ class Scope:
     def value(self, name: str) -> Any:
         return self._get_value(name)
 
+    def current_value(self, name: str) -> Any:
+        """
+        What `name` evaluates to: unlike `value`, the current value of a dynamic variable bound to it.
+        """
+        return current_value(self._get_value(name))
+
+    def value_or(self, name: str, default: Any) -> Any:
+        try:
+            return self._get_value(name)
+        except SpspNameError:
+            return default
+
+    def is_constant(self, name: str) -> bool:
+        if self._bindings is not None and name in self._bindings:
+            return self._constants is not None and name in self._constants
+
+        if self._layout is not None \
+                and (slot := self._layout.index.get(name)) is not None \
+                and self._slots[slot] is not UNBOUND:
+            return True
+
+        return self._outer is not None and self._outer.is_constant(name)
+
     def derive(self) -> Scope:
-        # return Scope(_outer=self._copy())
-        return Scope(_outer=self)
+        # Predefined names are bound in the root scope only
+        return Scope(None, None, self._globals, self)
+
+    def derive_frame(self, layout: FrameLayout) -> Scope:
+        return Scope(None, None, self._globals, self, layout, [UNBOUND] * len(layout.names))
+
+    def capture(self, names: tuple[str, ...], depth: int, layout: FrameLayout) -> Scope | None:
+        """
+        A scope binding the current values of `names` on top of the scope enclosing the function frame
+        `depth` scopes up, leaving the frame and the scopes in between out.
+
+        Returns `None` when the frame is not where it was expected or any of the names is not bound
+        in it or in the scopes in between.
+        """
+        if (frame := self._frame(depth, layout)) is None:
+            return None
+
+        bindings = {}
+        for name in names:
+            if (value := self._value_up_to(name, frame)) is NOT_FOUND:
+                return None
+
+            bindings[name] = value
+
+        return Scope(bindings or None, None, self._globals, frame._outer)
+
+    def frame_value_or(self, name: str, depth: int, layout: FrameLayout, default: Any) -> Any:
+        """
+        Value of `name` bound in the function frame `depth` scopes up or in the scopes in between,
+        `default` when the frame is not where it was expected or the name is not bound there.
+        """
+        if (frame := self._frame(depth, layout)) is None \
+                or (value := self._value_up_to(name, frame)) is NOT_FOUND:
+            return default
+
+        return value
+
+    def fixed_value_or(self, name: str, default: Any) -> Any:
+        """
+        Value of `name` when it cannot be rebound or unbound, `default` otherwise.
+
+        Only constants of the root scope, predefined names included, stay bound for good,
+        and only when no scope in between binds the same name.
+        """
+        scope = self
+        while scope._outer is not None:
+            if scope._bindings is not None and name in scope._bindings \
+                    or scope._layout is not None and name in scope._layout.index:
+                return default
+
+            scope = scope._outer
+
+        if scope._constants is not None and name in scope._constants:
+            return scope._bindings[name]
+
+        return default
+
+    def _frame(self, depth: int, layout: FrameLayout) -> Scope | None:
+        frame = self
+        for _ in range(depth):
+            if (frame := frame._outer) is None:
+                return None
+
+        return frame if frame._layout is layout else None
+
+    def _value_up_to(self, name: str, frame: Scope) -> Any:
+        scope = self
+        while True:
+            if scope._bindings is not None and (value := scope._bindings.get(name, NOT_FOUND)) is not NOT_FOUND:
+                return value
+
+            if scope._layout is not None \
+                    and (slot := scope._layout.index.get(name)) is not None \
+                    and (value := scope._slots[slot]) is not UNBOUND:
+                return value
+
+            if scope is frame:
+                return NOT_FOUND
+
+            scope = scope._outer
+
+    def bind_slot(self, slot: int, value: Any) -> None:
+        """
+        Bind a name in `FrameLayout.direct` of this frame's layout to `value`.
+        """
+        self._slots[slot] = value
+
+    def slot_value(self, name: str, depth: int, slot: int, layout: FrameLayout) -> Any:
+        """
+        What a function argument resolved to `slot` of the frame `depth` scopes up evaluates to.
+
+        Falls back to `current_value` when the frame is not where it was expected
+        or an intermediate scope binds the same name.
+        """
+        scope = self
+        for _ in range(depth):
+            if scope._bindings and name in scope._bindings \
+                    or scope._layout is not None and name in scope._layout.index:
+                return self.current_value(name)
+
+            if (scope := scope._outer) is None:
+                return self.current_value(name)
+
+        if scope._layout is layout and (value := scope._slots[slot]) is not UNBOUND:
+            return value if type(value) is not DynamicVariable else value.value
+
+        return self.current_value(name)
 
     def _bind_name(
             self,
@@ -101,17 +314,38 @@ class Scope:
             value: Any,
             binding_type: BindingType
     ) -> None:
-        if name in Keyword.__members__.values():
+        if name in KEYWORDS:
             raise SpspInvalidBindingTargetError(target=name, why='Cannot bind to keyword')
 
-        if (existing := self._bindings.get(name, NOT_FOUND)) is NOT_FOUND:
-            self._bindings[name] = Binding(value, binding_type)
-            return
+        # Predefined names are only stored in the root scope, but are constants everywhere
+        if self._outer is not None and name in predefined():
+            raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind constant')
+
+        if self._layout is not None and (slot := self._layout.index.get(name)) is not None:
+            if self._slots[slot] is not UNBOUND:
+                raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind constant')
+
+            if binding_type is BindingType.Constant:
+                self._slots[slot] = value
+                return
+
+        if self._outer is None:
+            self._globals.bump_version()
+        else:
+            self._globals.bound_locally(name)
 
-        if existing.type is BindingType.Constant:
+        if self._bindings is None:
+            self._bindings = {}
+
+        if self._constants is not None and name in self._constants:
             raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind constant')
 
-        self._bindings[name] = Binding(value, binding_type)
+        self._bindings[name] = value
+
+        if binding_type is BindingType.Constant:
+            if self._constants is None:
+                self._constants = set()
+            self._constants.add(name)
 
     def _rebind_name(
             self,
@@ -119,10 +353,15 @@ class Scope:
             value: Any,
             binding_type: BindingType
     ) -> None:
-        if name in Keyword.__members__.values():
+        if name in KEYWORDS:
             raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind to keyword')
 
-        if (existing := self._bindings.get(name, NOT_FOUND)) is NOT_FOUND:
+        if self._layout is not None \
+                and (slot := self._layout.index.get(name)) is not None \
+                and self._slots[slot] is not UNBOUND:
+            raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind constant')
+
+        if self._bindings is None or name not in self._bindings:
             if self._outer is not None:
                 return self._outer._rebind_name(name, value, binding_type)
 
@@ -131,23 +370,45 @@ class Scope:
 
             raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind undefined')
 
-        if existing.type is BindingType.Constant:
+        if self._constants is not None and name in self._constants:
             raise SpspInvalidBindingTargetError(target=name, why='Cannot rebind constant')
 
         self._bind_name(name, value, binding_type)
 
     def _unbind_value(self, name: str) -> None:
-        if name in Keyword.__members__.values():
+        if name in KEYWORDS:
             raise SpspInvalidBindingTargetError(target=name, why='Cannot unbind keyword')
 
         if name in predefined():
             raise SpspInvalidBindingTargetError(target=name, why='Cannot unbind predefined')
 
-        self._bindings.pop(name, None)
+        if self._layout is not None \
+                and (slot := self._layout.index.get(name)) is not None \
+                and self._slots[slot] is not UNBOUND:
+            self._slots[slot] = UNBOUND
+            return
+
+        # Constants of a root scope may be folded into code ahead of evaluation, so they stay bound for good
+        if self._outer is None and self._constants is not None and name in self._constants:
+            raise SpspInvalidBindingTargetError(target=name, why='Cannot unbind constant')
+
+        if self._bindings is None or self._bindings.pop(name, NOT_FOUND) is NOT_FOUND:
+            return
+
+        if self._constants is not None:
+            self._constants.discard(name)
+
+        if self._outer is None:
+            self._globals.bump_version()
 
     def _get_value(self, name: str) -> Any:
-        if (identifier := self._bindings.get(name, NOT_FOUND)) is not NOT_FOUND:
-            return identifier.value
+        if self._bindings is not None and (value := self._bindings.get(name, NOT_FOUND)) is not NOT_FOUND:
+            return value
+
+        if self._layout is not None \
+                and (slot := self._layout.index.get(name)) is not None \
+                and (value := self._slots[slot]) is not UNBOUND:
+            return value
 
         if self._outer is not None:
             return self._outer._get_value(name)
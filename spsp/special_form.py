@@ -9,10 +9,11 @@ __all__ = [
     'special_form',
     'special_forms',
     'fixed_arguments_count',
+    'at_least_arguments_count',
     'variadic'
 ]
 
-SpecialFormEvaluationRule: TypeAlias = Callable[[tuple[Expression.AnyExpression, ...], Scope], Any]
+SpecialFormEvaluationRule: TypeAlias = Callable[[tuple[Expression.AnyExpression, ...], Scope, dict[str, Any]], Any]
 _special_forms: dict[str, SpecialFormEvaluationRule] = {}
 
 special_forms: Mapping[str, SpecialFormEvaluationRule] = _special_forms
@@ -22,13 +23,23 @@ ArityCheck: TypeAlias = Callable[[str, int], None]
 
 def special_form(
         name: str,
-        arity_check: ArityCheck) -> Callable[[SpecialFormEvaluationRule], SpecialFormEvaluationRule]:
-    def decorator(_evaluator: SpecialFormEvaluationRule) -> SpecialFormEvaluationRule:
+        arity_check: ArityCheck,
+        cached: bool = False) -> Callable[[Callable[..., Any]], SpecialFormEvaluationRule]:
+    """
+    Register a special form.
+
+    When `cached` is set, the evaluator receives a third argument: a dict private to the
+    symbolic expression being evaluated, for data derived from the arguments once.
+    """
+    def decorator(_evaluator: Callable[..., Any]) -> SpecialFormEvaluationRule:
         def _evaluator_with_arity_check(
                 arguments: tuple[Expression.AnyExpression, ...],
-                scope: Scope
+                scope: Scope,
+                cache: dict[str, Any]
         ) -> Any:
             arity_check(name, len(arguments))
+            if cached:
+                return _evaluator(arguments, scope, cache)
             return _evaluator(arguments, scope)
 
         _special_forms[name] = _evaluator_with_arity_check
@@ -47,5 +58,15 @@ def fixed_arguments_count(arguments_count: int) -> Callable[[str, int], None]:
     return _validate
 
 
+def at_least_arguments_count(arguments_count: int) -> Callable[[str, int], None]:
+    def _validate(name: str, n_args: int) -> None:
+        if arguments_count <= n_args:
+            return
+
+        raise SpspArityError(name, actual=n_args)
+
+    return _validate
+
+
 def variadic() -> Callable[[str, int], None]:
     return lambda *_: None
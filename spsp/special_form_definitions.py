@@ -1,63 +1,175 @@
+import weakref
+from contextvars import Token
+from dataclasses import replace
 from typing import Any, Callable
 
 from . import Expression
 from .attribute_utility import set_attribute_value, get_attribute_value, delete_attribute_value
-from .errors import SpspInvalidBindingTargetError, SpspValueError, SpspArityError
-from .evaluation import evaluate
-from .function import Function, Overload
+from .binding_analysis import local_bindings_free
+from .closure_analysis import Capture, CAPTURE, annotate_closures
+from .dynamic import DynamicVariable
+from .errors import SpspInvalidBindingTargetError, SpspValueError, SpspArityError, SpspEvaluationError
+from .evaluation import evaluate_expression
+from .exception_handling import TryForm, ExceptClause, parse_try_form
+from .function import Function, Overload, Overloads
 from .keywords import Keyword
+from .lexical_addressing import frame_layout, resolve_locals
 from .macro import Macro
-from .scope import Scope
-from .special_form import special_form, fixed_arguments_count, variadic
-from .structural_binding import parse_structural_binding_target, bind_structural, rebind_structural
+from .scope import Scope, UNBOUND
+from .special_form import special_form, fixed_arguments_count, at_least_arguments_count, variadic
+from .structural_binding import (
+    StructuralBindingTarget,
+    parse_structural_binding_target,
+    binding_plan
+)
 
 __all__ = []
 
+NOT_FOUND = object()
+
 
 @special_form(Keyword.If, fixed_arguments_count(3))
 def _if(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
     condition, when_true, when_false = arguments
 
-    if evaluate(condition, scope, force_eval_lazy=True):
-        return evaluate(when_true, scope)
+    if evaluate_expression(condition, scope, force_eval_lazy=True):
+        return evaluate_expression(when_true, scope)
+
+    return evaluate_expression(when_false, scope)
+
+
+@special_form(Keyword.And, at_least_arguments_count(1))
+def _and(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    # Operands are evaluated left to right until one is false, the result is always a bool
+    for operand in arguments:
+        if not evaluate_expression(operand, scope, force_eval_lazy=True):
+            return False
+
+    return True
+
+
+@special_form(Keyword.Or, at_least_arguments_count(1))
+def _or(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    # Operands are evaluated left to right until one is true, the result is the last operand evaluated.
+    # Lazy operands are forced, the last one included, like the std-lib macro did
+    *operands, last = arguments
+
+    for operand in operands:
+        if result := evaluate_expression(operand, scope, force_eval_lazy=True):
+            return result
+
+    return evaluate_expression(last, scope, force_eval_lazy=True)
+
+
+@special_form(Keyword.Cond, variadic())
+def _cond(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    # (cond condition branch ... [default]): the branch of the first true condition, the default or None
+    for i in range(0, len(arguments) - 1, 2):
+        if evaluate_expression(arguments[i], scope, force_eval_lazy=True):
+            return evaluate_expression(arguments[i + 1], scope)
+
+    if len(arguments) % 2:
+        return evaluate_expression(arguments[-1], scope)
+
+    return None
+
 
-    return evaluate(when_false, scope)
+@special_form(Keyword.Case, at_least_arguments_count(1), cached=True)
+def _case(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    # (case value key branch ... [default]): the branch of the key equal to the value, the default or None.
+    # Keys are literals or lists of literals matching any of them, branches are looked up by hash
+    if (dispatch := cache.get(Keyword.Case)) is None:
+        dispatch = cache[Keyword.Case] = _case_dispatch(arguments[1:])
 
+    branches, default = dispatch
+    value = evaluate_expression(arguments[0], scope, force_eval_lazy=True)
 
-@special_form(Keyword.Let, fixed_arguments_count(2))
-def _let(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    try:
+        branch = branches.get(value, default)
+    except TypeError:
+        # Unhashable values are not equal to any of the keys
+        branch = default
+
+    return None if branch is None else evaluate_expression(branch, scope)
+
+
+def _case_dispatch(
+        clauses: tuple[Expression.AnyExpression, ...]
+) -> tuple[dict[Any, Expression.AnyExpression], Expression.AnyExpression | None]:
+    branches: dict[Any, Expression.AnyExpression] = {}
+
+    for i in range(0, len(clauses) - 1, 2):
+        key, branch = clauses[i], clauses[i + 1]
+        keys = key.items if isinstance(key, Expression.List) else (key,)
+
+        for it in keys:
+            if not isinstance(it, Expression.Literal):
+                raise SpspValueError(f'"{Keyword.Case}" keys should be literals or lists of literals, got {key.code}')
+
+            # The first branch of a repeated key is taken, as if the keys were checked in order
+            branches.setdefault(it.value, branch)
+
+    return branches, clauses[-1] if len(clauses) % 2 else None
+
+
+@special_form(Keyword.Let, fixed_arguments_count(2), cached=True)
+def _let(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
     target_expression, value_expression = arguments
 
     if isinstance(target_expression, Expression.Identifier):
-        value = evaluate(value_expression, scope)
+        value = evaluate_expression(value_expression, scope)
         scope.let(target_expression.name, value)
         return value
 
     if isinstance(target_expression, Expression.AttributeAccess):
-        value = evaluate(value_expression, scope)
+        value = evaluate_expression(value_expression, scope)
         set_attribute_value(
-            get_attribute_value(scope.value(target_expression.name), target_expression.attributes[:-1]),
+            get_attribute_value(scope.current_value(target_expression.name), target_expression.attributes[:-1]),
             target_expression.attributes[-1],
             value,
         )
         return value
 
     if isinstance(target_expression, Expression.List):
-        value = evaluate(value_expression, scope)
-        target = parse_structural_binding_target(target_expression)
+        value = evaluate_expression(value_expression, scope)
+        if (plan := cache.get(Keyword.Let)) is None:
+            plan = cache[Keyword.Let] = binding_plan(parse_structural_binding_target(target_expression))
 
-        bind_structural(target, value, mutable=True, scope=scope)
+        plan.bind(value, mutable=True, scope=scope)
         return value
 
     raise SpspInvalidBindingTargetError(target_expression)
 
 
-@special_form(Keyword.Rebind, fixed_arguments_count(2))
-def _rebind(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+@special_form(Keyword.Const, fixed_arguments_count(2), cached=True)
+def _const(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
     target_expression, value_expression = arguments
 
     if isinstance(target_expression, Expression.Identifier):
-        value = evaluate(value_expression, scope)
+        value = evaluate_expression(value_expression, scope)
+        scope.const(target_expression.name, value)
+        return value
+
+    if isinstance(target_expression, Expression.AttributeAccess):
+        raise SpspInvalidBindingTargetError(target_expression, f'Use "{Keyword.Let}" to change attribute values')
+
+    if isinstance(target_expression, Expression.List):
+        value = evaluate_expression(value_expression, scope)
+        if (plan := cache.get(Keyword.Const)) is None:
+            plan = cache[Keyword.Const] = binding_plan(parse_structural_binding_target(target_expression, allow_attributes=False))
+
+        plan.bind(value, mutable=False, scope=scope)
+        return value
+
+    raise SpspInvalidBindingTargetError(target_expression)
+
+
+@special_form(Keyword.Rebind, fixed_arguments_count(2), cached=True)
+def _rebind(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    target_expression, value_expression = arguments
+
+    if isinstance(target_expression, Expression.Identifier):
+        value = evaluate_expression(value_expression, scope)
         scope.rebind(target_expression.name, value, mutable=True)
         return value
 
@@ -65,15 +177,31 @@ def _rebind(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> An
         raise SpspInvalidBindingTargetError(target_expression, f'Use "{Keyword.Let}" to change attribute values')
 
     if isinstance(target_expression, Expression.List):
-        value = evaluate(value_expression, scope)
-        target_expression = parse_structural_binding_target(target_expression, allow_attributes=False)
+        value = evaluate_expression(value_expression, scope)
+        if (plan := cache.get(Keyword.Rebind)) is None:
+            plan = cache[Keyword.Rebind] = binding_plan(
+                parse_structural_binding_target(target_expression, allow_attributes=False)
+            )
 
-        rebind_structural(target_expression, value, mutable=True, scope=scope)
+        plan.rebind(value, mutable=True, scope=scope)
         return value
 
     raise SpspInvalidBindingTargetError(target_expression)
 
 
+@special_form(Keyword.Dynamic, fixed_arguments_count(2))
+def _dynamic(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    target_expression, value_expression = arguments
+
+    if not isinstance(target_expression, Expression.Identifier):
+        raise SpspInvalidBindingTargetError(target_expression, 'Dynamic variables should be identifiers')
+
+    # The name refers to the variable for good, its value can only be changed with `binding`
+    value = evaluate_expression(value_expression, scope)
+    scope.const(target_expression.name, DynamicVariable.declare(target_expression.name, value))
+    return value
+
+
 @special_form(Keyword.Del, fixed_arguments_count(1))
 def _del(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
     target, = arguments
@@ -84,7 +212,7 @@ def _del(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
 
     if isinstance(target, Expression.AttributeAccess):
         delete_attribute_value(
-            get_attribute_value(scope.value(target.name), target.attributes[:-1]),
+            get_attribute_value(scope.current_value(target.name), target.attributes[:-1]),
             target.attributes[-1]
         )
         return
@@ -110,8 +238,56 @@ def collect_overloads(
     return tuple(overloads)
 
 
-@special_form(Keyword.Lambda, variadic())
-def _lambda(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+def make_overload(args: StructuralBindingTarget, body_expression: Expression.AnyExpression) -> Overload:
+    layout = frame_layout(args)
+    body = resolve_locals(body_expression, layout)
+    annotate_closures(body, layout)
+    return Overload(args, body, layout)
+
+
+def make_closure(closure_type: type[Function], overloads: Overloads, scope: Scope, cache: dict[str, Any]) -> Function:
+    """
+    A lambda or macro created in `scope`.
+
+    Closures created in a function body capture only the values they use from the scopes of that body,
+    unless a call in the body may turn out to be a macro call: the operations it calls have to be bound
+    for good to functions that are not macros.
+    """
+    capture: Capture | None = cache.get(CAPTURE)
+
+    scope.bind_in_frames(overloads.names)
+
+    if capture is None \
+            or any(_may_be_macro(scope.fixed_value_or(it, UNBOUND)) for it in capture.operations) \
+            or any(_may_be_macro(scope.frame_value_or(it, capture.depth, capture.layout, UNBOUND))
+                   for it in capture.local_operations) \
+            or (captured := scope.capture(capture.names, capture.depth, capture.layout)) is None:
+        return closure_type(overloads, scope.derive())
+
+    closure = closure_type(overloads, captured)
+
+    if capture.recursive is not None:
+        # A strong reference would make the closure and the scope it is bound in a reference cycle
+        captured.const(capture.recursive, weakref.proxy(closure))
+
+    return closure
+
+
+def _may_be_macro(value: Any) -> bool:
+    # The value of a dynamic variable depends on the context the closure is called in
+    return value is UNBOUND or isinstance(value, (Macro, DynamicVariable))
+
+
+@special_form(Keyword.Lambda, variadic(), cached=True)
+def _lambda(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    # Signatures are parsed once per expression: creating a closure only allocates the function
+    if (overloads := cache.get(Keyword.Lambda)) is None:
+        overloads = cache[Keyword.Lambda] = _lambda_overloads(arguments)
+
+    return make_closure(Function, overloads, scope, cache)
+
+
+def _lambda_overloads(arguments: tuple[Expression.AnyExpression, ...]) -> Overloads:
     def parse_signature(signature: Expression.AnyExpression) -> Overload:
         match signature:
             case Expression.Symbolic(position=_, operation=Expression.List(), arguments=(_, )):
@@ -119,7 +295,7 @@ def _lambda(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> An
                 _args_expression, _body_expression = tuple(signature)
 
                 _args = parse_structural_binding_target(_args_expression, allow_attributes=False)
-                return Overload(_args, _body_expression)
+                return make_overload(_args, _body_expression)
             case _:
                 raise SpspValueError(
                     f'"{Keyword.Lambda}": use ({Keyword.Lambda} <args-list> <body>) '
@@ -132,40 +308,185 @@ def _lambda(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> An
             args_expression: Expression.List
 
             args = parse_structural_binding_target(args_expression, allow_attributes=False)
-            return Function((Overload(args, body_expression),), scope.derive())
+            return Overloads((make_overload(args, body_expression),))
 
-    return Function(
-        tuple(map(parse_signature, arguments)),
-        scope.derive()
-    )
+    return Overloads(tuple(map(parse_signature, arguments)))
 
 
-@special_form(Keyword.Do, variadic())
-def _do(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
-    local_scope = scope.derive()
+@special_form(Keyword.Do, variadic(), cached=True)
+def _do(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    if (operations := cache.get(Keyword.Do, NOT_FOUND)) is NOT_FOUND:
+        operations = cache[Keyword.Do] = local_bindings_free(arguments)
+
+    scope = block_scope(scope, operations, cache, 'do-scope')
 
     result = None
-    for result in (evaluate(it, local_scope) for it in arguments):
-        pass
+    for it in arguments:
+        result = evaluate_expression(it, scope)
 
     return result
 
 
-@special_form(Keyword.Expression, fixed_arguments_count(1))
-def _as_code(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+def block_scope(scope: Scope, operations: frozenset[str] | None, cache: dict[str, Any], key: str) -> Scope:
+    """
+    The scope to evaluate a block in, given the result of `local_bindings_free` for the block.
+
+    Whether any global operation name refers to a macro, or to a dynamic variable that may hold one,
+    is cached under `key` for as long as `globals_version` stays the same.
+    """
+    if operations is None:
+        return scope.derive()
+
+    if not operations:
+        return scope
+
+    if (checked := cache.get(key)) is None or checked[0] != scope.globals_version():
+        checked = cache[key] = (
+            scope.globals_version(),
+            any(
+                isinstance(scope.value_or(it, None), (Macro, DynamicVariable))
+                for it in operations if scope.is_global(it)
+            ),
+            tuple(it for it in operations if not scope.is_global(it))
+        )
+
+    # A block that cannot bind names does not need a scope of its own
+    if checked[1] or checked[2] and any(
+            isinstance(scope.value_or(it, None), (Macro, DynamicVariable)) for it in checked[2]
+    ):
+        return scope.derive()
+
+    return scope
+
+
+@special_form(Keyword.Try, at_least_arguments_count(2), cached=True)
+def _try(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    if (parsed := cache.get(Keyword.Try)) is None:
+        form = parse_try_form(arguments)
+        parsed = cache[Keyword.Try] = (
+            form,
+            local_bindings_free((form.body,)),
+            None if form.final is None else local_bindings_free((form.final,))
+        )
+
+    form, body_operations, final_operations = parsed
+
+    try:
+        return evaluate_expression(form.body, block_scope(scope, body_operations, cache, 'body-scope'))
+    except Exception as e:
+        # Errors reported from nested top level evaluation are handled by their cause, like in `run-catching`
+        if (result := _handle(form, e.cause if isinstance(e, SpspEvaluationError) else e, scope)) is NOT_FOUND:
+            raise
+
+        return result
+    finally:
+        if form.final is not None:
+            evaluate_expression(form.final, block_scope(scope, final_operations, cache, 'final-scope'))
+
+
+def _handle(form: TryForm, exception: Exception, scope: Scope) -> Any:
+    """
+    Result of the first handler of `exception` in `form`, or `NOT_FOUND` when there is none.
+    """
+    for handler in form.handlers:
+        if handler.types is not None and not isinstance(exception, _exception_types(handler, scope)):
+            continue
+
+        handler_scope = scope.derive()
+        handler_scope.const(handler.name.name, exception)
+        return evaluate_expression(handler.body, handler_scope)
+
+    return NOT_FOUND
+
+
+def _exception_types(handler: ExceptClause, scope: Scope) -> type | tuple[type, ...]:
+    types = evaluate_expression(handler.types, scope, force_eval_lazy=True)
+    return tuple(types) if isinstance(types, list) else types
+
+
+@special_form(Keyword.Binding, fixed_arguments_count(3), cached=True)
+def _binding(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    # (binding target values body): body evaluated with the names of target bound to values
+    target_expression, values_expression, body = arguments
+
+    if (parsed := cache.get(Keyword.Binding)) is None:
+        if isinstance(target_expression, Expression.Identifier):
+            plan = None
+        elif isinstance(target_expression, Expression.List):
+            plan = binding_plan(parse_structural_binding_target(target_expression, allow_attributes=False))
+        else:
+            raise SpspInvalidBindingTargetError(target_expression)
+
+        parsed = cache[Keyword.Binding] = plan, local_bindings_free((body,))
+
+    plan, body_operations = parsed
+    values = evaluate_expression(values_expression, scope)
+
+    if plan is None:
+        overrides = [(target_expression.name, values)]
+    else:
+        plan.rebind(values, mutable=True, scope=(collected := _Overrides()))
+        overrides = collected.values
+
+    saved: list[tuple[str, Any, Token | None]] = []
+    try:
+        for name, value in overrides:
+            variable = scope.value(name)
+
+            if type(variable) is DynamicVariable:
+                # Overrides of dynamic variables are only seen by the current thread or task
+                saved.append((name, variable, variable.override(value)))
+            else:
+                # Other variables are rebound, for everyone, until the body is evaluated
+                scope.rebind(name, value, mutable=True)
+                saved.append((name, variable, None))
+
+        return evaluate_expression(body, block_scope(scope, body_operations, cache, 'body-scope'))
+    finally:
+        for name, variable, token in reversed(saved):
+            if token is None:
+                scope.rebind(name, variable, mutable=True)
+            else:
+                variable.restore(token)
+
+
+class _Overrides:
+    """
+    The names and values a structural binding plan would rebind, in order.
+    """
+    def __init__(self) -> None:
+        self.values: list[tuple[str, Any]] = []
+
+    def rebind(self, name: str, value: Any, mutable: bool) -> None:
+        self.values.append((name, value))
+
+
+_INLINE_FORMS = (Keyword.InlineLiteral, Keyword.Inline)
+
+
+@special_form(Keyword.Expression, fixed_arguments_count(1), cached=True)
+def _as_code(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
     expr, = arguments
 
+    # Parts without inlined values are the same on every evaluation: they are returned as is,
+    # so that evaluating them again reuses everything cached in their nodes
+    if (templated := cache.get(Keyword.Expression)) is None:
+        templated = cache[Keyword.Expression] = _templated_nodes(expr)
+
     def preprocess(_expr: Expression.AnyExpression) -> Expression.AnyExpression:
+        if id(_expr) not in templated:
+            return _expr
+
         if isinstance(_expr, Expression.Symbolic) \
                 and isinstance(_expr.operation, Expression.Identifier) \
-                and _expr.operation.name in (Keyword.InlineLiteral, Keyword.Inline):
+                and _expr.operation.name in _INLINE_FORMS:
             if len(_expr.arguments) != 1:
                 raise SpspArityError(_expr.operation.name, expected=1, actual=len(_expr.arguments))
 
             if _expr.operation.name == Keyword.Inline:
-                return evaluate(_expr.arguments[0], scope)
+                return evaluate_expression(_expr.arguments[0], scope)
 
-            return Expression.Literal(_expr.position, evaluate(_expr.arguments[0], scope))
+            return Expression.Literal(_expr.position, evaluate_expression(_expr.arguments[0], scope))
 
         if isinstance(_expr, Expression.Symbolic):
             return Expression.Symbolic(
@@ -182,15 +503,47 @@ def _as_code(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> A
     return ast
 
 
+def _templated_nodes(expr: Expression.AnyExpression) -> frozenset[int]:
+    """
+    Identities of the nodes of an `expr!` template containing values to inline.
+    """
+    templated: set[int] = set()
+
+    def visit(_expr: Expression.AnyExpression) -> bool:
+        if isinstance(_expr, Expression.Symbolic):
+            if isinstance(_expr.operation, Expression.Identifier) and _expr.operation.name in _INLINE_FORMS:
+                inlined = True
+            else:
+                inlined = any([visit(_expr.operation), *map(visit, _expr.arguments)])
+        elif isinstance(_expr, Expression.List):
+            inlined = any([*map(visit, _expr.items)])
+        else:
+            inlined = False
+
+        if inlined:
+            templated.add(id(_expr))
+        return inlined
+
+    visit(expr)
+    return frozenset(templated)
+
+
 @special_form(Keyword.EvaluateExpression, fixed_arguments_count(1))
 def _eval(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
     expr, = arguments
 
-    return evaluate(evaluate(expr, scope), scope)
+    return evaluate_expression(evaluate_expression(expr, scope), scope)
+
+
+@special_form(Keyword.Macro, variadic(), cached=True)
+def _macro(arguments: tuple[Expression.AnyExpression, ...], scope: Scope, cache: dict[str, Any]) -> Any:
+    if (overloads := cache.get(Keyword.Macro)) is None:
+        overloads = cache[Keyword.Macro] = _macro_overloads(arguments)
 
+    return make_closure(Macro, overloads, scope, cache)
 
-@special_form(Keyword.Macro, variadic())
-def _macro(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+
+def _macro_overloads(arguments: tuple[Expression.AnyExpression, ...]) -> Overloads:
     def parse_signature(signature: Expression.AnyExpression) -> Overload:
         match signature:
             case Expression.Symbolic(position=_, operation=Expression.List(), arguments=(_, )):
@@ -198,7 +551,7 @@ def _macro(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any
                 _args_expression, _body_expression = tuple(signature)
 
                 _args = parse_structural_binding_target(_args_expression, allow_attributes=False, allow_nested=False)
-                return Overload(_args, _body_expression)
+                return make_overload(_args, _body_expression)
             case _:
                 raise SpspValueError(
                     f'"{Keyword.Macro}": use ({Keyword.Macro} <args-list> <body>) '
@@ -211,17 +564,25 @@ def _macro(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any
             args_expression: Expression.List
 
             args = parse_structural_binding_target(args_expression, allow_attributes=False, allow_nested=False)
-            return Macro((Overload(args, body_expression),), scope.derive())
+            return Overloads((make_overload(args, body_expression),))
+
+    return Overloads(tuple(map(parse_signature, arguments)))
+
+
+@special_form(Keyword.UncachedMacro, fixed_arguments_count(1))
+def _uncached_macro(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
+    expr, = arguments
+    macro = evaluate_expression(expr, scope, force_eval_lazy=True)
+
+    if not isinstance(macro, Macro):
+        raise SpspValueError(f'"{Keyword.UncachedMacro}" expected a macro')
 
-    return Macro(
-        tuple(map(parse_signature, arguments)),
-        scope.derive()
-    )
+    return replace(macro, cache_expansion=False)
 
 
 @special_form(Keyword.Symbolic, fixed_arguments_count(1))
 def _symbolic(arguments: tuple[Expression.AnyExpression, ...], scope: Scope) -> Any:
     expr, = arguments
-    items = evaluate(expr, scope)
+    items = evaluate_expression(expr, scope)
     op, args = items[0], items[1:]
     return Expression.Symbolic(expr.position, op, tuple(args))
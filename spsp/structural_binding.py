@@ -1,20 +1,28 @@
-from typing import Collection, Any, TypeAlias, Union
+from dataclasses import dataclass
+from enum import Enum, auto
+from collections.abc import Iterable, Sequence, Sized
+from itertools import islice
+from typing import Any, TypeAlias, Union
 
 from . import Expression
 from .attribute_utility import set_attribute_value, get_attribute_value
 from .errors import SpspValueError, SpspInvalidBindingTargetError, SpspInvalidBindingError
 from .keywords import Keyword
-from .scope import Scope
+from .scope import Scope, FrameLayout
 
 __all__ = [
     'StructuralBindingTarget',
+    'BindingPlan',
     'parse_structural_binding_target',
+    'binding_plan',
     'bind_structural',
     'rebind_structural',
     'is_variadic',
     'split_variadic_binding_target'
 ]
 
+_EXHAUSTED = object()
+
 StructuralBindingTarget: TypeAlias = \
     tuple[Union['StructuralBindingTarget', Expression.Identifier, Expression.AttributeAccess], ...]
 
@@ -50,85 +58,172 @@ def parse_structural_binding_target(
     return tuple(result)
 
 
-def bind_structural(
-        bind_target: StructuralBindingTarget,
-        values: Collection[Any],
-        mutable: bool,
-        scope: Scope
-) -> None:
-    rest: Expression.Identifier | None = None
-    variadic = is_variadic(bind_target)
-
-    if variadic:
-        bind_target, rest = split_variadic_binding_target(bind_target)
+class _Step(Enum):
+    Name = auto()
+    Slot = auto()
+    Attribute = auto()
+    Nested = auto()
+
+
+@dataclass(frozen=True, repr=False)
+class BindingPlan:
+    """
+    A structural binding target compiled for binding values to it repeatedly.
+
+    Each step binds the value at the same position: to a name, straight to a function frame slot,
+    to an attribute or, for nested targets, according to a nested plan.
+    """
+    target: StructuralBindingTarget
+    steps: tuple[tuple[_Step, Any], ...]
+    rest: tuple[_Step, Any] | None
+
+    @property
+    def arity(self) -> int:
+        return len(self.steps)
+
+    @property
+    def variadic(self) -> bool:
+        return self.rest is not None
+
+    def bind(self, values: Iterable[Any], mutable: bool, scope: Scope) -> None:
+        # Most function calls pass exactly the arguments declared
+        if type(values) is tuple and self.rest is None and len(values) == len(self.steps):
+            rest = None
+        else:
+            values, rest = self._unpack(values)
+
+        for (step, target), value in zip(self.steps, values):
+            if step is _Step.Slot:
+                scope.bind_slot(target, value)
+            elif step is _Step.Name:
+                scope.bind(target, value, mutable)
+            elif step is _Step.Attribute:
+                set_attribute_value(
+                    get_attribute_value(scope.current_value(target.name), target.attributes[:-1]),
+                    target.attributes[-1],
+                    value,
+                )
+            else:
+                target.bind(value, mutable, scope)
+
+        if self.rest is not None:
+            step, target = self.rest
+
+            if step is _Step.Slot:
+                scope.bind_slot(target, rest)
+            else:
+                scope.bind(target, rest, mutable)
+
+    def rebind(self, values: Iterable[Any], mutable: bool, scope: Scope) -> None:
+        if self.rest is not None:
+            raise SpspInvalidBindingTargetError(str(self.target), f'Variadic rebinding not allowed in this context')
+
+        values, _ = self._unpack(values)
+
+        for (step, target), value in zip(self.steps, values):
+            if step is _Step.Name:
+                scope.rebind(target, value, mutable)
+            elif step is _Step.Attribute:
+                set_attribute_value(
+                    get_attribute_value(scope.current_value(target.name), target.attributes[:-1]),
+                    target.attributes[-1],
+                    value,
+                )
+            else:
+                target.rebind(value, mutable, scope)
+
+    def _unpack(self, values: Iterable[Any]) -> tuple[Iterable[Any], Any]:
+        """
+        Check the number of values and split off the rest, if the target is variadic.
+
+        The rest of a collection is a tuple; when all values of a tuple go to the rest, the tuple itself
+        is bound without copying. Values of other iterables, like generators, the results of `map`
+        or lazy sequences, are pulled one by one, only as many as the fixed targets need: the rest
+        is the iterator of the remaining values.
+        """
+        arity = len(self.steps)
+
+        if type(values) is tuple or type(values) is list or isinstance(values, Sized):
+            n_values = len(values)
+
+            if arity > n_values:
+                raise SpspInvalidBindingError(f'Not enough values to unpack (expected {arity}, got {n_values})')
+
+            if arity < n_values and self.rest is None:
+                raise SpspInvalidBindingError(f'Too many values to unpack (expected {arity}, got {n_values})')
+
+            if self.rest is None:
+                return values, None
+
+            if arity == 0 and type(values) is tuple:
+                return (), values
+
+            if type(values) is tuple or isinstance(values, Sequence):
+                return values, tuple(values[arity:])
+
+            values = iter(values)
+            return tuple(islice(values, arity)), tuple(values)
+
+        values = iter(values)
+        head = tuple(islice(values, arity))
+
+        if len(head) < arity:
+            raise SpspInvalidBindingError(f'Not enough values to unpack (expected {arity}, got {len(head)})')
+
+        if self.rest is None and next(values, _EXHAUSTED) is not _EXHAUSTED:
+            raise SpspInvalidBindingError(f'Too many values to unpack (expected {arity})')
+
+        return head, values
+
+
+def binding_plan(target: StructuralBindingTarget, layout: FrameLayout | None = None) -> BindingPlan:
+    """
+    Compile a structural binding target.
+
+    When `layout` is given, names the layout binds directly are bound to slots
+    of the function frame the plan is executed in.
+    """
+    variadic = is_variadic(target)
+    positional, rest = split_variadic_binding_target(target) if variadic else (target, None)
+
+    def name_step(identifier: Expression.Identifier) -> tuple[_Step, Any]:
+        if layout is not None and identifier.name in layout.direct:
+            return _Step.Slot, layout.index[identifier.name]
+
+        return _Step.Name, identifier.name
 
-    if len(bind_target) > len(values):
-        raise SpspInvalidBindingError(f'Not enough values to unpack (expected {len(bind_target)}, got {len(values)})')
-
-    if len(bind_target) < len(values) and not variadic:
-        raise SpspInvalidBindingError(f'Too many values to unpack (expected {len(bind_target)}, got {len(values)})')
+    def step(item: StructuralBindingTarget | Expression.Identifier | Expression.AttributeAccess) -> tuple[_Step, Any]:
+        if isinstance(item, Expression.Identifier):
+            return name_step(item)
 
-    for current_target, value in zip(bind_target, values):
-        current_target: StructuralBindingTarget | Expression.Identifier | Expression.AttributeAccess
-        value: Collection[Any]
+        if isinstance(item, Expression.AttributeAccess):
+            return _Step.Attribute, item
 
-        if isinstance(current_target, Expression.Identifier):
-            scope.bind(current_target.name, value, mutable)
-            continue
+        return _Step.Nested, binding_plan(item, layout)
 
-        if isinstance(current_target, Expression.AttributeAccess):
-            set_attribute_value(
-                get_attribute_value(scope.value(current_target.name), current_target.attributes[:-1]),
-                current_target.attributes[-1],
-                value,
-            )
-            continue
+    return BindingPlan(
+        target,
+        tuple(map(step, positional)),
+        name_step(rest) if rest is not None else None
+    )
 
-        bind_structural(current_target, value, mutable, scope)
 
-    if rest is not None:
-        scope.bind(
-            rest.name,
-            tuple(values[len(bind_target):]),
-            mutable
-        )
+def bind_structural(
+        bind_target: StructuralBindingTarget,
+        values: Iterable[Any],
+        mutable: bool,
+        scope: Scope
+) -> None:
+    binding_plan(bind_target).bind(values, mutable, scope)
 
 
 def rebind_structural(
         bind_target: StructuralBindingTarget,
-        values: Collection[Any],
+        values: Iterable[Any],
         mutable: bool,
         scope: Scope
 ) -> None:
-    variadic = is_variadic(bind_target)
-
-    if variadic:
-        raise SpspInvalidBindingTargetError(str(bind_target), f'Variadic rebinding not allowed in this context')
-
-    if len(bind_target) > len(values):
-        raise SpspInvalidBindingError(f'Not enough values to unpack (expected {len(bind_target)}, got {len(values)})')
-
-    if len(bind_target) < len(values):
-        raise SpspInvalidBindingError(f'Too many values to unpack (expected {len(bind_target)}, got {len(values)})')
-
-    for current_target, value in zip(bind_target, values):
-        current_target: StructuralBindingTarget | Expression.Identifier | Expression.AttributeAccess
-        value: Collection[Any]
-
-        if isinstance(current_target, Expression.Identifier):
-            scope.rebind(current_target.name, value, mutable)
-            continue
-
-        if isinstance(current_target, Expression.AttributeAccess):
-            set_attribute_value(
-                get_attribute_value(scope.value(current_target.name), current_target.attributes[:-1]),
-                current_target.attributes[-1],
-                value,
-            )
-            continue
-
-        rebind_structural(current_target, value, mutable, scope)
-        continue
+    binding_plan(bind_target).rebind(values, mutable, scope)
 
 
 def is_variadic(target: StructuralBindingTarget) -> bool:
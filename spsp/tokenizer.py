@@ -124,10 +124,24 @@ ESCAPE_CHARACTERS = {
 }
 
 
+ESCAPE_SEQUENCES = {char: sequence for sequence, char in ESCAPE_CHARACTERS.items()} | {
+    SpecialSymbols.DoubleQuote: SpecialSymbols.Backslash + SpecialSymbols.DoubleQuote
+}
+
+
 def escape_character(s: str) -> str | None:
     return ESCAPE_CHARACTERS.get(s)
 
 
+def string_literal(s: str) -> str:
+    """
+    Code of a double-quoted string literal with the value `s`.
+    """
+    return SpecialSymbols.DoubleQuote \
+        + ''.join(ESCAPE_SEQUENCES.get(char, char) for char in s) \
+        + SpecialSymbols.DoubleQuote
+
+
 class Tokenizer:
     def __init__(self, stream: TextIO) -> None:
         self._stream: TextIO = stream
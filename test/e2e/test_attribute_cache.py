@@ -0,0 +1,113 @@
+import contextlib
+import io
+import types
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from spsp.errors import SpspEvaluationError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestAttributeCache:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        module = types.ModuleType('module')
+        module.value = 1
+        module.inner = types.ModuleType('inner')
+        module.inner.value = 1
+        scope.let('module', module)
+        scope.let('set-from-python', setattr)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(let module::value 2)',
+                '(set-from-python module "value" 2)',
+        )
+    )
+    def test_module_attribute_changed(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [] module::value)) (f)', scope)
+
+        # Act
+        self.run(code, scope)
+        result = self.run('(f)', scope)
+
+        # Assert
+        assert result == 2
+
+    def test_module_attribute_deleted(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [] module::value)) (f)', scope)
+
+        # Act
+        self.run('(del module::value)', scope)
+
+        # Assert
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            self.run('(f)', scope)
+        assert isinstance(evaluation_error.value.cause, AttributeError)
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(set-from-python module::inner "value" 2)',
+                '(set-from-python module "inner" replacement)',
+        )
+    )
+    def test_module_chain_changed(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+        scope.let('replacement', types.SimpleNamespace(value=2))
+        self.run('(let f (lambda [] module::inner::value)) (f)', scope)
+
+        # Act
+        self.run(code, scope)
+        result = self.run('(f)', scope)
+
+        # Assert
+        assert result == 2
+
+    def test_patched_from_python(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [] module::value)) (f)', scope)
+
+        # Act
+        with mock.patch.object(scope.value('module'), 'value', 3):
+            patched = self.run('(f)', scope)
+        restored = self.run('(f)', scope)
+
+        # Assert
+        assert (patched, restored) == (3, 1)
+
+    def test_redirected_stdout(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let sys (import-module "sys")) (let out (lambda [] sys::stdout)) (out)', scope)
+
+        # Act
+        with contextlib.redirect_stdout(stream := io.StringIO()):
+            result = self.run('(out)', scope)
+
+        # Assert
+        assert result is stream
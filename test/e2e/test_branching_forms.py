@@ -0,0 +1,118 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspArityError, SpspValueError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestBranchingForms:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('evaluated', [])
+        scope.let('<', lambda a, b: a < b)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(cond)', None),
+                ('(cond 1)', 1),
+                ('(cond False 1)', None),
+                ('(cond False 1 2)', 2),
+                ('(cond (< 5 1) "a" (< 5 10) "b" "c")', 'b'),
+                ('(cond (< 5 1) "a" (< 50 10) "b" "c")', 'c'),
+                ('(cond [] "a" [1] "b")', 'b'),
+        )
+    )
+    def test_cond(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_cond_evaluates_in_order(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        code = '(cond (evaluated::append 1) "a" True (evaluated::append 2) (evaluated::append 3) "c")'
+
+        # Act
+        self.run(code, scope)
+
+        # Assert
+        assert scope.value('evaluated') == [1, 2]
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(case 1)', None),
+                ('(case 1 "default")', 'default'),
+                ('(case 2 1 "one" 2 "two")', 'two'),
+                ('(case 3 1 "one" 2 "two")', None),
+                ('(case 3 1 "one" 2 "two" "other")', 'other'),
+                ('(case "b" "a" 1 "b" 2)', 2),
+                ('(case None 1 "one" None "none")', 'none'),
+                ('(case 4 [1 3 5] "odd" [2 4 6] "even")', 'even'),
+                ('(case 1 1 "first" 1 "second")', 'first'),
+                ('(case [1] 1 "one" "other")', 'other'),
+        )
+    )
+    def test_case(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_case_evaluates_taken_branch_only(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [x] (case x 1 (evaluated::append 1) 2 (evaluated::append 2) (evaluated::append 0))))',
+                 scope)
+
+        # Act
+        for i in range(4):
+            self.run(f'(f {i})', scope)
+
+        # Assert
+        assert scope.value('evaluated') == [0, 1, 2, 0]
+
+    def test_case_key_not_literal(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run('(let x 1) (case 1 x "x")', scope)
+        assert isinstance(e.value.cause, SpspValueError)
+
+    def test_case_without_value(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run('(case)', scope)
+        assert isinstance(e.value.cause, SpspArityError)
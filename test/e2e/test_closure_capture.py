@@ -0,0 +1,274 @@
+import gc
+import io
+import weakref
+from typing import Any
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+class Temporary:
+    instances: list[weakref.ref] = []
+
+    def __init__(self) -> None:
+        Temporary.instances.append(weakref.ref(self))
+
+    @staticmethod
+    def alive(collect: bool = True) -> int:
+        if collect:
+            gc.collect()
+        return sum(1 for it in Temporary.instances if it() is not None)
+
+
+# noinspection DuplicatedCode
+class TestClosureCapture:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def scope() -> Scope:
+        Temporary.instances.clear()
+        scope = Scope.empty()
+        # Closures only leave the scopes of a body out when the operations they call cannot become macros
+        scope.const('Temporary', Temporary)
+        scope.const('+', lambda *args: sum(args))
+        scope.const('-', lambda a, b: a - b)
+        scope.const('=', lambda a, b: a == b)
+        scope.const('get', lambda obj, item: obj[item])
+        return scope
+
+    def test_unused_temporary_released(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make-adder (lambda [n]
+                (do
+                    (let temporary (Temporary))
+                    (let m (+ n 1))
+                    (lambda [x] (+ x m)))))
+            ''', scope)
+
+        # Act
+        self.run('(let adders (list (map make-adder (range 10))))', scope)
+        result = self.run('((get adders 3) 10)', scope)
+
+        # Assert
+        assert result == 14
+        assert Temporary.alive() == 0
+
+    def test_used_temporary_kept(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make-getter (lambda []
+                (do
+                    (let temporary (Temporary))
+                    (lambda [] temporary))))
+            ''', scope)
+
+        # Act
+        self.run('(let getter (make-getter))', scope)
+
+        # Assert
+        assert Temporary.alive() == 1
+
+    def test_unused_argument_released(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('(let make-constant (lambda [temporary value] (lambda [] value)))', scope)
+
+        # Act
+        result = self.run('((make-constant (Temporary) 42))', scope)
+        self.run('(let constant (make-constant (Temporary) 42))', scope)
+
+        # Assert
+        assert result == 42
+        assert Temporary.alive() == 0
+
+    def test_nested_closures(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make (lambda [a]
+                (do
+                    (let temporary (Temporary))
+                    (lambda [b] (lambda [c] (+ a b c))))))
+            ''', scope)
+
+        # Act
+        self.run('(let add ((make 1) 2))', scope)
+        result = self.run('(add 3)', scope)
+
+        # Assert
+        assert result == 6
+        assert Temporary.alive() == 0
+
+    def test_eval_captures_everything(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make (lambda [name]
+                (do
+                    (let temporary (Temporary))
+                    (lambda [] (eval! name)))))
+            ''', scope)
+
+        # Act
+        result = self.run('(type ((make (expr! temporary))))', scope)
+
+        # Assert
+        assert result is Temporary
+
+    def test_macro_call_captures_everything(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let get-temporary (macro [] (expr! temporary)))
+            (let make (lambda []
+                (do
+                    (let temporary (Temporary))
+                    (lambda [] (get-temporary)))))
+            ''', scope)
+
+        # Act
+        result = self.run('(type ((make)))', scope)
+
+        # Assert
+        assert result is Temporary
+
+    def test_late_binding(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let count-down (lambda [n]
+                (do
+                    (let step (lambda [i] (if (= i 0) 0 (+ 1 (step (- i 1))))))
+                    (step n))))
+            ''', scope)
+
+        # Act
+        result = self.run('(count-down 5)', scope)
+
+        # Assert
+        assert result == 5
+
+    def test_rebound_name(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make-counter (lambda []
+                (do
+                    (let count 0)
+                    (lambda [] (do (rebind count (+ count 1)) count)))))
+            (let counter (make-counter))
+            ''', scope)
+
+        # Act
+        results = [self.run('(counter)', scope) for _ in range(3)]
+
+        # Assert
+        assert results == [1, 2, 3]
+
+    def test_recursive_closure_released_without_collector(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let count-down (lambda [n]
+                (do
+                    (let temporary (Temporary))
+                    (let step (lambda [i] (if (= i 0) 0 (+ 1 (step (- i 1))))))
+                    (step n))))
+            ''', scope)
+
+        # Act
+        gc.disable()
+        try:
+            result = self.run('(count-down 5)', scope)
+            alive = Temporary.alive(collect=False)
+        finally:
+            gc.enable()
+
+        # Assert
+        assert result == 5
+        assert alive == 0
+
+    def test_returned_recursive_closure(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make-count-down (lambda []
+                (do
+                    (let step (lambda [i] (if (= i 0) 0 (+ 1 (step (- i 1))))))
+                    step)))
+            (let count-down (make-count-down))
+            ''', scope)
+
+        # Act
+        gc.collect()
+        result = self.run('(count-down 5)', scope)
+
+        # Assert
+        assert result == 5
+
+    def test_operation_bound_to_macro_after_creation(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make (lambda []
+                (do
+                    (let secret 1)
+                    (lambda [] (my-mac)))))
+            (let closure (make))
+            ''', scope)
+
+        # Act
+        self.run('(let my-mac (macro [] (expr! secret)))', scope)
+        result = self.run('(closure)', scope)
+
+        # Assert
+        assert result == 1
+
+    def test_variable_operation_captures_everything(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let show (lambda [] None))
+            (let make (lambda []
+                (do
+                    (let temporary (Temporary))
+                    (lambda [] (show)))))
+            (let closure (make))
+            ''', scope)
+
+        # Act
+        self.run('(rebind show (macro [] (expr! temporary)))', scope)
+        result = self.run('(type (closure))', scope)
+
+        # Assert
+        assert result is Temporary
+
+    def test_local_operation_bound_to_macro_after_creation(self) -> None:
+        # Arrange
+        scope = self.scope()
+        self.run('''
+            (let make (lambda []
+                (do
+                    (let secret 1)
+                    (let closure (lambda [] (my-mac)))
+                    (let my-mac (macro [] (expr! secret)))
+                    closure)))
+            ''', scope)
+
+        # Act
+        result = self.run('((make))', scope)
+
+        # Assert
+        assert result == 1
@@ -0,0 +1,74 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp import Expression
+from spsp.errors import SpspEvaluationError, SpspArityError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestCodeTemplates:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('+', lambda a, b: a + b)
+        return scope
+
+    def test_template_without_inlined_values_shared(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [] (expr! (+ 1 2))))', scope)
+
+        # Act
+        first, second = self.run('(f)', scope), self.run('(f)', scope)
+
+        # Assert
+        assert first is second
+
+    def test_parts_without_inlined_values_shared(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [x] (expr! [(inline-value! x) (+ 1 2)])))', scope)
+
+        # Act
+        first, second = self.run('(f 1)', scope), self.run('(f 2)', scope)
+
+        # Assert
+        assert isinstance(first, Expression.List) and isinstance(second, Expression.List)
+        assert [first.items[0].value, second.items[0].value] == [1, 2]
+        assert first.items[1] is second.items[1]
+
+    def test_repeated_evaluation(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let g (lambda [y] (eval! (expr! (do (let a y) (+ a (inline-value! y)))))))', scope)
+
+        # Act
+        results = [self.run(f'(g {i})', scope) for i in range(3)]
+
+        # Assert
+        assert results == [0, 2, 4]
+
+    def test_inline_arity_checked(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [] (expr! (+ 1 (inline! 1 2)))))', scope)
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run('(f)', scope)
+        assert isinstance(e.value.cause, SpspArityError)
@@ -0,0 +1,190 @@
+import io
+import operator
+from typing import Any
+
+import pytest
+
+from spsp.constant_folding import fold_constants
+from spsp.errors import SpspEvaluationError, SpspInvalidBindingTargetError, SpspNameError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestConstantFolding:
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('+', operator.add)
+        scope.let('*', operator.mul)
+        scope.let('**', operator.pow)
+        scope.let('<<', operator.lshift)
+        scope.const('math', scope.import_module('math'))
+        scope.const('DEBUG', False)
+        return scope
+
+    @staticmethod
+    def run(code: str, scope: Scope) -> None:
+        with io.StringIO(code) as input_stream:
+            for e in parse(Tokenizer(input_stream)):
+                evaluate(e, scope)
+
+    @staticmethod
+    def fold(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            expression, = parse(Tokenizer(input_stream))
+            return fold_constants(expression, scope)
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(+ 1 (* 2 3))', '7'),
+                ('(if DEBUG (print 1) (print 2))', '(print 2)'),
+                ('(math::floor 2.5)', '2'),
+                ('(lambda [x] (+ x (* 60 60)))', '(lambda [x] (+ x 3600))'),
+                ('(lambda [*] (+ 1 (* 2 3)))', '(lambda [*] (+ 1 (* 2 3)))'),
+                ('(let DEBUG 1)', '(let DEBUG 1)'),
+                ('(expr! (+ 1 2))', '(expr! (+ 1 2))'),
+                ('(+ 1 [2])', '(+ 1 [2])'),
+                ('(* 1 (/ 1 0))', '(* 1 (/ 1 0))'),
+                ('(if DEBUG (+ 1 2) (* 2 3))', '6'),
+                ('(if x (+ 1 2) 3)', '(if x 3 3)'),
+                ('(if False (len (* "ab" 400000000)) 0)', '0'),
+                ('(* "ab" 400000000)', '(* ab 400000000)'),
+                ('(* 400000000 "ab")', '(* 400000000 ab)'),
+                ('(** 10 100000)', '(** 10 100000)'),
+                ('(<< 1 100000)', '(<< 1 100000)'),
+                ('(* (** 2 4000) (** 2 4000))', '(* (** 2 4000) (** 2 4000))'),
+        )
+    )
+    def test_fold(self, code: str, expected: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.fold(code, scope)
+
+        # Assert
+        assert result.code == expected
+
+    def test_mutable_condition_not_folded(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        scope.const('xs', [])
+        folded = self.fold('(if xs "nonempty" "empty")', scope)
+
+        # Act
+        scope.value('xs').append(1)
+        result = evaluate(folded, scope)
+
+        # Assert
+        assert result == 'nonempty'
+
+    def test_call_unhashable_function(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        scope.const('xs', [])
+        evaluate(self.fold('(let f (lambda [] xs))', scope), scope)
+
+        # Act
+        result = evaluate(self.fold('(f)', scope), scope)
+
+        # Assert
+        assert result == []
+
+    def test_folded_value(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        folded = self.fold('(+ 1 (* 2 3))', scope)
+
+        # Act
+        result = evaluate(folded, scope)
+
+        # Assert
+        assert result == 7
+
+    def test_redefined_operator(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        folded = self.fold('(+ 1 (* 2 3))', scope)
+
+        # Act
+        scope.let('*', operator.sub)
+        result = evaluate(folded, scope)
+
+        # Assert
+        assert result == 0
+
+    def test_const(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        with io.StringIO('(const [x y] [1 2]) (let x 3)') as input_stream:
+            define, rebind = parse(Tokenizer(input_stream))
+
+        # Act
+        evaluate(define, scope)
+
+        # Assert
+        assert (scope.value('x'), scope.value('y')) == (1, 2)
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            evaluate(rebind, scope)
+        assert isinstance(evaluation_error.value.cause, SpspInvalidBindingTargetError)
+
+    def test_rebound_operator(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        folded = self.fold('(+ 1 (* 2 3))', scope)
+
+        # Act
+        self.run('(rebind * +)', scope)
+        result = evaluate(folded, scope)
+
+        # Assert
+        assert result == 6
+
+    def test_deleted_dependency(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        folded = self.fold('(+ 1 (* 2 3))', scope)
+
+        # Act
+        self.run('(del *)', scope)
+
+        # Assert
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            evaluate(folded, scope)
+        assert isinstance(evaluation_error.value.cause, SpspNameError)
+
+    @pytest.mark.parametrize(
+        'value, expected',
+        (
+                ('(getattr operator "mul")', 7),
+                ('operator::sub', 0),
+        )
+    )
+    def test_deleted_and_rebound_dependency(self, value: str, expected: int) -> None:
+        # Arrange
+        scope = self.make_scope()
+        scope.const('operator', operator)
+        folded = self.fold('(+ 1 (* 2 3))', scope)
+
+        # Act
+        self.run(f'(del *) (let * {value})', scope)
+        result = evaluate(folded, scope)
+
+        # Assert
+        assert folded.code == '7'
+        assert result == expected
+
+    def test_delete_folded_constant(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        folded = self.fold('(if DEBUG 1 2)', scope)
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            self.run('(del DEBUG)', scope)
+        assert isinstance(evaluation_error.value.cause, SpspInvalidBindingTargetError)
+        assert evaluate(folded, scope) == 2
@@ -0,0 +1,141 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspNameError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestDoScope:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(do (let x 1))',
+                '(do (print (do (let x 1))))',
+                '(do (let [x y] [1 2]))',
+                '(do (eval! (expr! (let x 1))))',
+                '(do (let m (macro [] (expr! (let x 1)))) (m))',
+        )
+    )
+    def test_bindings_do_not_leak(self, code: str) -> None:
+        # Arrange
+        scope = Scope.empty()
+
+        # Act
+        self.run(code, scope)
+
+        # Assert
+        with pytest.raises(SpspNameError):
+            scope.value('x')
+
+    def test_macro_expanding_into_binding(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let m (macro [] (expr! (let x 1))))', scope)
+
+        # Act
+        result = self.run('(do (m) x)', scope)
+
+        # Assert
+        assert result == 1
+        with pytest.raises(SpspNameError):
+            scope.value('x')
+
+    def test_name_rebound_to_macro(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let f (lambda [] None))'
+                 '(let m (macro [] (expr! (let x 1))))', scope)
+
+        # Act
+        self.run('(do (rebind f m) (f))', scope)
+
+        # Assert
+        with pytest.raises(SpspNameError):
+            scope.value('x')
+
+    def test_delete_in_nested_scope(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let x 1)', scope)
+
+        # Act
+        self.run('(do (del x))', scope)
+
+        # Assert
+        assert scope.value('x') == 1
+
+    def test_binding_free_block(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let x [0])', scope)
+
+        # Act
+        result = self.run('(do (x::append 1) (rebind x [(len x)]) x)', scope)
+
+        # Assert
+        assert result == [2]
+
+    def test_error_in_block(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            self.run('(do (undefined))', scope)
+
+        assert isinstance(evaluation_error.value.cause, SpspNameError)
+
+    def test_inlined_binding_in_code_template(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+
+        # Act
+        result = self.run('(do (expr! (f (inline-value! (let x 1)))))', scope)
+
+        # Assert
+        assert result.code == '(f 1)'
+        with pytest.raises(SpspNameError):
+            scope.value('x')
+
+    def test_global_name_rebound_to_macro_between_evaluations(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let f (lambda [] None))'
+                 '(let m (macro [] (expr! (let x 1))))'
+                 '(let g (lambda [] (do (do (f)) (try x (except _ 0)))))'
+                 '(g)', scope)
+
+        # Act
+        self.run('(rebind f m)', scope)
+        result = self.run('(g)', scope)
+
+        # Assert
+        assert result == 0
+
+    def test_local_name_bound_to_macro_between_evaluations(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let m (macro [] (expr! (let x 1))))'
+                 '(let g (lambda [f] (do (do (f)) (try x (except _ 0)))))'
+                 '(g (lambda [] None))', scope)
+
+        # Act
+        result = self.run('(g m)', scope)
+
+        # Assert
+        assert result == 0
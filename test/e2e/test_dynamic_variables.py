@@ -0,0 +1,160 @@
+import asyncio
+import io
+import threading
+import types
+from typing import Any, Callable
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspInvalidBindingTargetError, SpspNameError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestDynamicVariables:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def in_thread(function: Callable[[], Any]) -> Any:
+        result = []
+        thread = threading.Thread(target=lambda: result.append(function()))
+        thread.start()
+        thread.join()
+        return result[0]
+
+    def make_scope(self) -> Scope:
+        scope = Scope.empty()
+        scope.let('+', lambda a, b: a + b)
+        scope.let('/', lambda a, b: a / b)
+        scope.let('in-thread', self.in_thread)
+        scope.let('namespace', types.SimpleNamespace)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(dynamic x 1) x', 1),
+                ('(dynamic x 1) (binding x 2 x)', 2),
+                ('(dynamic x 1) (binding x 2 (binding x 3 x))', 3),
+                ('(dynamic x 1) (binding x 2 (+ x 1)) x', 1),
+                ('(dynamic x 1) (dynamic y 2) (binding [x y] [3 4] [x y])', [3, 4]),
+                ('(dynamic x 1) (dynamic y 2) (binding [x [y]] [3 [4]] [x y])', [3, 4]),
+                ('(dynamic x 1) (let f (lambda [] x)) [(binding x 2 (f)) (f)]', [2, 1]),
+                ('(dynamic x 1) (let f (lambda [] (binding x 2 (lambda [] x)))) ((f))', 1),
+                ('(dynamic x 1) (binding x 2 (do (let y x) y))', 2),
+                ('(let f (lambda [x] (do (dynamic x 5) x))) (f 1)', 5),
+                ('(let f (lambda [x] (do (dynamic x 5) (binding x 6 x)))) (f 1)', 6),
+                ('(dynamic ns (namespace)) (let ns::a 3) ns::a', 3),
+                ('(dynamic ns (namespace)) (let [ns::a ns::b] [1 2]) [ns::a ns::b]', [1, 2]),
+                ("(dynamic ns (namespace)) (let ns::a 3) (del ns::a) (hasattr ns 'a')", False),
+                ('(let m (macro [] (expr! secret))) (dynamic d m)'
+                 '(let make (lambda [] (do (let secret 7) (lambda [] (d))))) ((make))', 7),
+        )
+    )
+    def test_result(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_restored_on_error(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(dynamic x 1)', scope)
+
+        # Act
+        with pytest.raises(SpspEvaluationError):
+            self.run('(binding x 2 (/ x 0))', scope)
+
+        # Assert
+        assert self.run('x', scope) == 1
+
+    def test_override_private_to_thread(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(dynamic x 1)', scope)
+
+        # Act
+        result = self.run('(binding x 2 [x (in-thread (lambda [] x)) (in-thread (lambda [] (binding x 3 x)))])', scope)
+
+        # Assert
+        assert result == [2, 1, 3]
+        assert self.run('x', scope) == 1
+
+    def test_override_private_to_task(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(dynamic x 1)', scope)
+
+        async def override() -> Any:
+            scope.value('x').override(2)
+            await asyncio.sleep(0)
+            return self.run('x', scope)
+
+        async def read() -> Any:
+            await asyncio.sleep(0)
+            return self.run('x', scope)
+
+        async def main() -> Any:
+            return await asyncio.gather(override(), read())
+
+        # Act
+        result = asyncio.run(main())
+
+        # Assert
+        assert result == [2, 1]
+        assert self.run('x', scope) == 1
+
+    def test_binding_plain_variables(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let x 1) (let f (lambda [] x))', scope)
+
+        # Act
+        result = self.run('(binding x 2 (f))', scope)
+
+        # Assert
+        assert result == 2
+        assert self.run('x', scope) == 1
+
+    def test_dynamic_variables_are_constant(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(dynamic x 1)', scope)
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError):
+            self.run('(rebind x 2)', scope)
+        assert self.run('x', scope) == 1
+
+    @pytest.mark.parametrize(
+        'code, cause',
+        (
+                ('(dynamic [x] [1])', SpspInvalidBindingTargetError),
+                ('(binding 1 2 3)', SpspInvalidBindingTargetError),
+                ('(binding x 2 x)', SpspNameError),
+                ('(let m (macro [] (expr! (let leaked 1)))) (dynamic d m) (do (d) None) leaked', SpspNameError),
+        )
+    )
+    def test_invalid(self, code: str, cause: type[Exception]) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run(code, scope)
+        assert isinstance(e.value.cause, cause)
@@ -0,0 +1,36 @@
+import io
+
+import pytest
+
+from spsp.errors import SpspEvaluationError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestErrorPositions:
+    @pytest.mark.parametrize(
+        'code, position',
+        (
+                ('(print (undefined 1))', 8),
+                ('(print [1 (undefined 1)])', 11),
+                ('(do (let f (lambda [x] (undefined x))) (print (f 1)))', 46),
+                ('(do (let m (macro [x] (undefined x))) (print (m 1)))', 45),
+        )
+    )
+    def test_position(self, code: str, position: int) -> None:
+        # Arrange
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            with pytest.raises(SpspEvaluationError) as evaluation_error:
+                for e in expressions:
+                    evaluate(e, scope)
+
+            # Assert
+            assert evaluation_error.value.position == position
+            assert evaluation_error.value.cause.name == 'undefined'
@@ -0,0 +1,102 @@
+import io
+
+import pytest
+
+from spsp.errors import SpspEvaluationError
+from spsp.evaluation import evaluate
+from spsp.expansion import expand
+from spsp.parser import parse, unparse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+MACROS = '(let when (macro [c body] (expr! (if (inline! c) (inline! body) None))))' \
+         '(let twice (macro [body] (expr! (do (inline! body) (inline! body)))))' \
+         '(let fails (macro [] (raise (ValueError))))' \
+         '(let volatile (uncached! (macro [] (expr! None))))'
+
+
+# noinspection DuplicatedCode
+class TestExpansion:
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        with io.StringIO(MACROS) as input_stream:
+            for e in parse(Tokenizer(input_stream)):
+                evaluate(e, scope)
+        return scope
+
+    @staticmethod
+    def expand_code(code: str, scope: Scope) -> str:
+        with io.StringIO(code) as input_stream:
+            expression, = parse(Tokenizer(input_stream))
+            return expand(expression, scope).code
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(when x (print x))', '(if x (print x) None)'),
+                ('(twice (when x y))', '(do (if x y None) (if x y None))'),
+                ('(lambda [x] (when x 1))', '(lambda [x] (if x 1 None))'),
+                ('[(when a b)]', '[(if a b None)]'),
+                ('(expr! (when (inline! (when a b)) c))', '(expr! (when (inline! (if a b None)) c))'),
+                ('(lambda [when] (when x 1))', '(lambda [when] (when x 1))'),
+                ('(do (let when print) (when x 1))', '(do (let when print) (when x 1))'),
+                ('(volatile)', '(volatile )'),
+        )
+    )
+    def test_expand(self, code: str, expected: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.expand_code(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_generated_code_positions(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        with io.StringIO('(print (when x y))') as input_stream:
+            expression, = parse(Tokenizer(input_stream))
+
+        # Act
+        result = expand(expression, scope)
+
+        # Assert
+        generated, = result.arguments
+        assert generated.position == 7
+        assert generated.arguments[0] is expression.arguments[0].arguments[0]
+
+    def test_macro_error(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            self.expand_code('(print (fails))', scope)
+
+        assert evaluation_error.value.position == 7
+        assert isinstance(evaluation_error.value.cause, ValueError)
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(when x (print "a b"))', '(if x (print "a b") None)'),
+                ('(print "say \\"hi\\"\\n" [\'\\\\\' 1])', '(print "say \\"hi\\"\\n" ["\\\\" 1])'),
+                ('(volatile)', '(volatile)'),
+        )
+    )
+    def test_unparse_expanded(self, code: str, expected: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+        with io.StringIO(code) as input_stream:
+            expression, = parse(Tokenizer(input_stream))
+
+        # Act
+        result = unparse(expand(expression, scope))
+
+        # Assert
+        assert result == expected
+        with io.StringIO(result) as input_stream:
+            assert [unparse(it) for it in parse(Tokenizer(input_stream))] == [result]
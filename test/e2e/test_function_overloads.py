@@ -2,6 +2,7 @@ import io
 
 import pytest
 
+from spsp.errors import SpspInvalidBindingError
 from spsp.evaluation import evaluate
 from spsp.parser import parse
 from spsp.scope import Scope
@@ -74,3 +75,45 @@ class TestFunctionOverloading:
             assert f(1) == 2
             assert f(5, 6) == 12
             assert f(5, 6, 7, 8) == (7, 8)
+
+    def test_first_suitable_signature_chosen(self) -> None:
+        # Arrange
+        code = '(let f (lambda ' \
+               '           ([x y] 0)' \
+               '           ([x & *rest] 1)' \
+               '           ([x y z] 2)' \
+               '           ([& *rest] 3)))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            f = scope.value('f')
+
+            # Assert
+            assert f(1, 2) == 0
+            assert f(1) == 1
+            assert f(1, 2, 3) == 1
+            assert f() == 3
+
+    def test_no_suitable_signature(self) -> None:
+        # Arrange
+        code = '(let f (lambda ' \
+               '           ([x] 0)' \
+               '           ([x y z & *rest] 1)))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            f = scope.value('f')
+
+            # Assert
+            with pytest.raises(SpspInvalidBindingError):
+                f(1, 2)
@@ -0,0 +1,156 @@
+import builtins
+import gc
+import io
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspNameError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestGlobalLookupCache:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    def test_rebound_global(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let x 1) (let f (lambda [] x))', scope)
+        self.run('(f)', scope)
+
+        # Act
+        self.run('(rebind x 2)', scope)
+        result = self.run('(f)', scope)
+
+        # Assert
+        assert result == 2
+
+    def test_shadowed_after_lookup(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let x 1) (let f (lambda [shadow] (do (if shadow (let x 2) None) x)))', scope)
+
+        # Act
+        results = [self.run('(f False)', scope), self.run('(f True)', scope), self.run('(f False)', scope)]
+
+        # Assert
+        assert results == [1, 2, 1]
+
+    def test_shadowed_builtin(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let f (lambda [] (len [1 2 3])))', scope)
+        self.run('(f)', scope)
+
+        # Act
+        self.run('(let len (lambda [_] 0))', scope)
+        result = self.run('(f)', scope)
+
+        # Assert
+        assert result == 0
+
+    def test_patched_builtin(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let f (lambda [] (abs -1)))', scope)
+        self.run('(f)', scope)
+
+        # Act
+        with mock.patch('builtins.abs', lambda _: 'patched'):
+            patched = self.run('(f)', scope)
+        restored = self.run('(f)', scope)
+
+        # Assert
+        assert (patched, restored) == ('patched', 1)
+
+    def test_builtin_set_from_python(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let f (lambda [] (spsp-test-builtin)))', scope)
+
+        # Act
+        try:
+            setattr(builtins, 'spsp-test-builtin', lambda: 1)
+            first = self.run('(f)', scope)
+            setattr(builtins, 'spsp-test-builtin', lambda: 2)
+            second = self.run('(f)', scope)
+        finally:
+            delattr(builtins, 'spsp-test-builtin')
+
+        # Assert
+        assert (first, second) == (1, 2)
+        with pytest.raises(SpspEvaluationError) as evaluation_error:
+            self.run('(f)', scope)
+        assert isinstance(evaluation_error.value.cause, SpspNameError)
+
+    def test_deleted_global(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        self.run('(let x 1) (let f (lambda [] x))', scope)
+        self.run('(f)', scope)
+
+        # Act
+        self.run('(del x)', scope)
+
+        # Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run('(f)', scope)
+        assert isinstance(e.value.cause, SpspNameError)
+
+    def test_separate_root_scopes(self) -> None:
+        # Arrange
+        first, second = Scope.empty(), Scope.empty()
+        self.run('(let x 1)', first)
+        self.run('(let x 2)', second)
+        expression, = parse(Tokenizer(io.StringIO('x')))
+
+        # Act
+        results = [evaluate(expression, first), evaluate(expression, second)]
+
+        # Assert
+        assert results == [1, 2]
+
+    def test_root_scopes_collected(self) -> None:
+        # Arrange
+        def count_scopes() -> int:
+            gc.collect()
+            return sum(1 for it in gc.get_objects() if isinstance(it, Scope))
+
+        expression, = parse(Tokenizer(io.StringIO('(do (let f (lambda [] len)) (f))')))
+        before = count_scopes()
+
+        # Act
+        for _ in range(10):
+            evaluate(expression, Scope.empty())
+
+        after = count_scopes()
+
+        # Assert
+        assert after == before
+
+    def test_local_binding_in_other_root(self) -> None:
+        # Arrange
+        first, second = Scope.empty(), Scope.empty()
+        self.run('(let x 1)', first)
+        self.run('(let x 2)', second)
+        expression, = parse(Tokenizer(io.StringIO('x')))
+        evaluate(expression, first)
+
+        # Act
+        self.run('(do (let x 3))', second)
+        results = [evaluate(expression, first), evaluate(expression, second), evaluate(expression, first)]
+
+        # Assert
+        assert results == [1, 2, 1]
@@ -0,0 +1,143 @@
+import gc
+import io
+import threading
+import weakref
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspValueError
+from spsp.evaluation import evaluate
+from spsp.lazy_seq import CHUNK_SIZE, iterate, take, drop
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestLazySequences:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('+', lambda a, b: a + b)
+        scope.let('evaluated', [])
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(realize (lazy-seq [1 2 3]))', [1, 2, 3]),
+                ('(realize (lazy-seq (lambda [] (range 3))))', [0, 1, 2]),
+                ('(realize (lazy-seq (lambda [] (lazy-seq [1 2]))))', [1, 2]),
+                ('(realize (take 5 (iterate (lambda [x] (+ x 2)) 0)))', [0, 2, 4, 6, 8]),
+                ('(realize (take 3 (drop 100 (iterate (lambda [x] (+ x 1)) 0))))', [100, 101, 102]),
+                ('(realize (drop 2 (range 5)))', [2, 3, 4]),
+                ('(realize (drop 10 (take 5 (iterate (lambda [x] (+ x 1)) 0))))', []),
+                ('(realize (take 0 (iterate (lambda [x] (+ x 1)) 0)))', []),
+                ('(sum (take 1000 (iterate (lambda [x] (+ x 1)) 0)))', 499500),
+                ('(realize (map str (take 2 (lazy-seq [1 2 3]))))', ['1', '2']),
+        )
+    )
+    def test_result(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_computed_by_chunk(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let items (iterate (lambda [x] (do (evaluated::append x) (+ x 1))) 0))', scope)
+
+        # Act
+        first = self.run('(next (iter items))', scope)
+        again = self.run('(realize (take 3 items))', scope)
+
+        # Assert
+        assert first == 0
+        assert again == [0, 1, 2]
+        assert len(scope.value('evaluated')) == CHUNK_SIZE - 1
+
+    def test_source_consumed_once(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let items (lazy-seq (map (lambda [x] (do (evaluated::append x) x)) (range 100))))', scope)
+
+        # Act
+        results = [self.run('(realize items)', scope) for _ in range(2)]
+
+        # Assert
+        assert results == [list(range(100))] * 2
+        assert scope.value('evaluated') == list(range(100))
+
+    def test_source_consumed_once_across_threads(self) -> None:
+        # Arrange
+        evaluated = []
+        items = iterate(lambda x: evaluated.append(x) or x + 1, 0)
+        results = []
+        barrier = threading.Barrier(4)
+
+        def consume() -> None:
+            barrier.wait()
+            results.append(sum(take(1000, items)))
+
+        threads = [threading.Thread(target=consume) for _ in range(4)]
+
+        # Act
+        for it in threads:
+            it.start()
+        for it in threads:
+            it.join()
+
+        # Assert
+        assert results == [499500] * 4
+        assert sorted(evaluated) == list(range(len(evaluated)))
+
+    def test_skipped_items_freed(self) -> None:
+        # Arrange
+        class Item:
+            pass
+
+        references = []
+
+        def make_item(_: Any) -> Item:
+            item = Item()
+            references.append(weakref.ref(item))
+            return item
+
+        # Act
+        items = drop(1000, iterate(make_item, Item()))
+        next(iter(items))
+        gc.collect()
+
+        # Assert
+        assert sum(it() is not None for it in references) <= 2 * CHUNK_SIZE
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(take -1 [1 2])',
+                '(drop -1 (lazy-seq [1 2]))',
+        )
+    )
+    def test_invalid_count(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run(code, scope)
+        assert isinstance(e.value.cause, SpspValueError)
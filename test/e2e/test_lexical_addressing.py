@@ -0,0 +1,67 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestLexicalAddressing:
+    @staticmethod
+    def run(code: str) -> Any:
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+            scope.let('+', lambda a, b: a + b)
+
+            result = None
+            for e in expressions:
+                result = evaluate(e, scope)
+
+            return result
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('((lambda [x y] (+ x y)) 1 2)', 3),
+                ('((lambda [[x y] & *rest] [x y *rest]) [1 2] 3)', [1, 2, (3,)]),
+                ('(((lambda [x] (lambda [y] (+ x y))) 1) 2)', 3),
+                ('(((lambda [x] (lambda [x] (+ x x))) 1) 2)', 4),
+                ('(((lambda [x] (do (lambda [y] (do (+ x y))))) 1) 2)', 3),
+                ('((lambda [x] (do (let x 10) x)) 1)', 10),
+                ('((lambda [x] (do (do (let x 10)) x)) 1)', 1),
+                ('((lambda [x] (eval! (expr! (+ x 1)))) 1)', 2),
+        )
+    )
+    def test_argument_lookup(self, code: str, expected: Any) -> None:
+        # Act
+        result = self.run(code)
+
+        # Assert
+        assert result == expected
+
+    def test_deleted_argument(self) -> None:
+        # Arrange
+        code = '(let x 42)' \
+               '((lambda [x] (do (del x) (let x 1) x)) 0)'
+
+        # Act
+        result = self.run(code)
+
+        # Assert
+        assert result == 1
+
+    def test_delete_in_nested_scope_keeps_argument(self) -> None:
+        # Arrange
+        code = '(let x 42)' \
+               '((lambda [x] (do (del x) x)) 0)'
+
+        # Act
+        result = self.run(code)
+
+        # Assert
+        assert result == 0
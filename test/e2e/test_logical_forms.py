@@ -0,0 +1,99 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspArityError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestLogicalForms:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('evaluated', [])
+        scope.let('+', lambda a, b: a + b)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(and 1)', True),
+                ('(and 0)', False),
+                ('(and 1 [1] "a")', True),
+                ('(and 1 [] "a")', False),
+                ('(or 0)', 0),
+                ('(or 0 [] "a")', 'a'),
+                ('(or 0 [1] "a")', [1]),
+                ('(or 0 None)', None),
+                ('(or (and 0 1) (+ 1 1))', 2),
+        )
+    )
+    def test_result(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+        assert type(result) is type(expected)
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(and (evaluated::append 1) 0 (evaluated::append 2))', [1]),
+                ('(or (evaluated::append 1) 1 (evaluated::append 2))', [1]),
+                ('(and 1 (evaluated::append 1) (evaluated::append 2))', [1]),
+                ('(or 0 (evaluated::append 1) (evaluated::append 2))', [1, 2]),
+        )
+    )
+    def test_short_circuit(self, code: str, expected: list[int]) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        self.run(code, scope)
+
+        # Assert
+        assert scope.value('evaluated') == expected
+
+    def test_lazy_operands(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let lazy-false (make-lazy (lambda [] 0)))', scope)
+
+        # Act
+        results = [
+            self.run('(and lazy-false 1)', scope),
+            self.run('(or lazy-false 1)', scope),
+            self.run('(or (make-lazy (lambda [] 5)))', scope),
+            self.run('(or 0 lazy-false)', scope),
+        ]
+
+        # Assert
+        assert results == [False, 1, 5, 0]
+
+    @pytest.mark.parametrize('code', ('(and)', '(or)'))
+    def test_no_operands(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run(code, scope)
+        assert isinstance(e.value.cause, SpspArityError)
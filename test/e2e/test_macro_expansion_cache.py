@@ -0,0 +1,68 @@
+import io
+from typing import Any
+
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestMacroExpansionCache:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('expansions', [])
+        return scope
+
+    def test_expanded_once_per_call_site(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        code = '(let m (macro [x] (do (expansions::append x) x)))' \
+               '(let f (lambda [y] (m y)))'
+        self.run(code, scope)
+
+        # Act
+        results = [self.run(f'(f {i})', scope) for i in range(3)]
+
+        # Assert
+        assert results == [0, 1, 2]
+        assert len(scope.value('expansions')) == 1
+
+    def test_expanded_again_when_rebound(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        code = '(let m (macro [x] (do (expansions::append x) x)))' \
+               '(let f (lambda [y] (m y)))'
+        self.run(code, scope)
+        self.run('(f 1)', scope)
+
+        # Act
+        self.run('(let m (macro [x] (expr! [(inline! x)])))', scope)
+        result = self.run('(f 1)', scope)
+
+        # Assert
+        assert result == [1]
+        assert len(scope.value('expansions')) == 1
+
+    def test_uncached_macro(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        code = '(let m (uncached! (macro [] (do (expansions::append 0) (expr! (inline-value! (len expansions)))))))' \
+               '(let f (lambda [] (m)))'
+        self.run(code, scope)
+
+        # Act
+        results = [self.run('(f)', scope) for _ in range(3)]
+
+        # Assert
+        assert results == [1, 2, 3]
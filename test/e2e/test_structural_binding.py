@@ -52,12 +52,12 @@ class TestStructuralBindings:
             scope = Scope.empty()
 
             # Act
-            with pytest.raises(SpspEvaluationError) as evaluation_error:
-                for e in expressions:
-                    evaluate(e, scope)
+            for e in expressions:
+                evaluate(e, scope)
 
             # Assert
-            assert isinstance(evaluation_error.value.cause, TypeError)
+            assert scope.value('x') == 1
+            assert scope.value('y') == 2
 
     def test_bind_attributes(self) -> None:
         # Arrange
@@ -124,3 +124,36 @@ class TestStructuralBindings:
             # Assert
             assert isinstance(evaluation_error.value.cause, SpspInvalidBindingTargetError)
             assert 'structural' in evaluation_error.value.cause.why.lower()
+
+    def test_function_nested_arguments_called_repeatedly(self) -> None:
+        # Arrange
+        code = '(let f (lambda [x [y z] & rest] [x y z rest]))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            f = scope.value('f')
+
+            # Assert
+            assert f(1, [2, 3]) == [1, 2, 3, ()]
+            assert f(4, [5, 6], 7, 8) == [4, 5, 6, (7, 8)]
+
+    def test_function_duplicate_argument_names(self) -> None:
+        # Arrange
+        code = '(let f (lambda [x x] x))' \
+               '(f 1 2)'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            with pytest.raises(SpspEvaluationError) as evaluation_error:
+                for e in expressions:
+                    evaluate(e, scope)
+
+            # Assert
+            assert isinstance(evaluation_error.value.cause, SpspInvalidBindingTargetError)
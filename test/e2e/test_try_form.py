@@ -0,0 +1,138 @@
+import io
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError, SpspValueError, SpspNameError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+
+# noinspection DuplicatedCode
+class TestTryForm:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        scope.let('evaluated', [])
+        scope.let('/', lambda a, b: a / b)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(try 1 (except _ 2))', 1),
+                ('(try (/ 1 0) (except _ 2))', 2),
+                ('(try (/ 1 0) (except e (type e)))', ZeroDivisionError),
+                ('(try (/ 1 0) (except ValueError _ 1) (except ZeroDivisionError _ 2))', 2),
+                ('(try (/ 1 0) (except [ValueError ArithmeticError] _ 1) (except _ 2))', 1),
+                ('(try (/ 1 0) (except ValueError _ 1) (except _ 2))', 2),
+                ('(try (/ 1 0) (except _ 1) (except _ 2))', 1),
+                ('(try 1 (finally 2))', 1),
+                ('(try (/ 1 0) (except _ 2) (finally 3))', 2),
+        )
+    )
+    def test_result(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    def test_unhandled_propagated(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run('(try (/ 1 0) (except ValueError _ 1) (finally (evaluated::append 1)))', scope)
+        assert isinstance(e.value.cause, ZeroDivisionError)
+        assert scope.value('evaluated') == [1]
+
+    def test_finally_evaluated_once(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        self.run('(try (evaluated::append 1) (except _ (evaluated::append 2)) (finally (evaluated::append 3)))', scope)
+        self.run('(try (/ 1 0) (except _ (evaluated::append 2)) (finally (evaluated::append 3)))', scope)
+
+        # Assert
+        assert scope.value('evaluated') == [1, 3, 2, 3]
+
+    def test_evaluation_error_unwrapped(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        scope.let('fail', lambda: self.run('(/ 1 0)', scope))
+
+        # Act
+        result = self.run('(try (fail) (except ZeroDivisionError e (type e)))', scope)
+
+        # Assert
+        assert result is ZeroDivisionError
+
+    def test_local_scopes(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        self.run('(try (do (let x 1) (/ x 0)) (except e (let y 2)) (finally (let z 3)))', scope)
+
+        # Assert
+        for name in ('x', 'y', 'z', 'e'):
+            with pytest.raises(SpspNameError):
+                scope.value(name)
+
+    def test_exception_shadows_argument(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [e x] [(try (/ x 0) (except e (type e))) e]))', scope)
+
+        # Act
+        result = self.run('(f 1 2)', scope)
+
+        # Assert
+        assert result == [ZeroDivisionError, 1]
+
+    def test_closure_in_handler(self) -> None:
+        # Arrange
+        scope = self.make_scope()
+        self.run('(let f (lambda [x] (try (/ x 0) (except e (lambda [] [x (type e)])))))', scope)
+
+        # Act
+        result = self.run('((f 1))', scope)
+
+        # Assert
+        assert result == [1, ZeroDivisionError]
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(try 1 2)',
+                '(try 1 (except))',
+                '(try 1 (except a b c d))',
+                '(try 1 (finally 2) (except _ 3))',
+                '(try 1 (finally))',
+        )
+    )
+    def test_malformed(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError) as e:
+            self.run(code, scope)
+        assert isinstance(e.value.cause, SpspValueError)
@@ -3,7 +3,7 @@ from typing import Any
 
 import pytest
 
-from spsp.errors import SpspEvaluationError
+from spsp.errors import SpspEvaluationError, SpspInvalidBindingError
 from spsp.evaluation import evaluate
 from spsp.parser import parse
 from spsp.scope import Scope
@@ -100,13 +100,45 @@ class TestVariadicBindings:
             expressions = list(parse(Tokenizer(input_stream)))
             scope = Scope.empty()
 
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            # Assert
+            assert scope.value('x') == 1
+            assert list(scope.value('*rest')) == [2, 3]
+
+    def test_bind_to_infinite_iterator(self) -> None:
+        # Arrange
+        code = '(let itertools (import-module \'itertools\'))' \
+               '(let [x y & *rest] (itertools::count))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            # Assert
+            assert scope.value('x') == 0
+            assert scope.value('y') == 1
+            assert next(scope.value('*rest')) == 2
+
+    def test_bind_to_iterator_too_many_values(self) -> None:
+        # Arrange
+        code = '(let [x y] (map int [1 2 3]))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
             # Act
             with pytest.raises(SpspEvaluationError) as evaluation_error:
                 for e in expressions:
                     evaluate(e, scope)
 
             # Assert
-            assert isinstance(evaluation_error.value.cause, TypeError)
+            assert isinstance(evaluation_error.value.cause, SpspInvalidBindingError)
 
     def test_variadic_macro(self) -> None:
         # Arrange
@@ -137,3 +169,56 @@ class TestVariadicBindings:
 
             # Assert
             assert result == (1, 2, 3)
+
+    def test_bind_to_lazy_sequence(self) -> None:
+        # Arrange
+        code = '(let [a b & *rest] (take 5 (lazy-seq (range 10))))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            # Assert
+            assert (scope.value('a'), scope.value('b')) == (0, 1)
+            assert list(scope.value('*rest')) == [2, 3, 4]
+
+    def test_bind_to_lazy_sequence_too_many_values(self) -> None:
+        # Arrange
+        code = '(let [a b] (take 5 (lazy-seq (range 10))))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            with pytest.raises(SpspEvaluationError) as evaluation_error:
+                for e in expressions:
+                    evaluate(e, scope)
+
+            # Assert
+            assert isinstance(evaluation_error.value.cause, SpspInvalidBindingError)
+
+    def test_variadic_function_rest_is_tuple(self) -> None:
+        # Arrange
+        code = '(let f (lambda [x & *rest] *rest))' \
+               '(let g (lambda [x & *rest] (call f *rest)))' \
+               '(let h (lambda [x & *types] (isinstance x *types)))'
+        with io.StringIO(code) as input_stream:
+            expressions = list(parse(Tokenizer(input_stream)))
+            scope = Scope.empty()
+
+            # Act
+            for e in expressions:
+                evaluate(e, scope)
+
+            rest = scope.value('f')(1, 2, 3, 4)
+            nested = scope.value('g')(1, 2, 3, 4)
+
+            # Assert
+            assert type(rest) is tuple and rest == (2, 3, 4)
+            assert type(nested) is tuple and nested == (3, 4)
+            assert '%s-%s' % scope.value('f')(0, 'a', 'b') == 'a-b'
+            assert scope.value('h')(1, int, str)
+            assert scope.value('f')(1) == ()
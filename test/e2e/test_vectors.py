@@ -0,0 +1,75 @@
+import io
+import pathlib
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspEvaluationError
+from spsp.evaluation import evaluate
+from spsp.parser import parse
+from spsp.scope import Scope
+from spsp.tokenizer import Tokenizer
+
+STD_LIB = pathlib.Path(__file__).parent.parent.parent / 'std-lib.spsp'
+
+
+# noinspection DuplicatedCode
+class TestVectors:
+    @staticmethod
+    def run(code: str, scope: Scope) -> Any:
+        with io.StringIO(code) as input_stream:
+            result = None
+            for e in parse(Tokenizer(input_stream)):
+                result = evaluate(e, scope)
+
+            return result
+
+    @staticmethod
+    def make_scope() -> Scope:
+        scope = Scope.empty()
+        with open(STD_LIB, mode='rt', encoding='utf-8') as file:
+            for e in parse(Tokenizer(file)):
+                evaluate(e, scope)
+        return scope
+
+    @pytest.mark.parametrize(
+        'code, expected',
+        (
+                ('(+ (append [] 1) [2])', [1, 2]),
+                ('(+ [0] (append [] 1))', [0, 1]),
+                ('(+ (prepend [2] 1) (append [3] 4))', [1, 2, 3, 4]),
+                ('(+ (rest (vector [0 1])) [2])', [1, 2]),
+                ('(+ (rest [0 1]) [2])', [1, 2]),
+                ('(rest (rest (rest [0 1 2 3])))', [3]),
+                ('(rest (rest []))', []),
+                ('(rest (tuple [0 1]))', (1,)),
+                ("(rest 'abc')", 'bc'),
+                ('(len (append [1 2] 3))', 3),
+                ('(get (prepend [1 2] 0) -1)', 2),
+                ('(list (append [1] 2))', [1, 2]),
+        )
+    )
+    def test_mixed_with_lists(self, code: str, expected: Any) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act
+        result = self.run(code, scope)
+
+        # Assert
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        'code',
+        (
+                '(let v (append [1] 2)) (v::append 3)',
+                '(list::append (append [1] 2) 3)',
+        )
+    )
+    def test_list_methods_fail_on_vectors(self, code: str) -> None:
+        # Arrange
+        scope = self.make_scope()
+
+        # Act & Assert
+        with pytest.raises(SpspEvaluationError):
+            self.run(code, scope)
@@ -0,0 +1,141 @@
+import gc
+import threading
+import time
+import weakref
+from typing import Any
+
+import pytest
+
+from spsp.errors import SpspValueError
+from spsp.lazy import Lazy
+
+
+# noinspection DuplicatedCode
+class TestLazy:
+    def test_evaluated_once(self) -> None:
+        # Arrange
+        evaluated = []
+        lazy = Lazy(lambda: evaluated.append(1) or 42)
+
+        # Act
+        values = [lazy.value, lazy.value]
+
+        # Assert
+        assert values == [42, 42]
+        assert evaluated == [1]
+
+    def test_long_chain(self) -> None:
+        # Arrange
+        lazy = Lazy(lambda: 42)
+        for _ in range(100_000):
+            lazy = Lazy(lambda _lazy=lazy: _lazy)
+
+        # Act
+        value = lazy.value
+
+        # Assert
+        assert value == 42
+
+    def test_chain_compressed(self) -> None:
+        # Arrange
+        last = Lazy(lambda: 42)
+        middle = Lazy(lambda: last)
+        first = Lazy(lambda: middle)
+
+        # Act
+        first.value
+
+        # Assert
+        assert first._value == middle._value == last._value == 42
+
+    def test_evaluated_once_across_threads(self) -> None:
+        # Arrange
+        evaluated = []
+
+        def body() -> Any:
+            evaluated.append(1)
+            time.sleep(0.01)
+            return 42
+
+        lazy = Lazy(body)
+        results = []
+        barrier = threading.Barrier(8)
+
+        def force() -> None:
+            barrier.wait()
+            results.append(lazy.value)
+
+        threads = [threading.Thread(target=force) for _ in range(8)]
+
+        # Act
+        for it in threads:
+            it.start()
+        for it in threads:
+            it.join()
+
+        # Assert
+        assert results == [42] * 8
+        assert evaluated == [1]
+
+    def test_body_released(self) -> None:
+        # Arrange
+        class Captured:
+            pass
+
+        captured = Captured()
+        reference = weakref.ref(captured)
+        lazy = Lazy(lambda _captured=captured: 42)
+        del captured
+
+        # Act
+        lazy.value
+        gc.collect()
+
+        # Assert
+        assert reference() is None
+
+    def test_evaluated_again_after_error(self) -> None:
+        # Arrange
+        attempts = []
+
+        def body() -> Any:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ValueError()
+            return 42
+
+        lazy = Lazy(body)
+
+        # Act
+        with pytest.raises(ValueError):
+            lazy.value
+        value = lazy.value
+
+        # Assert
+        assert value == 42
+        assert attempts == [1, 1]
+
+    def test_self_dependency(self) -> None:
+        # Arrange
+        lazy = Lazy(lambda: lazy.value)
+
+        # Act & Assert
+        with pytest.raises(SpspValueError):
+            lazy.value
+
+    def test_cycle(self) -> None:
+        # Arrange
+        first = Lazy(lambda: second)
+        second = Lazy(lambda: first)
+
+        # Act & Assert
+        with pytest.raises(SpspValueError):
+            first.value
+
+    def test_slots(self) -> None:
+        # Arrange
+        lazy = Lazy(lambda: 42)
+
+        # Act & Assert
+        with pytest.raises(AttributeError):
+            lazy.other = 1
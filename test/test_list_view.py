@@ -0,0 +1,89 @@
+from typing import Any
+
+import pytest
+
+from spsp.list_view import ListView
+
+
+# noinspection DuplicatedCode
+class TestListView:
+    def test_rest(self) -> None:
+        # Arrange
+        items = list(range(5))
+
+        # Act
+        view = ListView(items, 1)
+
+        # Assert
+        assert view == [1, 2, 3, 4]
+        assert view.rest().rest() == [3, 4]
+        assert ListView([]).rest() == []
+        assert view.rest()._items is items
+
+    def test_same_as_list(self) -> None:
+        # Arrange
+        items = list(range(10))
+        view = ListView(items, 3)
+        expected = items[3:]
+
+        # Act & Assert
+        assert len(view) == len(expected)
+        assert list(view) == expected
+        assert [view[i] for i in range(-7, 7)] == [expected[i] for i in range(-7, 7)]
+        assert view[2:] == expected[2:]
+        assert view[1:5:2] == expected[1:5:2]
+        assert view[::-1] == expected[::-1]
+
+    def test_changes_show_through(self) -> None:
+        # Arrange
+        items = [0, 1, 2]
+        view = ListView(items, 1)
+
+        # Act
+        items.append(3)
+        items[1] = 'a'
+
+        # Assert
+        assert view == ['a', 2, 3]
+
+    def test_shrunk_list(self) -> None:
+        # Arrange
+        items = [0, 1, 2]
+        view = ListView(items, 2)
+
+        # Act
+        items.clear()
+
+        # Assert
+        assert len(view) == 0
+        assert list(view) == []
+        with pytest.raises(IndexError):
+            _ = view[0]
+
+    @pytest.mark.parametrize(
+        'left, right, expected',
+        (
+                (ListView([0, 1, 2], 1), [3], [1, 2, 3]),
+                ([0], ListView([0, 1, 2], 1), [0, 1, 2]),
+                (ListView([0, 1], 1), ListView([0, 2], 1), [1, 2]),
+        )
+    )
+    def test_concatenate(self, left: Any, right: Any, expected: list[Any]) -> None:
+        # Act
+        result = left + right
+
+        # Assert
+        assert type(result) is list
+        assert result == expected
+
+    @pytest.mark.parametrize(
+        'items, start, error',
+        (
+                ((0, 1), 1, TypeError),
+                ([0, 1], -1, ValueError),
+        )
+    )
+    def test_invalid(self, items: Any, start: int, error: type[Exception]) -> None:
+        # Act & Assert
+        with pytest.raises(error):
+            ListView(items, start)
@@ -0,0 +1,192 @@
+import random
+import threading
+from typing import Any
+
+import pytest
+
+from spsp.persistent_vector import PersistentVector
+
+
+# noinspection DuplicatedCode
+class TestPersistentVector:
+    @pytest.mark.parametrize(
+        'n',
+        (
+                0, 1, 31, 32, 33, 1024, 1025, 32 ** 3 + 1
+        )
+    )
+    def test_construct(self, n: int) -> None:
+        # Arrange
+        items = list(range(n))
+
+        # Act
+        vector = PersistentVector(items)
+
+        # Assert
+        assert len(vector) == n
+        assert list(vector) == items
+        assert all(vector[i] == i for i in range(0, n, 7))
+
+    @pytest.mark.parametrize(
+        'n',
+        (
+                0, 1, 32, 33, 1025, 32 ** 3 + 1
+        )
+    )
+    def test_conj(self, n: int) -> None:
+        # Arrange
+        vector = PersistentVector()
+
+        # Act
+        for i in range(n):
+            vector = vector.conj(i)
+
+        # Assert
+        assert list(vector) == list(range(n))
+        assert all(vector[i] == i for i in range(0, n, 7))
+
+    def test_cons_and_rest(self) -> None:
+        # Arrange
+        vector = PersistentVector([3, 4])
+
+        # Act
+        vector = vector.cons(2).cons(1).cons(0)
+
+        # Assert
+        assert vector == [0, 1, 2, 3, 4]
+        assert vector.rest() == [1, 2, 3, 4]
+        assert vector.rest().rest().rest().rest() == [4]
+        assert PersistentVector().rest() == []
+
+    def test_original_unchanged(self) -> None:
+        # Arrange
+        vector = PersistentVector(range(40))
+
+        # Act
+        appended = [vector.conj('a'), vector.conj('b')]
+        prepended = [vector.cons('a'), vector.cons('b')]
+
+        # Assert
+        assert list(vector) == list(range(40))
+        assert [it[-1] for it in appended] == ['a', 'b']
+        assert [it[0] for it in prepended] == ['a', 'b']
+        assert all(len(it) == 41 for it in appended + prepended)
+
+    def test_same_as_list(self) -> None:
+        # Arrange
+        rng = random.Random(42)
+        versions = [(PersistentVector(), [])]
+
+        # Act
+        for _ in range(5000):
+            vector, items = rng.choice(versions[-20:])
+            operation, item = rng.random(), rng.random()
+            if operation < 0.5:
+                versions.append((vector.conj(item), items + [item]))
+            elif operation < 0.75:
+                versions.append((vector.cons(item), [item] + items))
+            else:
+                versions.append((vector.rest(), items[1:]))
+
+        # Assert
+        for vector, items in versions:
+            assert list(vector) == items
+            assert [vector[i] for i in range(len(items))] == items
+            assert [vector[i - len(items)] for i in range(len(items))] == items
+
+    @pytest.mark.parametrize(
+        'index',
+        (
+                slice(1, None),
+                slice(3, None),
+                slice(None, 2),
+                slice(None, None, 2),
+                slice(None, None, -1),
+                slice(100, None),
+        )
+    )
+    def test_slice(self, index: slice) -> None:
+        # Arrange
+        items = list(range(50))
+        vector = PersistentVector(items)
+
+        # Act
+        result = vector[index]
+
+        # Assert
+        assert isinstance(result, PersistentVector)
+        assert result == items[index]
+
+    @pytest.mark.parametrize(
+        'index',
+        (
+                2, -3
+        )
+    )
+    def test_index_out_of_range(self, index: int) -> None:
+        # Arrange
+        vector = PersistentVector([1, 2])
+
+        # Act & Assert
+        with pytest.raises(IndexError):
+            vector[index]
+
+    def test_conj_across_threads(self) -> None:
+        # Arrange
+        vector = PersistentVector(range(10))
+        results = []
+        barrier = threading.Barrier(8)
+
+        def conj(i: int) -> None:
+            barrier.wait()
+            results.append((i, vector.conj(i)))
+
+        threads = [threading.Thread(target=conj, args=(i,)) for i in range(8)]
+
+        # Act
+        for it in threads:
+            it.start()
+        for it in threads:
+            it.join()
+
+        # Assert
+        assert all(result == list(range(10)) + [i] for i, result in results)
+
+    @pytest.mark.parametrize(
+        'left, right',
+        (
+                (PersistentVector([1, 2]), [3, 4]),
+                ([1, 2], PersistentVector([3, 4])),
+                (PersistentVector([1, 2]), PersistentVector([3, 4])),
+                (PersistentVector(range(1, 3)).cons(0).rest(), PersistentVector(range(3, 40)).rest().cons(3)),
+        )
+    )
+    def test_concatenate(self, left: PersistentVector | list, right: PersistentVector | list) -> None:
+        # Arrange
+        expected = list(left) + list(right)
+
+        # Act
+        result = left + right
+
+        # Assert
+        assert isinstance(result, PersistentVector)
+        assert result == expected
+        assert list(left) + list(right) == expected
+
+    @pytest.mark.parametrize(
+        'other',
+        (
+                (1, 2),
+                'ab',
+                1,
+        )
+    )
+    def test_concatenate_unsupported(self, other: Any) -> None:
+        # Arrange
+        vector = PersistentVector([1, 2])
+
+        # Act & Assert
+        with pytest.raises(TypeError):
+            vector + other
+        with pytest.raises(TypeError):
+            other + vector
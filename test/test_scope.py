@@ -1,3 +1,4 @@
+import gc
 from unittest.mock import patch
 
 import pytest
@@ -225,3 +226,63 @@ class TestScope:
         # Assert
         assert module == types
         importlib_import_module.assert_not_called()
+
+    def test_import_module_imported_in_derived(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        derived_scope = scope.derive()
+        module_name = 'types'
+        derived_scope.import_module(module_name)
+
+        import types
+        import importlib
+
+        # Act
+        with patch.object(importlib, 'import_module') as importlib_import_module:
+            module = scope.import_module(module_name)
+
+        # Assert
+        assert module == types
+        importlib_import_module.assert_not_called()
+
+    def test_let_predefined_in_derived(self) -> None:
+        # Arrange
+        scope = Scope.empty()
+        derived_scope = scope.derive()
+        name = 'import-module'
+
+        # Act & Assert
+        with pytest.raises(SpspInvalidBindingTargetError):
+            derived_scope.let(name, 42)
+
+    def test_scopes_collected(self) -> None:
+        # Arrange
+        def count_scopes() -> int:
+            gc.collect()
+            return sum(1 for it in gc.get_objects() if isinstance(it, Scope))
+
+        before = count_scopes()
+
+        # Act
+        for _ in range(10):
+            scope = Scope.empty()
+            scope.let('x', object())
+            scope.derive().value('len')
+
+        del scope
+        after = count_scopes()
+
+        # Assert
+        assert after == before
+
+    def test_bound_locally_in_other_root(self) -> None:
+        # Arrange
+        first, second = Scope.empty(), Scope.empty()
+
+        # Act
+        first.derive().let('x', 42)
+
+        # Assert
+        assert not first.is_global('x')
+        assert second.is_global('x')
+        assert first.globals_version() != second.globals_version()